@@ -74,6 +74,13 @@ setup(
         'zeroconf>=0.132.2'
     ],
 
+    # set optional dependencies requirements.
+    extras_require={
+        'async': [
+            'aiohttp>=3.9.0',
+        ],
+    },
+
     # set keywords to associate this package with on Pypi.org.
     keywords=['spotify', 'spotifywebapi', 'api', 'audio', 'music', 'library'],
     
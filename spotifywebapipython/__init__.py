@@ -10,13 +10,23 @@ _________________
 </details>
 """
 
+# external package imports.
+import importlib.util
+
 # our package imports.
 from spotifywebapipython.spotifyapierror import SpotifyApiError
 from spotifywebapipython.spotifyapimessage import SpotifyApiMessage
 from spotifywebapipython.spotifyauthtoken import SpotifyAuthToken
 from spotifywebapipython.spotifyclient import SpotifyClient
 from spotifywebapipython.spotifydiscovery import SpotifyDiscovery
+from spotifywebapipython.spotifyitemfilter import SpotifyItemFilter
+from spotifywebapipython.spotifylibrarysync import SpotifyLibrarySync
 from spotifywebapipython.spotifymediatypes import SpotifyMediaTypes
+from spotifywebapipython.spotifyplayerstateeventargs import SpotifyPlayerStateEventArgs
+from spotifywebapipython.spotifyplayerstatewatcher import SpotifyPlayerStateWatcher
+from spotifywebapipython.spotifyplaylistcache import SpotifyPlaylistCache
+from spotifywebapipython.spotifyratelimiter import SpotifyRateLimiter
+from spotifywebapipython.spotifyresponsecache import SpotifyResponseCache
 from spotifywebapipython.spotifytypeprefixes import SpotifyTypePrefixes
 from spotifywebapipython.spotifywebapiauthenticationerror import SpotifyWebApiAuthenticationError
 from spotifywebapipython.spotifywebapierror import SpotifyWebApiError
@@ -29,9 +39,27 @@ __all__ = [
     'SpotifyAuthToken',
     'SpotifyClient',
     'SpotifyDiscovery',
+    'SpotifyItemFilter',
+    'SpotifyLibrarySync',
     'SpotifyMediaTypes',
+    'SpotifyPlayerStateEventArgs',
+    'SpotifyPlayerStateWatcher',
+    'SpotifyPlaylistCache',
+    'SpotifyRateLimiter',
+    'SpotifyResponseCache',
     'SpotifyTypePrefixes',
     'SpotifyWebApiAuthenticationError',
     'SpotifyWebApiError',
     'GetUnixTimestampMSFromUtcNow'
 ]
+
+# the async client requires the optional `aiohttp` package (e.g. `pip install spotifywebapipython[async]`),
+# so it is only imported when it is first referenced.
+if importlib.util.find_spec('aiohttp') is not None:
+    __all__.append('AsyncSpotifyClient')
+
+def __getattr__(name:str):
+    if name == 'AsyncSpotifyClient':
+        from spotifywebapipython.spotifyasyncclient import AsyncSpotifyClient
+        return AsyncSpotifyClient
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
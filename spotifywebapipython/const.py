@@ -4,7 +4,7 @@
 # constants are placed in this file if they are used across multiple files.
 # the only exception to this is for the VERSION constant, which is placed here for convenience.
 
-VERSION:str = "1.0.290"
+VERSION:str = "1.0.315"
 """ 
 Current version of the Spotify Client Python3 Library. 
 """
@@ -52,6 +52,12 @@ UserProfile.Country value is not set (e.g. public access token in effect.
 Default value is "US".
 """
 
+SPOTIFY_PLAYLIST_ITEMS_MAX:int = 100
+"""
+Maximum number of items that can be added, removed, or replaced in a playlist with one
+Spotify Web API request (e.g. `100`).
+"""
+
 SPOTIFY_DESKTOP_APP_CLIENT_DISPLAY_NAME:str = 'Spotify Desktop App Client (%s)'
 """
 Spotify Desktop Application client display name (e.g. `Spotify Desktop App Client (%s)`).
@@ -72,6 +78,16 @@ SPOTIFYWEBAPIPYTHON_CONFIG_FILE:str = 'SpotifyWebApiPython_config.json'
 Filename and extension of the configuration data file (`SpotifyWebApiPython_config.json`).
 """
 
+SPOTIFYWEBAPIPYTHON_LIBRARY_FILE:str = 'SpotifyWebApiPython_library.db'
+"""
+Filename and extension of the library sync database file (`SpotifyWebApiPython_library.db`).
+"""
+
+SPOTIFYWEBAPIPYTHON_PLAYLIST_CACHE_FILE:str = 'SpotifyWebApiPython_playlists.db'
+"""
+Filename and extension of the playlist cache database file (`SpotifyWebApiPython_playlists.db`).
+"""
+
 TRACE_METHOD_RESULT = "%s result"
 """ 
 %s result
@@ -26,6 +26,7 @@ from .followers import Followers
 from .imageobject import ImageObject
 from .imagepalettecolors import ImagePaletteColors
 from .imagevibrantcolors import ImageVibrantColors
+from .lazyloading import LazyLoading
 from .linkedfrom import LinkedFrom
 from .narrator import Narrator
 from .owner import Owner
@@ -88,6 +89,7 @@ __all__ = [
     'ImageObject',
     'ImagePaletteColors',
     'ImageVibrantColors',
+    'LazyLoading',
     'LinkedFrom',
     'Narrator',
     'Owner',
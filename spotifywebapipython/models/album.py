@@ -2,6 +2,7 @@
 
 # our package imports.
 from ..sautils import export
+from .lazyloading import LazyLoading
 from .albumsimplified import AlbumSimplified
 from .copyright import Copyright
 from .externalids import ExternalIds
@@ -14,6 +15,16 @@ class Album(AlbumSimplified):
     Spotify Web API Album object.
     """
 
+    __slots__ = (
+        '_Copyrights',
+        '_ExternalIds',
+        '_Genres',
+        '_Label',
+        '_Popularity',
+        '_Tracks',
+        '__LazyRoot',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -33,6 +44,7 @@ class Album(AlbumSimplified):
         self._Label:str = None
         self._Popularity:int = None
         self._Tracks:TrackPageSimplified = None
+        self.__LazyRoot:dict = None
         
         if (root is None):
 
@@ -43,24 +55,11 @@ class Album(AlbumSimplified):
             self._Label = root.get('label', None)
             self._Popularity = root.get('popularity', None)
 
-            # process all collections and objects.
-            items:list = root.get('copyrights',None)
-            if items is not None:
-                for item in items:
-                    self._Copyrights.append(Copyright(root=item))
-
-            item:dict = root.get('external_ids',None)
-            if item is not None:
-                self._ExternalIds = ExternalIds(root=item)
-
-            items:list[str] = root.get('genres',None)
-            if items is not None:
-                for item in items:
-                    self._Genres.append(item)
-        
-            item:dict = root.get('tracks',None)
-            if item is not None:
-                self._Tracks = TrackPageSimplified(root=item)
+            # process all collections and objects (on first access if lazy loading is enabled).
+            if LazyLoading.IsEnabled():
+                self.__LazyRoot = root
+            else:
+                self.__LoadChildren(root)
 
         
     def __repr__(self) -> str:
@@ -71,11 +70,45 @@ class Album(AlbumSimplified):
         return self.ToString()
 
 
+    def __LoadChildren(self, root:dict) -> None:
+        """
+        Loads child collections and objects from the Spotify Web API response dictionary.
+        """
+        items:list = root.get('copyrights',None)
+        if items is not None:
+            for item in items:
+                self._Copyrights.append(Copyright(root=item))
+
+        item:dict = root.get('external_ids',None)
+        if item is not None:
+            self._ExternalIds = ExternalIds(root=item)
+
+        items:list[str] = root.get('genres',None)
+        if items is not None:
+            for item in items:
+                self._Genres.append(item)
+    
+        item:dict = root.get('tracks',None)
+        if item is not None:
+            self._Tracks = TrackPageSimplified(root=item)
+
+
+    def __Hydrate(self) -> None:
+        """
+        Loads child collections and objects, if they were deferred by lazy loading.
+        """
+        if self.__LazyRoot is not None:
+            root:dict = self.__LazyRoot
+            self.__LazyRoot = None
+            self.__LoadChildren(root)
+
+
     @property
     def Copyrights(self) -> list[Copyright]:
         """ 
         The copyright statements of the album.
         """
+        self.__Hydrate()
         return self._Copyrights
     
 
@@ -84,6 +117,7 @@ class Album(AlbumSimplified):
         """ 
         Known external IDs for the album.
         """
+        self.__Hydrate()
         return self._ExternalIds
     
 
@@ -94,6 +128,7 @@ class Album(AlbumSimplified):
         
         Example: `["Egg punk","Noise rock"]`
         """
+        self.__Hydrate()
         return self._Genres
 
 
@@ -122,6 +157,7 @@ class Album(AlbumSimplified):
         
         This is a `TrackPageSimplified` object, meaning only 50 tracks max are listed per request.
         """
+        self.__Hydrate()
         return self._Tracks
 
 
@@ -129,6 +165,7 @@ class Album(AlbumSimplified):
         """
         Returns a dictionary representation of the class.
         """
+        self.__Hydrate()
         # get base class result.
         resultBase:dict = super().ToDictionary()
 
@@ -161,6 +198,7 @@ class Album(AlbumSimplified):
         """
         Returns a displayable string representation of the class.
         """
+        self.__Hydrate()
         msg:str = 'Album: %s' % super().ToString(False)
         #if self._Copyrights is not None: msg = '%s\n %s' % (msg, str(self._Copyrights))
         #if self._ExternalIds is not None: msg = '%s\n %s' % (msg, str(self._ExternalIds))
@@ -2,6 +2,7 @@
 
 # our package imports.
 from ..sautils import export
+from .lazyloading import LazyLoading
 from .artistsimplified import ArtistSimplified
 from .externalurls import ExternalUrls
 from .imageobject import ImageObject
@@ -13,6 +14,24 @@ class AlbumSimplified:
     Spotify Web API Simplified Album object.
     """
 
+    __slots__ = (
+        '_AlbumType',
+        '_Artists',
+        '_AvailableMarkets',
+        '_ExternalUrls',
+        '_Href',
+        '_Id',
+        '_Images',
+        '_Name',
+        '_ReleaseDate',
+        '_ReleaseDatePrecision',
+        '_Restrictions',
+        '_TotalTracks',
+        '_Type',
+        '_Uri',
+        '__LazyRoot',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -36,6 +55,7 @@ class AlbumSimplified:
         self._TotalTracks:int = None
         self._Type:str = None
         self._Uri:str = None
+        self.__LazyRoot:dict = None
         
         if (root is None):
 
@@ -54,24 +74,11 @@ class AlbumSimplified:
             self._Type = root.get('type', None)
             self._Uri = root.get('uri', None)
 
-            # process all collections and objects.
-            items:list = root.get('artists',None)
-            if items is not None:
-                for item in items:
-                    self._Artists.append(ArtistSimplified(root=item))
-
-            item:dict = root.get('external_urls',None)
-            if item is not None:
-                self._ExternalUrls = ExternalUrls(root=item)
-
-            items:list = root.get('images',None)
-            if items is not None:
-                for item in items:
-                    self._Images.append(ImageObject(root=item))
-
-            item:dict = root.get('restrictions',None)
-            if item is not None:
-                self._Restrictions = Restrictions(root=item)
+            # process all collections and objects (on first access if lazy loading is enabled).
+            if LazyLoading.IsEnabled():
+                self.__LazyRoot = root
+            else:
+                self.__LoadChildren(root)
 
         
     def __repr__(self) -> str:
@@ -82,6 +89,39 @@ class AlbumSimplified:
         return self.ToString()
 
 
+    def __LoadChildren(self, root:dict) -> None:
+        """
+        Loads child collections and objects from the Spotify Web API response dictionary.
+        """
+        items:list = root.get('artists',None)
+        if items is not None:
+            for item in items:
+                self._Artists.append(ArtistSimplified(root=item))
+
+        item:dict = root.get('external_urls',None)
+        if item is not None:
+            self._ExternalUrls = ExternalUrls(root=item)
+
+        items:list = root.get('images',None)
+        if items is not None:
+            for item in items:
+                self._Images.append(ImageObject(root=item))
+
+        item:dict = root.get('restrictions',None)
+        if item is not None:
+            self._Restrictions = Restrictions(root=item)
+
+
+    def __Hydrate(self) -> None:
+        """
+        Loads child collections and objects, if they were deferred by lazy loading.
+        """
+        if self.__LazyRoot is not None:
+            root:dict = self.__LazyRoot
+            self.__LazyRoot = None
+            self.__LoadChildren(root)
+
+
     # implement sorting support.
     def __eq__(self, other):
         try:
@@ -119,6 +159,7 @@ class AlbumSimplified:
         
         Each artist object includes a link in href to more detailed information about the artist.
         """
+        self.__Hydrate()
         return self._Artists
 
 
@@ -139,6 +180,7 @@ class AlbumSimplified:
         """ 
         Known external URLs for the album.
         """
+        self.__Hydrate()
         return self._ExternalUrls
     
 
@@ -165,6 +207,7 @@ class AlbumSimplified:
         """ 
         The cover art for the album in various sizes, widest first.
         """
+        self.__Hydrate()
         return self._Images
 
 
@@ -174,6 +217,7 @@ class AlbumSimplified:
         Returns the highest resolution order image from the `Images` list, if images 
         are defined; otherwise, null.
         """
+        self.__Hydrate()
         return ImageObject.GetImageHighestResolution(self._Images)
             
         
@@ -213,6 +257,7 @@ class AlbumSimplified:
         """ 
         Included in the response when a content restriction is applied.
         """
+        self.__Hydrate()
         return self._Restrictions
 
 
@@ -246,6 +291,7 @@ class AlbumSimplified:
         """
         Returns a dictionary representation of the class.
         """
+        self.__Hydrate()
         externalUrls:dict = {}
         if self._ExternalUrls is not None:
             externalUrls = self._ExternalUrls.ToDictionary()
@@ -283,6 +329,7 @@ class AlbumSimplified:
             includeTitle (str):
                 True to include the class name title prefix.
         """
+        self.__Hydrate()
         msg:str = ''
         if includeTitle: 
             msg = 'AlbumSimplified:'
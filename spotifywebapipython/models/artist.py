@@ -12,6 +12,13 @@ class Artist(ArtistSimplified):
     Spotify Web API Artist object.
     """
 
+    __slots__ = (
+        '_Followers',
+        '_Genres',
+        '_Images',
+        '_Popularity',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
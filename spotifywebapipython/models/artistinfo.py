@@ -11,6 +11,24 @@ class ArtistInfo:
     Artist Information About object.
     """
 
+    __slots__ = (
+        '_AboutUrlFacebook',
+        '_AboutUrlInstagram',
+        '_AboutUrlTwitter',
+        '_AboutUrlWikipedia',
+        '_Bio',
+        '_BioHtml',
+        '_ExternalUrls',
+        '_Id',
+        '_ImageUrl',
+        '_ImageUrlDefault',
+        '_MonthlyListeners',
+        '_Name',
+        '_TourEvents',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(
         self, 
         id:str, 
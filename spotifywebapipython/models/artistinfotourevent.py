@@ -10,6 +10,13 @@ class ArtistInfoTourEvent:
     Artist Information Tour object.
     """
 
+    __slots__ = (
+        '_EventDateTime',
+        '_Href',
+        '_Title',
+        '_VenueName',
+    )
+
     def __init__(self) -> None:
         """
         Initializes a new instance of the class.
@@ -13,6 +13,8 @@ class ArtistPage(PageObject):
     This allows for multiple pages of `Artist` objects to be navigated.
     """
 
+    __slots__ = ()
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
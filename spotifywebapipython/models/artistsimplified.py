@@ -2,6 +2,7 @@
 
 # our package imports.
 from ..sautils import export
+from .lazyloading import LazyLoading
 from .externalurls import ExternalUrls
 
 @export
@@ -10,6 +11,16 @@ class ArtistSimplified:
     Spotify Web API SimplifiedArtist object.
     """
 
+    __slots__ = (
+        '_ExternalUrls',
+        '_Href',
+        '_Id',
+        '_Name',
+        '_Type',
+        '_Uri',
+        '__LazyRoot',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -25,6 +36,7 @@ class ArtistSimplified:
         self._Name:str = None
         self._Type:str = None
         self._Uri:str = None
+        self.__LazyRoot:dict = None
         
         if (root is None):
 
@@ -38,10 +50,11 @@ class ArtistSimplified:
             self._Type = root.get('type', None)
             self._Uri = root.get('uri', None)
 
-            # process all collections and objects.
-            item:dict = root.get('external_urls',None)
-            if item is not None:
-                self._ExternalUrls = ExternalUrls(root=item)
+            # process all collections and objects (on first access if lazy loading is enabled).
+            if LazyLoading.IsEnabled():
+                self.__LazyRoot = root
+            else:
+                self.__LoadChildren(root)
 
         
     def __repr__(self) -> str:
@@ -52,6 +65,25 @@ class ArtistSimplified:
         return self.ToString()
 
 
+    def __LoadChildren(self, root:dict) -> None:
+        """
+        Loads child collections and objects from the Spotify Web API response dictionary.
+        """
+        item:dict = root.get('external_urls',None)
+        if item is not None:
+            self._ExternalUrls = ExternalUrls(root=item)
+
+
+    def __Hydrate(self) -> None:
+        """
+        Loads child collections and objects, if they were deferred by lazy loading.
+        """
+        if self.__LazyRoot is not None:
+            root:dict = self.__LazyRoot
+            self.__LazyRoot = None
+            self.__LoadChildren(root)
+
+
     # implement sorting support.
     def __eq__(self, other):
         try:
@@ -75,6 +107,7 @@ class ArtistSimplified:
         """ 
         Known external URLs for this artist.
         """
+        self.__Hydrate()
         return self._ExternalUrls
     
 
@@ -126,6 +159,7 @@ class ArtistSimplified:
         """
         Returns a dictionary representation of the class.
         """
+        self.__Hydrate()
         externalUrls:dict = {}
         if self._ExternalUrls is not None:
             externalUrls = self._ExternalUrls.ToDictionary()
@@ -150,6 +184,7 @@ class ArtistSimplified:
             includeTitle (str):
                 True to include the class name title prefix.
         """
+        self.__Hydrate()
         msg:str = ''
         if includeTitle: 
             msg = 'Artist:'
@@ -11,6 +11,10 @@ class Audiobook(AudiobookSimplified):
     Spotify Web API Audiobook object.
     """
 
+    __slots__ = (
+        '_Chapters',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
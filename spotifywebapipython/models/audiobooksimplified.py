@@ -14,6 +14,28 @@ class AudiobookSimplified:
     Spotify Web API Simplified Audiobook object.
     """
 
+    __slots__ = (
+        '_Authors',
+        '_AvailableMarkets',
+        '_Copyrights',
+        '_Description',
+        '_Edition',
+        '_Explicit',
+        '_ExternalUrls',
+        '_Href',
+        '_HtmlDescription',
+        '_Id',
+        '_Images',
+        '_Languages',
+        '_MediaType',
+        '_Name',
+        '_Narrators',
+        '_Publisher',
+        '_TotalChapters',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
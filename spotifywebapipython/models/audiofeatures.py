@@ -9,6 +9,27 @@ class AudioFeatures:
     Spotify Web API AudioFeatures object.
     """
 
+    __slots__ = (
+        '_Acousticness',
+        '_AnalysisUrl',
+        '_Danceability',
+        '_DurationMS',
+        '_Energy',
+        '_Id',
+        '_Instrumentalness',
+        '_Key',
+        '_Liveness',
+        '_Loudness',
+        '_Mode',
+        '_Speechiness',
+        '_Tempo',
+        '_TimeSignature',
+        '_TrackHref',
+        '_Type',
+        '_Uri',
+        '_Valence',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
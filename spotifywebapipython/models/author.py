@@ -11,6 +11,10 @@ class Author:
     Contains information about content authors.
     """
 
+    __slots__ = (
+        '_Name',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -10,6 +10,13 @@ class Category:
     Spotify Web API Category object.
     """
 
+    __slots__ = (
+        '_Href',
+        '_Id',
+        '_Icons',
+        '_Name',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -11,6 +11,10 @@ class Chapter(ChapterSimplified):
     Spotify Web API Chapter object.
     """
 
+    __slots__ = (
+        '_Audiobook',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
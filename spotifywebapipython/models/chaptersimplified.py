@@ -13,6 +13,29 @@ class ChapterSimplified:
     Spotify Web API Simplified Chapter object.
     """
 
+    __slots__ = (
+        '_AudioPreviewUrl',
+        '_AvailableMarkets',
+        '_ChapterNumber',
+        '_Description',
+        '_DurationMS',
+        '_Explicit',
+        '_ExternalUrls',
+        '_Href',
+        '_HtmlDescription',
+        '_Id',
+        '_Images',
+        '_IsPlayable',
+        '_Languages',
+        '_Name',
+        '_ReleaseDate',
+        '_ReleaseDatePrecision',
+        '_Restrictions',
+        '_ResumePoint',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
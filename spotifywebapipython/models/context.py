@@ -10,6 +10,13 @@ class Context:
     Spotify Web API Context object.
     """
 
+    __slots__ = (
+        '_ExternalUrls',
+        '_Href',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -11,6 +11,11 @@ class Copyright:
     Contains information about content copyrights.
     """
 
+    __slots__ = (
+        '_Text',
+        '_Type',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -9,6 +9,17 @@ class Device:
     Spotify Web API Device object.
     """
 
+    __slots__ = (
+        '_Id',
+        '_IsActive',
+        '_IsPrivateSession',
+        '_IsRestricted',
+        '_Name',
+        '_SupportsVolume',
+        '_Type',
+        '_VolumePercent',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -11,6 +11,10 @@ class Episode(EpisodeSimplified):
     Spotify Web API Episode object.
     """
 
+    __slots__ = (
+        '_Show',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
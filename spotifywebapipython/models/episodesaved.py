@@ -10,6 +10,11 @@ class EpisodeSaved:
     Spotify Web API SavedEpisode object.
     """
 
+    __slots__ = (
+        '_Episode',
+        '_AddedAt',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
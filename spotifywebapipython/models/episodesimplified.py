@@ -13,6 +13,28 @@ class EpisodeSimplified:
     Spotify Web API Simplified Episode object.
     """
 
+    __slots__ = (
+        '_AudioPreviewUrl',
+        '_Description',
+        '_DurationMS',
+        '_Explicit',
+        '_ExternalUrls',
+        '_Href',
+        '_HtmlDescription',
+        '_Id',
+        '_Images',
+        '_IsExternallyHosted',
+        '_IsPlayable',
+        '_Languages',
+        '_Name',
+        '_ReleaseDate',
+        '_ReleaseDatePrecision',
+        '_Restrictions',
+        '_ResumePoint',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -11,6 +11,11 @@ class ExplicitContent:
     Contains information about explicit content settings.
     """
 
+    __slots__ = (
+        '_FilterEnabled',
+        '_FilterLocked',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -11,6 +11,12 @@ class ExternalIds:
     Contains known external ID's for various object types: artist, track, etc.
     """
 
+    __slots__ = (
+        '_Ean',
+        '_Isrc',
+        '_Upc',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -11,6 +11,13 @@ class ExternalUrls:
     Contains known external URLs for various object types: artist, track, etc.
     """
 
+    __slots__ = (
+        '_Ean',
+        '_Isrc',
+        '_Spotify',
+        '_Upc',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
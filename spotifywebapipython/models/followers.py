@@ -11,6 +11,11 @@ class Followers:
     Contains information about the followers of an artist.
     """
 
+    __slots__ = (
+        '_Href',
+        '_Total',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
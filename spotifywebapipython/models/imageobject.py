@@ -9,6 +9,12 @@ class ImageObject:
     Spotify Web API Image object.
     """
 
+    __slots__ = (
+        '_Height',
+        '_Url',
+        '_Width',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -167,7 +173,53 @@ class ImageObject:
                     resultWidth = imageWidth
         
         return resultWidth
-    
+
+
+    @staticmethod
+    def GetImageSmallestResolution(
+            images:list,
+            minimumWidth:int=None,
+            ) -> str:
+        """
+        Returns the smallest resolution image from a list of `ImageObject` items that is at
+        least the specified width.
+
+        Args:
+            images (list[ImageObject]):
+                The cover art for the media in various sizes, usually widest first.
+            minimumWidth (int):
+                The minimum resolution width of the image to return; if no image is at least
+                this wide, then the highest resolution is returned.
+                If null, then the smallest resolution is returned.
+
+        Returns:
+            The smallest adequate resolution image from the list of `images`.
+
+        Images without a width value are only returned if no other image is adequate.
+        """
+        result:str = None
+        resultWidth:int = 0
+
+        if (images is not None) and (len(images) > 0):
+
+            # search for the narrowest image that is at least the minimum width.
+            image: ImageObject
+            for image in images:
+
+                imageWidth:int = image.Width
+                if (imageWidth is None) or ((minimumWidth is not None) and (imageWidth < minimumWidth)):
+                    continue
+
+                if (result is None) or (imageWidth < resultWidth):
+                    result = image.Url
+                    resultWidth = imageWidth
+
+            # if nothing was adequate, then return the highest resolution image.
+            if (result is None):
+                result = ImageObject.GetImageHighestResolution(images)
+
+        return result
+
 
     def ToDictionary(self) -> dict:
         """
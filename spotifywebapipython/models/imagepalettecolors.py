@@ -13,6 +13,11 @@ class ImagePaletteColors:
     This is a helper class, and is not part of the Spotify Web API specification.
     """
 
+    __slots__ = (
+        '_ImageSource',
+        '_Items',
+    )
+
     def __init__(self, root:list[Tuple[int, int, int]]=None) -> None:
         """
         Initializes a new instance of the class.
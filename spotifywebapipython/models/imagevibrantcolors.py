@@ -12,6 +12,16 @@ class ImageVibrantColors:
     This is a helper class, and is not part of the Spotify Web API specification.
     """
 
+    __slots__ = (
+        '_EmptySwatch',
+        '_DarkMuted',
+        '_DarkVibrant',
+        '_LightMuted',
+        '_LightVibrant',
+        '_Muted',
+        '_Vibrant',
+    )
+
     def __init__(self, root:Palette=None) -> None:
         """
         Initializes a new instance of the class.
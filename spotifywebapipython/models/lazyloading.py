@@ -0,0 +1,90 @@
+# external package imports.
+from contextlib import contextmanager
+import threading
+
+# our package imports.
+from ..sautils import export
+
+@export
+class LazyLoading:
+    """
+    Controls lazy loading (hydration) of child objects for model classes.
+
+    By default, a model object builds all of its child objects (e.g. a `Track` builds its
+    `Album`, which builds its `ImageObject` and `ArtistSimplified` lists, etc) when it is created.
+    When lazy loading is enabled, supported model objects keep a reference to the Spotify Web API
+    response dictionary instead, and build their child objects on first access of a child object
+    property (or the `ToDictionary` / `ToString` methods).  Simple values (e.g. `Name`, `Uri`,
+    `AddedAt`) are always loaded when the object is created.
+
+    This reduces memory usage and processing time for large results where only a few values of
+    each item are used (e.g. the `Uri` of every saved track).
+
+    Lazy loading is supported by the following classes: `Album`, `AlbumSaved`, `AlbumSimplified`,
+    `ArtistSimplified`, `PlaylistTrack`, `Track`, `TrackSaved`, and `TrackSimplified`.
+
+    Note that the response dictionary is shared with the model object while child objects have
+    not been loaded, and must not be modified by the caller.
+
+    <details>
+        <summary>View Sample Code</summary>
+    ```python
+    # enable lazy loading for all threads.
+    LazyLoading.SetEnabled(True)
+
+    # or enable lazy loading for the current thread only, within a block.
+    with LazyLoading.Scope():
+        result = spotify.GetTrackFavorites(limitTotal=10000)
+    ```
+    </details>
+    """
+
+    _Enabled:bool = False
+    """ Process-wide lazy loading setting. """
+
+    _ThreadLocal:threading.local = threading.local()
+    """ Per-thread lazy loading setting (overrides the process-wide setting). """
+
+
+    @staticmethod
+    def IsEnabled() -> bool:
+        """
+        Returns True if lazy loading is enabled for the current thread; otherwise, False.
+        """
+        return getattr(LazyLoading._ThreadLocal, 'Enabled', LazyLoading._Enabled)
+
+
+    @staticmethod
+    @contextmanager
+    def Scope(enabled:bool=True):
+        """
+        Context manager that enables (or disables) lazy loading for the current thread
+        within a `with` block.
+
+        Args:
+            enabled (bool):
+                True to enable lazy loading within the block; otherwise, False to disable it.
+                Default is True.
+        """
+        previous:bool = getattr(LazyLoading._ThreadLocal, 'Enabled', None)
+        LazyLoading._ThreadLocal.Enabled = enabled
+        try:
+            yield
+        finally:
+            if previous is None:
+                del LazyLoading._ThreadLocal.Enabled
+            else:
+                LazyLoading._ThreadLocal.Enabled = previous
+
+
+    @staticmethod
+    def SetEnabled(enabled:bool) -> None:
+        """
+        Enables or disables lazy loading for all threads (unless overridden by the `Scope`
+        method for a thread).
+
+        Args:
+            enabled (bool):
+                True to enable lazy loading; otherwise, False.
+        """
+        LazyLoading._Enabled = bool(enabled)
@@ -12,6 +12,14 @@ class LinkedFrom:
     about the originally requested track.
     """
 
+    __slots__ = (
+        '_ExternalUrls',
+        '_Href',
+        '_Id',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
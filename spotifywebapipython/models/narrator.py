@@ -11,6 +11,10 @@ class Narrator:
     Contains information about content narrators.
     """
 
+    __slots__ = (
+        '_Name',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
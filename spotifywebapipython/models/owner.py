@@ -13,6 +13,16 @@ class Owner:
     Information about the owner of an object (e.g. playlist, etc).
     """
 
+    __slots__ = (
+        '_DisplayName',
+        '_ExternalUrls',
+        '_Followers',
+        '_Href',
+        '_Id',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -9,6 +9,20 @@ class PageObject:
     This allows for multiple pages of objects to be navigated.
     """
 
+    __slots__ = (
+        '_CursorAfter',
+        '_CursorBefore',
+        '_DateLastRefreshed',
+        '_Href',
+        '_IsCursor',
+        '_Items',
+        '_Limit',
+        '_Next',
+        '_Offset',
+        '_Previous',
+        '_Total',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
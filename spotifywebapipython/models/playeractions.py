@@ -9,6 +9,19 @@ class PlayerActions:
     Spotify Web API PlayerActions object.
     """
 
+    __slots__ = (
+        '_InterruptingPlayback',
+        '_Pausing',
+        '_Resuming',
+        '_Seeking',
+        '_SkippingNext',
+        '_SkippingPrev',
+        '_TogglingRepeatContext',
+        '_TogglingRepeatTrack',
+        '_TogglingShuffle',
+        '_TransferringPlayback',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
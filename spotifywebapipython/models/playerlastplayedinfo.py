@@ -22,6 +22,20 @@ class PlayerLastPlayedInfo:
     This is a helper object, and is not part of the Spotify Web API specification.
     """
 
+    __slots__ = (
+        '_Context',
+        '_Device',
+        '_DeviceMusicSource',
+        '_IsDeviceState',
+        '_IsEmpty',
+        '_Item',
+        '_ItemType',
+        '_ProgressMS',
+        '_RepeatState',
+        '_ShuffleState',
+        '_Timestamp',
+    )
+
     def __init__(self, root:PlayerPlayState=None) -> None:
         """
         Initializes a new instance of the class.
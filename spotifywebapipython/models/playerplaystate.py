@@ -18,6 +18,24 @@ class PlayerPlayState:
     progress, and active device.
     """
 
+    __slots__ = (
+        '_Actions',
+        '_Context',
+        '_ItemType',
+        '_CurrentlyPlayingType',
+        '_Device',
+        '_DeviceMusicSource',
+        '_Item',
+        '_IsDeviceState',
+        '_IsPlaying',
+        '_ProgressMS',
+        '_RepeatState',
+        '_ShuffleState',
+        '_SmartShuffle',
+        '_Timestamp',
+        '_IsEmpty',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -14,6 +14,13 @@ class PlayerQueueInfo:
     Information about the user's current playback queue.
     """
 
+    __slots__ = (
+        '_CurrentlyPlaying',
+        '_CurrentlyPlayingType',
+        '_DateLastRefreshed',
+        '_Queue',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
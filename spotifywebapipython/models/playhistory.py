@@ -12,6 +12,13 @@ class PlayHistory:
     Spotify Web API PlayHistory object.
     """
 
+    __slots__ = (
+        '_Context',
+        '_PlayedAt',
+        '_PlayedAtMS',
+        '_Track',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -13,6 +13,10 @@ class Playlist(PlaylistSimplified):
     Spotify Web API Playlist object.
     """
 
+    __slots__ = (
+        '_Followers',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -13,6 +13,22 @@ class PlaylistSimplified:
     Spotify Web API PlaylistSimplified object.
     """
 
+    __slots__ = (
+        '_Collaborative',
+        '_Description',
+        '_ExternalUrls',
+        '_Href',
+        '_Id',
+        '_Images',
+        '_Name',
+        '_Owner',
+        '_Public',
+        '_SnapshotId',
+        '_Tracks',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -2,6 +2,7 @@
 
 # our package imports.
 from ..sautils import export
+from .lazyloading import LazyLoading
 from .owner import Owner
 from .track import Track
 
@@ -11,6 +12,14 @@ class PlaylistTrack:
     Spotify Web API PlaylistTrack object.
     """
 
+    __slots__ = (
+        '_AddedAt',
+        '_AddedBy',
+        '_IsLocal',
+        '_Track',
+        '__LazyRoot',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -24,6 +33,7 @@ class PlaylistTrack:
         self._AddedBy:Owner = None
         self._IsLocal:bool = None
         self._Track:Track = None
+        self.__LazyRoot:dict = None
         
         if (root is None):
 
@@ -34,19 +44,11 @@ class PlaylistTrack:
             self._AddedAt = root.get('added_at', None)
             self._IsLocal = root.get('is_local', None)
 
-            # process all collections and objects.
-            item:dict = root.get('added_by',None)
-            if item is not None:
-                self._AddedBy = Owner(root=item)
-
-            item:dict = root.get('track',None)
-            if item is not None:
-                self._Track = Track(root=item)
+            # process all collections and objects (on first access if lazy loading is enabled).
+            if LazyLoading.IsEnabled():
+                self.__LazyRoot = root
             else:
-                # check for post 2026/02 api changes:
-                item:dict = root.get('item',None)
-                if item is not None:
-                    self._Track = Track(root=item)
+                self.__LoadChildren(root)
         
     def __repr__(self) -> str:
         return self.ToString()
@@ -56,6 +58,34 @@ class PlaylistTrack:
         return self.ToString()
 
 
+    def __LoadChildren(self, root:dict) -> None:
+        """
+        Loads child collections and objects from the Spotify Web API response dictionary.
+        """
+        item:dict = root.get('added_by',None)
+        if item is not None:
+            self._AddedBy = Owner(root=item)
+
+        item:dict = root.get('track',None)
+        if item is not None:
+            self._Track = Track(root=item)
+        else:
+            # check for post 2026/02 api changes:
+            item:dict = root.get('item',None)
+            if item is not None:
+                self._Track = Track(root=item)
+
+
+    def __Hydrate(self) -> None:
+        """
+        Loads child collections and objects, if they were deferred by lazy loading.
+        """
+        if self.__LazyRoot is not None:
+            root:dict = self.__LazyRoot
+            self.__LazyRoot = None
+            self.__LoadChildren(root)
+
+
     @property
     def AddedAt(self) -> str:
         """ 
@@ -73,6 +103,7 @@ class PlaylistTrack:
         
         Note: some very old playlists may return null in this field.
         """
+        self.__Hydrate()
         return self._AddedBy
 
 
@@ -82,6 +113,7 @@ class PlaylistTrack:
         Gets the first image url in the underlying track album `Images` list, if images are defined;
         otherwise, null.
         """
+        self.__Hydrate()
         if self._Track is not None:
             if self._Track.Album is not None:
                 return self._Track.Album.ImageUrl
@@ -101,6 +133,7 @@ class PlaylistTrack:
         """ 
         Information about the track.
         """
+        self.__Hydrate()
         return self._Track
     
 
@@ -108,6 +141,7 @@ class PlaylistTrack:
         """
         Returns a dictionary representation of the class.
         """
+        self.__Hydrate()
         addedBy:dict = {}
         if self._AddedBy is not None:
             addedBy = self._AddedBy.ToDictionary()
@@ -136,6 +170,7 @@ class PlaylistTrack:
                 True to include the Items collection of objects; otherwise, False
                 to only return base properties.
         """
+        self.__Hydrate()
         msg:str = 'PlaylistTrack:'
         if self._AddedAt is not None: msg = '%s\n AddedAt="%s"' % (msg, str(self._AddedAt))
         if self._AddedBy is not None: msg = '%s\n AddedBy="%s"' % (msg, str(self._AddedBy.Uri))
@@ -9,6 +9,11 @@ class PlaylistTrackSummary:
     Spotify Web API PlaylistTrackSummary object.
     """
 
+    __slots__ = (
+        '_Href',
+        '_Total',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -11,6 +11,15 @@ class RecommendationSeed:
     Contains information about recommended tracks.
     """
 
+    __slots__ = (
+        '_AfterFilteringSize',
+        '_AfterRelinkingSize',
+        '_Href',
+        '_Id',
+        '_InitialPoolSize',
+        '_Type',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
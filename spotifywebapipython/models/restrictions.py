@@ -11,6 +11,11 @@ class Restrictions:
     Contains information about content restrictions.
     """
 
+    __slots__ = (
+        '_Market',
+        '_Reason',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -11,6 +11,11 @@ class ResumePoint:
     Contains information about the user's most recent position in the episode.
     """
 
+    __slots__ = (
+        '_FullyPlayed',
+        '_ResumePositionMS',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -21,6 +21,18 @@ class SearchResponse:
     Spotify Web API SearchResponse object.
     """
 
+    __slots__ = (
+        '_Albums',
+        '_Artists',
+        '_Audiobooks',
+        '_Episodes',
+        '_Playlists',
+        '_SearchCriteria',
+        '_SearchCriteriaType',
+        '_Shows',
+        '_Tracks',
+    )
+
     def __init__(self, 
                  searchCriteria:str, 
                  searchCriteriaType:str, 
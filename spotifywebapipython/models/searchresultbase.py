@@ -14,6 +14,17 @@ class SearchResultBase:
     This class is not part of the Spotify Web API specification.
     """
 
+    __slots__ = (
+        '_ExternalUrls',
+        '_Href',
+        '_Id',
+        '_Images',
+        '_LinkedFrom',
+        '_Name',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -11,6 +11,10 @@ class Show(ShowSimplified):
     Spotify Web API Show object.
     """
 
+    __slots__ = (
+        '_Episodes',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
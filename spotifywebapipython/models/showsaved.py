@@ -10,6 +10,11 @@ class ShowSaved:
     Spotify Web API SavedShow object.
     """
 
+    __slots__ = (
+        '_Show',
+        '_AddedAt',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -12,6 +12,26 @@ class ShowSimplified:
     Spotify Web API SimplifiedShow object.
     """
 
+    __slots__ = (
+        '_AvailableMarkets',
+        '_Copyrights',
+        '_Description',
+        '_Explicit',
+        '_ExternalUrls',
+        '_Href',
+        '_HtmlDescription',
+        '_Id',
+        '_Images',
+        '_IsExternallyHosted',
+        '_Languages',
+        '_MediaType',
+        '_Name',
+        '_Publisher',
+        '_TotalEpisodes',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -1,4 +1,5 @@
 # external package imports.
+import bisect
 from datetime import datetime
 from typing import Iterator
 
@@ -20,6 +21,70 @@ if (_logsi == None):
 _logsi.SystemLogger = logging.getLogger(__name__)
 
 
+class _SpotifyConnectDeviceList(list):
+    """
+    List of `SpotifyConnectDevice` objects that counts the changes made to it, so that
+    lookup indexes built over the list can tell when they are stale.
+    """
+
+    Version:int = 0
+    """ Number of changes made to the list since it was created. """
+
+    def _Changed(self) -> None:
+        self.Version += 1
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._Changed()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._Changed()
+
+    def __iadd__(self, value):
+        result = super().__iadd__(value)
+        self._Changed()
+        return result
+
+    def __imul__(self, value):
+        result = super().__imul__(value)
+        self._Changed()
+        return result
+
+    def append(self, value) -> None:
+        super().append(value)
+        self._Changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._Changed()
+
+    def extend(self, value) -> None:
+        super().extend(value)
+        self._Changed()
+
+    def insert(self, index, value) -> None:
+        super().insert(index, value)
+        self._Changed()
+
+    def pop(self, index=-1):
+        result = super().pop(index)
+        self._Changed()
+        return result
+
+    def remove(self, value) -> None:
+        super().remove(value)
+        self._Changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._Changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._Changed()
+
+
 @export
 class SpotifyConnectDevices():
     """
@@ -31,7 +96,18 @@ class SpotifyConnectDevices():
         Initializes a new instance of the class.
         """
         self._DateLastRefreshed:int = 0
-        self._Items:list[SpotifyConnectDevice] = []
+        self._Items:list[SpotifyConnectDevice] = _SpotifyConnectDeviceList()
+
+        # lookup indexes (lowercased key -> `Items` index of the first matching entry);
+        # built on first use, and rebuilt when the collection changes.
+        self._IndexAlias:dict[str, int] = {}
+        self._IndexVersion:int = -1
+        self._IndexDeviceInfoId:dict[str, int] = {}
+        self._IndexDiscoveryKey:dict[str, int] = {}
+        self._IndexDiscoveryName:dict[str, int] = {}
+        self._IndexId:dict[str, int] = {}
+        self._IndexName:dict[str, int] = {}
+        self._IndexNameAndId:dict[tuple[str, str], int] = {}
 
 
     def __getitem__(self, key) -> SpotifyConnectDevice:
@@ -82,6 +158,10 @@ class SpotifyConnectDevices():
     def Items(self) -> list[SpotifyConnectDevice]:
         """ 
         Array of `SpotifyConnectDevice` objects.
+
+        Changes made to the list itself (adds, removes, replacements, sorts) are detected
+        automatically.  If an entry's properties are modified in place (e.g. a name or id
+        changes), then the `RefreshIndexes` method must be called so that lookups see the changes.
         """
         return self._Items
     
@@ -96,6 +176,89 @@ class SpotifyConnectDevices():
         return 0
     
 
+    @staticmethod
+    def _GetSortKey(scDevice:SpotifyConnectDevice) -> str:
+        """
+        Returns the sort key of a device entry (lowercase name).
+        """
+        return (scDevice.Name or "").lower()
+
+
+    def _BuildIndexes(self) -> None:
+        """
+        Builds the lookup indexes if they have not been built yet, or if the `Items`
+        collection changed since they were built.
+
+        Each index maps a lowercased key value to the `Items` index of the first entry that
+        contains the value, which is the same entry that a sequential search would find.
+        """
+        if (self._IndexVersion == self._Items.Version):
+            return
+
+        indexAlias:dict[str, int] = {}
+        indexDeviceInfoId:dict[str, int] = {}
+        indexDiscoveryKey:dict[str, int] = {}
+        indexDiscoveryName:dict[str, int] = {}
+        indexId:dict[str, int] = {}
+        indexName:dict[str, int] = {}
+        indexNameAndId:dict[tuple[str, str], int] = {}
+
+        idx:int
+        scDevice:SpotifyConnectDevice
+        for idx, scDevice in enumerate(self._Items):
+
+            info:ZeroconfGetInfo = scDevice.DeviceInfo
+            discovery:ZeroconfDiscoveryResult = scDevice.DiscoveryResult
+
+            if (scDevice.Id is not None):
+                indexId.setdefault(scDevice.Id.lower(), idx)
+                if (scDevice.Name is not None):
+                    indexNameAndId.setdefault((scDevice.Name.lower(), scDevice.Id.lower()), idx)
+
+            if (info is not None):
+                if (info.DeviceId is not None):
+                    indexDeviceInfoId.setdefault(info.DeviceId.lower(), idx)
+                if (info.RemoteName is not None):
+                    indexName.setdefault(info.RemoteName.lower(), idx)
+                if (info.HasAliases):
+                    scAlias:ZeroconfGetInfoAlias
+                    for scAlias in info.Aliases:
+                        if (scAlias.Name is not None):
+                            indexAlias.setdefault(scAlias.Name.lower(), idx)
+
+            if (discovery is not None):
+                if (discovery.DeviceName is not None):
+                    indexName.setdefault(discovery.DeviceName.lower(), idx)
+                if (discovery.Key is not None):
+                    indexDiscoveryKey.setdefault(discovery.Key.lower(), idx)
+                if (discovery.Name is not None):
+                    indexDiscoveryName.setdefault(discovery.Name.lower(), idx)
+
+        self._IndexAlias = indexAlias
+        self._IndexDeviceInfoId = indexDeviceInfoId
+        self._IndexDiscoveryKey = indexDiscoveryKey
+        self._IndexDiscoveryName = indexDiscoveryName
+        self._IndexId = indexId
+        self._IndexName = indexName
+        self._IndexNameAndId = indexNameAndId
+        self._IndexVersion = self._Items.Version
+
+
+    def AddSorted(self, scDevice:SpotifyConnectDevice) -> None:
+        """
+        Adds a device entry to the `Items` collection, inserting it at its sorted position
+        (by name, ascending order).
+
+        Args:
+            scDevice (SpotifyConnectDevice):
+                Device entry to add.
+
+        The `Items` collection is assumed to already be sorted by name; entries with the
+        same name are kept in the order they were added.
+        """
+        bisect.insort(self._Items, scDevice, key=SpotifyConnectDevices._GetSortKey)
+
+
     def ContainsDeviceId(self, value:str) -> bool:
         """ 
         Returns True if the `Items` collection contains the specified device id value;
@@ -148,21 +311,10 @@ class SpotifyConnectDevices():
         Returns a `SpotifyConnectDevice` instance if the `Items` collection contains the specified 
         device zeroconf discovery results key value; otherwise, None.
         """
-        result:SpotifyConnectDevice = None
-        if value is None:
-            return result
-        
-        # convert case for comparison.
-        value = value.lower()
-
-        # process all devices, comparing discovery keys.
-        for i in range(len(self._Items)):
-            if (self._Items[i].DiscoveryResult is not None):
-                if (self._Items[i].DiscoveryResult.Key is not None):
-                    if (self._Items[i].DiscoveryResult.Key.lower() == value):
-                        result = self._Items[i]
-                        break       
-        return result
+        idx:int = self.GetDeviceIndexByDiscoveryKey(value)
+        if (idx == -1):
+            return None
+        return self._Items[idx]
 
 
     def GetDeviceById(self, value:str) -> SpotifyConnectDevice:
@@ -183,39 +335,27 @@ class SpotifyConnectDevices():
         
         # convert case for comparison.
         value = value.lower()
-        
-        # process all discovered devices.
-        scDevice:SpotifyConnectDevice
-        for scDevice in self._Items:
-
-            # check for id in the Spotify Connect Zeroconf GetInfo response.
-            if (scDevice.DeviceInfo.DeviceId is not None):
-                if (scDevice.DeviceInfo.DeviceId.lower() == value):
-                    result = scDevice
-                    _logsi.LogVerbose("GetDeviceById found SpotifyConnectDevices collection entry: %s (DeviceInfo.DeviceId)" % scDevice.Title)
-                    break
+        self._BuildIndexes()
 
+        # check for id in the Spotify Connect Zeroconf GetInfo response.
+        idx:int = self._IndexDeviceInfoId.get(value, -1)
+        if (idx != -1):
+            result = self._Items[idx]
+            _logsi.LogVerbose("GetDeviceById found SpotifyConnectDevices collection entry: %s (DeviceInfo.DeviceId)" % result.Title)
 
         # if not resolved, then check for id in the base device definition.
-        if (result is None):
-
-            # process all discovered devices.
-            scDevice:SpotifyConnectDevice
-            for scDevice in self._Items:
-
-                # check for id in the base device definition.
-                if (scDevice.Id is not None):
-                    if (scDevice.Id.lower() == value):
-                        result = scDevice
-                        _logsi.LogVerbose("GetDeviceById found SpotifyConnectDevices collection entry: %s (Device.Id)" % scDevice.Title)
-                        break
+        else:
+            idx = self._IndexId.get(value, -1)
+            if (idx != -1):
+                result = self._Items[idx]
+                _logsi.LogVerbose("GetDeviceById found SpotifyConnectDevices collection entry: %s (Device.Id)" % result.Title)
 
         # trace.
         if (result is None):
             _logsi.LogVerbose("GetDeviceById could not find SpotifyConnectDevices collection entry: \"%s\"" % value)
 
         return result
-    
+
 
     def GetDeviceByName(self, value:str) -> SpotifyConnectDevice:
         """ 
@@ -236,50 +376,27 @@ class SpotifyConnectDevices():
         
         # convert case for comparison.
         value = value.lower()
-        
-        # process all discovered devices.
-        scDevice:SpotifyConnectDevice
-        for scDevice in self._Items:
-
-            # match on `getInfo` RemoteName value (if defined).
-            if (scDevice.DeviceInfo.RemoteName is not None):
-                if (scDevice.DeviceInfo.RemoteName.lower() == value):
-                    result = scDevice
-                    _logsi.LogVerbose("GetDeviceByName found SpotifyConnectDevices collection entry: %s (DeviceInfo.RemoteName)" % scDevice.Title)
-                    break
+        self._BuildIndexes()
 
-            # match on Zeroconf DeviceName value (if defined).
-            if (scDevice.DiscoveryResult.DeviceName is not None):
-                if (scDevice.DiscoveryResult.DeviceName.lower() == value):
-                    result = scDevice
-                    _logsi.LogVerbose("GetDeviceByName found SpotifyConnectDevices collection entry: %s (DiscoveryResult.DeviceName)" % scDevice.Title)
-                    break
+        # match on `getInfo` RemoteName or Zeroconf DeviceName value.
+        idx:int = self._IndexName.get(value, -1)
+        if (idx != -1):
+            result = self._Items[idx]
+            _logsi.LogVerbose("GetDeviceByName found SpotifyConnectDevices collection entry: %s (DeviceInfo.RemoteName / DiscoveryResult.DeviceName)" % result.Title)
 
         # if not resolved, then search by alias name.
-        if (result is None):
-
-            # process all discovered devices.
-            scDevice:SpotifyConnectDevice
-            for scDevice in self._Items:
-
-                # search aliases (if defined).
-                if (scDevice.DeviceInfo.HasAliases):
-                    scAlias:ZeroconfGetInfoAlias
-                    for scAlias in scDevice.DeviceInfo.Aliases:
-                        if (scAlias.Name is not None):
-                            if (scAlias.Name.lower() == value):
-                                result = scDevice
-                                _logsi.LogVerbose("GetDeviceByName found SpotifyConnectDevices collection entry: %s (DeviceInfo.Aliases)" % scDevice.Title)
-                                break
-                    if result is not None:
-                        break
+        else:
+            idx = self._IndexAlias.get(value, -1)
+            if (idx != -1):
+                result = self._Items[idx]
+                _logsi.LogVerbose("GetDeviceByName found SpotifyConnectDevices collection entry: %s (DeviceInfo.Aliases)" % result.Title)
 
         # trace.
         if (result is None):
             _logsi.LogVerbose("GetDeviceByName could not find SpotifyConnectDevices collection entry: \"%s\"" % value)
 
         return result
-    
+
 
     def GetDeviceByNameAndId(self, deviceName:str, deviceId:str) -> int:
         """ 
@@ -297,15 +414,13 @@ class SpotifyConnectDevices():
         # convert case for comparison.
         deviceName = deviceName.lower()
         deviceId = deviceId.lower()
+        self._BuildIndexes()
 
-        # process all devices, comparing device name and id.
-        scDevice:SpotifyConnectDevice
-        for scDevice in self._Items:
-            if (scDevice.Name is not None) and (scDevice.Id is not None):
-                if (scDevice.Name.lower() == deviceName) and (scDevice.Id.lower() == deviceId):
-                    result = scDevice
-                    _logsi.LogVerbose("GetDeviceByNameAndId found SpotifyConnectDevices collection entry: %s" % scDevice.Title)
-                    break       
+        # find device by name and id.
+        idx:int = self._IndexNameAndId.get((deviceName, deviceId), -1)
+        if (idx != -1):
+            result = self._Items[idx]
+            _logsi.LogVerbose("GetDeviceByNameAndId found SpotifyConnectDevices collection entry: %s" % result.Title)
 
         # trace.
         if (result is None):
@@ -320,21 +435,10 @@ class SpotifyConnectDevices():
         the specified device zeroconf discovery results key value if found; 
         otherwise, -1.
         """
-        result:int = -1
         if value is None:
-            return result
-        
-        # convert case for comparison.
-        value = value.lower()
-
-        # process all devices, comparing discovery keys.
-        for i in range(len(self._Items)):
-            if (self._Items[i].DiscoveryResult is not None):
-                if (self._Items[i].DiscoveryResult.Key is not None):
-                    if (self._Items[i].DiscoveryResult.Key.lower() == value):
-                        result = i
-                        break       
-        return result
+            return -1
+        self._BuildIndexes()
+        return self._IndexDiscoveryKey.get(value.lower(), -1)
 
 
     def GetDeviceIndexByDiscoveryName(self, value:str) -> int:
@@ -343,21 +447,10 @@ class SpotifyConnectDevices():
         the specified device zeroconf discovery results name value if found; 
         otherwise, -1.
         """
-        result:int = -1
         if value is None:
-            return result
-        
-        # convert case for comparison.
-        value = value.lower()
-
-        # process all devices, comparing discovery keys.
-        for i in range(len(self._Items)):
-            if (self._Items[i].DiscoveryResult is not None):
-                if (self._Items[i].DiscoveryResult.Name is not None):
-                    if (self._Items[i].DiscoveryResult.Name.lower() == value):
-                        result = i
-                        break       
-        return result
+            return -1
+        self._BuildIndexes()
+        return self._IndexDiscoveryName.get(value.lower(), -1)
 
 
     def GetDeviceList(self) -> list[Device]:
@@ -406,6 +499,47 @@ class SpotifyConnectDevices():
         return result
     
 
+    def RefreshIndexes(self) -> None:
+        """
+        Rebuilds the lookup indexes on the next lookup.
+
+        This must be called after `Items` collection entries are modified in place (e.g. a
+        name, id, or alias changes); entries that are added, removed, replaced, or reordered
+        are detected automatically.
+        """
+        self._IndexVersion = -1
+
+
+    def UpdateSortOrder(self, scDevice:SpotifyConnectDevice) -> None:
+        """
+        Moves a device entry to its sorted position (by name, ascending order) after its
+        name has changed.
+
+        Args:
+            scDevice (SpotifyConnectDevice):
+                Device entry that was updated.
+
+        Only the specified entry is moved; the rest of the `Items` collection is assumed
+        to already be sorted by name.
+        """
+        idx:int = -1
+        for i in range(len(self._Items)):
+            if (self._Items[i] is scDevice):
+                idx = i
+                break
+        if (idx == -1):
+            return
+
+        # is the entry still in sorted order relative to its neighbors? if so, then we are done.
+        key:str = SpotifyConnectDevices._GetSortKey(scDevice)
+        if ((idx == 0) or (SpotifyConnectDevices._GetSortKey(self._Items[idx - 1]) <= key)) \
+        and ((idx == len(self._Items) - 1) or (key <= SpotifyConnectDevices._GetSortKey(self._Items[idx + 1]))):
+            return
+
+        self._Items.pop(idx)
+        bisect.insort(self._Items, scDevice, key=SpotifyConnectDevices._GetSortKey)
+
+
     def ToDictionary(self) -> dict:
         """
         Returns a dictionary representation of the class.
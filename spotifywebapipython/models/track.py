@@ -2,6 +2,7 @@
 
 # our package imports.
 from ..sautils import export
+from .lazyloading import LazyLoading
 from .album import Album
 from .externalids import ExternalIds
 from .tracksimplified import TrackSimplified
@@ -12,6 +13,13 @@ class Track(TrackSimplified):
     Spotify Web API Track object.
     """
 
+    __slots__ = (
+        '_Album',
+        '_ExternalIds',
+        '_Popularity',
+        '__LazyRoot',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -27,6 +35,7 @@ class Track(TrackSimplified):
         self._Album:Album = None
         self._ExternalIds:ExternalIds = None
         self._Popularity:int = None
+        self.__LazyRoot:dict = None
         
         if (root is None):
 
@@ -36,14 +45,11 @@ class Track(TrackSimplified):
 
             self._Popularity = root.get('popularity', None)
 
-            # process all collections and objects.
-            item:dict = root.get('album',None)
-            if item is not None:
-                self._Album = Album(root=item)
-
-            item:dict = root.get('external_ids',None)
-            if item is not None:
-                self._ExternalIds = ExternalIds(root=item)
+            # process all collections and objects (on first access if lazy loading is enabled).
+            if LazyLoading.IsEnabled():
+                self.__LazyRoot = root
+            else:
+                self.__LoadChildren(root)
 
         
     def __repr__(self) -> str:
@@ -54,6 +60,29 @@ class Track(TrackSimplified):
         return self.ToString()
 
 
+    def __LoadChildren(self, root:dict) -> None:
+        """
+        Loads child collections and objects from the Spotify Web API response dictionary.
+        """
+        item:dict = root.get('album',None)
+        if item is not None:
+            self._Album = Album(root=item)
+
+        item:dict = root.get('external_ids',None)
+        if item is not None:
+            self._ExternalIds = ExternalIds(root=item)
+
+
+    def __Hydrate(self) -> None:
+        """
+        Loads child collections and objects, if they were deferred by lazy loading.
+        """
+        if self.__LazyRoot is not None:
+            root:dict = self.__LazyRoot
+            self.__LazyRoot = None
+            self.__LoadChildren(root)
+
+
     @property
     def Album(self) -> Album:
         """ 
@@ -61,6 +90,7 @@ class Track(TrackSimplified):
         
         The album object includes a link in href to full information about the album.
         """
+        self.__Hydrate()
         return self._Album
 
 
@@ -69,6 +99,7 @@ class Track(TrackSimplified):
         """ 
         Known external ID's for the track.
         """
+        self.__Hydrate()
         return self._ExternalIds
     
 
@@ -78,6 +109,7 @@ class Track(TrackSimplified):
         Gets the first image url in the album `Images` list, if images are defined;
         otherwise, null.
         """
+        self.__Hydrate()
         if self._Album is not None:
             return self._Album.ImageUrl
         return None
@@ -105,6 +137,7 @@ class Track(TrackSimplified):
         """
         Returns a dictionary representation of the class.
         """
+        self.__Hydrate()
         # get base class result.
         resultBase:dict = super().ToDictionary()
 
@@ -135,6 +168,7 @@ class Track(TrackSimplified):
         """
         Returns a displayable string representation of the class.
         """
+        self.__Hydrate()
         msg:str = 'Track: %s' % super().ToString(False)
         if self._Album is not None: msg = '%s\n Album="%s"' % (msg, str(self._Album.Name))
         #if self._ExternalIds is not None: msg = '%s\n %s' % (msg, str(self._ExternalIds))
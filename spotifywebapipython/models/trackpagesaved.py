@@ -14,6 +14,8 @@ class TrackPageSaved(PageObject):
     This allows for multiple pages of `TrackSaved` objects to be navigated.
     """
 
+    __slots__ = ()
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
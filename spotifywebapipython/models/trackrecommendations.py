@@ -11,6 +11,11 @@ class TrackRecommendations:
     Spotify Web API TrackRecommendations object.
     """
 
+    __slots__ = (
+        '_Seeds',
+        '_Tracks',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -2,6 +2,7 @@
 
 # our package imports.
 from ..sautils import export
+from .lazyloading import LazyLoading
 from .track import Track
 
 @export
@@ -10,6 +11,12 @@ class TrackSaved:
     Spotify Web API SavedTrack object.
     """
 
+    __slots__ = (
+        '_AddedAt',
+        '_Track',
+        '__LazyRoot',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -21,6 +28,7 @@ class TrackSaved:
         """
         self._AddedAt:str = None
         self._Track:Track = None
+        self.__LazyRoot:dict = None
         
         if (root is None):
 
@@ -30,10 +38,11 @@ class TrackSaved:
 
             self._AddedAt = root.get('added_at', None)
 
-            # process all collections and objects.
-            item:dict = root.get('track',None)
-            if item is not None:
-                self._Track = Track(root=item)
+            # process all collections and objects (on first access if lazy loading is enabled).
+            if LazyLoading.IsEnabled():
+                self.__LazyRoot = root
+            else:
+                self.__LoadChildren(root)
 
         
     def __repr__(self) -> str:
@@ -44,6 +53,25 @@ class TrackSaved:
         return self.ToString()
 
 
+    def __LoadChildren(self, root:dict) -> None:
+        """
+        Loads child collections and objects from the Spotify Web API response dictionary.
+        """
+        item:dict = root.get('track',None)
+        if item is not None:
+            self._Track = Track(root=item)
+
+
+    def __Hydrate(self) -> None:
+        """
+        Loads child collections and objects, if they were deferred by lazy loading.
+        """
+        if self.__LazyRoot is not None:
+            root:dict = self.__LazyRoot
+            self.__LazyRoot = None
+            self.__LoadChildren(root)
+
+
     @property
     def AddedAt(self) -> str:
         """ 
@@ -62,6 +90,7 @@ class TrackSaved:
         """ 
         Information about the track.
         """
+        self.__Hydrate()
         return self._Track
     
 
@@ -69,6 +98,7 @@ class TrackSaved:
         """
         Returns a dictionary representation of the class.
         """
+        self.__Hydrate()
         track:dict = {}
         if self._Track is not None:
             track = self._Track.ToDictionary()
@@ -90,6 +120,7 @@ class TrackSaved:
                 True to include the Items collection of objects; otherwise, False
                 to only return base properties.
         """
+        self.__Hydrate()
         msg:str = 'TrackSaved:'
         if self._AddedAt is not None: msg = '%s\n AddedAt="%s"' % (msg, str(self._AddedAt))
         
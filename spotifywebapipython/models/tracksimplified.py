@@ -2,6 +2,7 @@
 
 # our package imports.
 from ..sautils import export
+from .lazyloading import LazyLoading
 from .artistsimplified import ArtistSimplified
 from .externalurls import ExternalUrls
 from .linkedfrom import LinkedFrom
@@ -13,6 +14,27 @@ class TrackSimplified:
     Spotify Web API SimplifiedTrack object.
     """
 
+    __slots__ = (
+        '_Artists',
+        '_AvailableMarkets',
+        '_DiscNumber',
+        '_DurationMS',
+        '_Explicit',
+        '_ExternalUrls',
+        '_Href',
+        '_Id',
+        '_IsLocal',
+        '_IsPlayable',
+        '_LinkedFrom',
+        '_Name',
+        '_PreviewUrl',
+        '_Restrictions',
+        '_TrackNumber',
+        '_Type',
+        '_Uri',
+        '__LazyRoot',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
@@ -39,6 +61,7 @@ class TrackSimplified:
         self._TrackNumber:int = None
         self._Type:str = None
         self._Uri:str = None
+        self.__LazyRoot:dict = None
         
         if (root is None):
 
@@ -60,23 +83,11 @@ class TrackSimplified:
             self._Type = root.get('type', None)
             self._Uri = root.get('uri', None)
 
-            # process all collections and objects.
-            items:list = root.get('artists',None)
-            if items is not None:
-                for item in items:
-                    self._Artists.append(ArtistSimplified(root=item))
-        
-            item:dict = root.get('external_urls',None)
-            if item is not None:
-                self._ExternalUrls = ExternalUrls(root=item)
-
-            item:dict = root.get('linked_from',None)
-            if item is not None:
-                self._LinkedFrom = LinkedFrom(root=item)
-
-            item:dict = root.get('restrictions',None)
-            if item is not None:
-                self._Restrictions = Restrictions(root=item)
+            # process all collections and objects (on first access if lazy loading is enabled).
+            if LazyLoading.IsEnabled():
+                self.__LazyRoot = root
+            else:
+                self.__LoadChildren(root)
 
         
     def __repr__(self) -> str:
@@ -87,6 +98,38 @@ class TrackSimplified:
         return self.ToString()
 
 
+    def __LoadChildren(self, root:dict) -> None:
+        """
+        Loads child collections and objects from the Spotify Web API response dictionary.
+        """
+        items:list = root.get('artists',None)
+        if items is not None:
+            for item in items:
+                self._Artists.append(ArtistSimplified(root=item))
+    
+        item:dict = root.get('external_urls',None)
+        if item is not None:
+            self._ExternalUrls = ExternalUrls(root=item)
+
+        item:dict = root.get('linked_from',None)
+        if item is not None:
+            self._LinkedFrom = LinkedFrom(root=item)
+
+        item:dict = root.get('restrictions',None)
+        if item is not None:
+            self._Restrictions = Restrictions(root=item)
+
+
+    def __Hydrate(self) -> None:
+        """
+        Loads child collections and objects, if they were deferred by lazy loading.
+        """
+        if self.__LazyRoot is not None:
+            root:dict = self.__LazyRoot
+            self.__LazyRoot = None
+            self.__LoadChildren(root)
+
+
     # implement sorting support.
     def __eq__(self, other):
         try:
@@ -110,6 +153,7 @@ class TrackSimplified:
         """ 
         A list of artists who performed the track. 
         """
+        self.__Hydrate()
         return self._Artists
 
 
@@ -150,6 +194,7 @@ class TrackSimplified:
         """ 
         Known external URLs for the track.
         """
+        self.__Hydrate()
         return self._ExternalUrls
     
 
@@ -178,6 +223,7 @@ class TrackSimplified:
 
         This is a helper property, and is not part of the Spotify Web API specification.
         """
+        self.__Hydrate()
         if (self.IsLinkedFrom):
             return self._LinkedFrom.Id
         return self._Id
@@ -203,6 +249,7 @@ class TrackSimplified:
 
         This is a helper property, and is not part of the Spotify Web API specification.
         """
+        self.__Hydrate()
         if (self._LinkedFrom is not None) and (self._LinkedFrom.Id is not None):
             return True
         return False
@@ -232,6 +279,7 @@ class TrackSimplified:
         with a different track.  The track in the LinkedFrom object contains information about the originally 
         requested track.
         """
+        self.__Hydrate()
         return self._LinkedFrom
 
 
@@ -274,6 +322,7 @@ class TrackSimplified:
         """ 
         Included in the response when a content restriction is applied.
         """
+        self.__Hydrate()
         return self._Restrictions
 
 
@@ -312,6 +361,7 @@ class TrackSimplified:
 
         This is a helper property, and is not part of the Spotify Web API specification.
         """
+        self.__Hydrate()
         if (self.IsLinkedFrom):
             return self._LinkedFrom.Uri
         return self._Uri
@@ -321,6 +371,7 @@ class TrackSimplified:
         """
         Returns a dictionary representation of the class.
         """
+        self.__Hydrate()
         externalUrls:dict = {}
         if self._ExternalUrls is not None:
             externalUrls = self._ExternalUrls.ToDictionary()
@@ -367,6 +418,7 @@ class TrackSimplified:
             includeTitle (str):
                 True to include the class name title prefix.
         """
+        self.__Hydrate()
         msg:str = ''
         if includeTitle: 
             msg = 'TrackSimplified:'
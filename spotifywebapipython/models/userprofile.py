@@ -16,6 +16,13 @@ class UserProfile(UserProfileSimplified):
     Information about the user from their account profile.
     """
 
+    __slots__ = (
+        '_Country',
+        '_EMail',
+        '_ExplicitContent',
+        '_Product',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
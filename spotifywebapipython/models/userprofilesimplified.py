@@ -15,6 +15,18 @@ class UserProfileSimplified:
     Information about the user from their account profile.
     """
 
+    __slots__ = (
+        '_AccountId',
+        '_DisplayName',
+        '_ExternalUrls',
+        '_Followers',
+        '_Href',
+        '_Id',
+        '_Images',
+        '_Type',
+        '_Uri',
+    )
+
     def __init__(self, root:dict=None) -> None:
         """
         Initializes a new instance of the class.
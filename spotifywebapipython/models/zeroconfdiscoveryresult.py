@@ -10,6 +10,27 @@ class ZeroconfDiscoveryResult:
     Information about the Zeroconf entry for a SpotifyConnect device as found by Zeroconf (mDNS).
     """
 
+    __slots__ = (
+        '_DeviceName',
+        '_Domain',
+        '_HostIpAddresses',
+        '_HostIpPort',
+        '_HostTTL',
+        '_IsChromeCast',
+        '_Id',
+        '_Key',
+        '_Name',
+        '_OtherTTL',
+        '_Priority',
+        '_Properties',
+        '_Server',
+        '_ServerKey',
+        '_ServiceType',
+        '_Weight',
+        '_SpotifyConnectCPath',
+        '_SpotifyConnectVersion',
+    )
+
     def __init__(self) -> None:
         """
         Initializes a new instance of the class.
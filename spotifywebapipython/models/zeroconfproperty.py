@@ -11,6 +11,11 @@ class ZeroconfProperty:
     Information about a Zeroconf property.
     """
 
+    __slots__ = (
+        '_Name',
+        '_Value',
+    )
+
     def __init__(self, name:str, value:str) -> None:
         """
         Initializes a new instance of the class.
@@ -40,6 +40,11 @@ class SAAppMessages:
     SAM1002E - Spotify Web API returned an authorization error status while processing the \"{methodname}\" method.\nHTTP Status: {httpstatus} - {httpreason}\nError: {error}\nError Description: \"{errordescription}\"
     """
     
+    MSG_SPOTIFY_WEB_API_RATE_LIMITED:str = "Request was not sent to the Spotify Web API; requests are rate limited for another %.3f seconds"
+    """
+    Request was not sent to the Spotify Web API; requests are rate limited for another %.3f seconds
+    """
+
     MSG_SPOTIFY_WEB_API_RETRY_REQUEST_DELAY:str = "Delaying for %s seconds before retry to allow Spotify Gateway to become available"
     """
     Delaying for %s seconds before retry to allow Spotify Gateway to become available
@@ -0,0 +1,1278 @@
+# external package imports.
+import aiohttp
+import asyncio
+from datetime import datetime
+import json
+import math
+from soco import SoCo
+from typing import Callable
+from urllib3 import HTTPResponse
+from urllib.parse import urlencode
+
+# our package imports.
+from .models import *
+from .saappmessages import SAAppMessages
+from .sautils import export, mediaPositionHMS_fromSeconds, validateDelay
+from .spotifyapierror import SpotifyApiError
+from .spotifyapimessage import SpotifyApiMessage
+from .spotifyauthtoken import SpotifyAuthToken
+from .spotifyclient import SpotifyClient
+from .spotifymediatypes import SpotifyMediaTypes
+from .spotifywebapiauthenticationerror import SpotifyWebApiAuthenticationError
+from .spotifywebapierror import SpotifyWebApiError
+from .const import (
+    TRACE_METHOD_RESULT_TYPE,
+    TRACE_METHOD_RESULT_TYPE_PAGE,
+    TRACE_MSG_DELAY_DEVICE,
+    TRACE_MSG_DELAY_DEVICE_SONOS,
+)
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession, SIMethodParmListContext, SIColors
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+@export
+class AsyncSpotifyClient:
+    """
+    The AsyncSpotifyClient is the asyncio counterpart of the `SpotifyClient` class, and uses
+    an asynchronous HTTP transport (aiohttp) to access the Spotify Web API.
+
+    It is constructed from an existing `SpotifyClient` instance, which supplies the authorization
+    access token, user profile, response caches, and Spotify Connect device resolution.  Responses
+    are converted into the same `models` objects that the `SpotifyClient` returns.
+
+    Requests never block the event loop: HTTP requests are awaited, and retry / post-command delays
+    use `await asyncio.sleep()` instead of `time.sleep()`.  This allows hundreds of requests to run
+    concurrently on a single thread.  Operations that rely on blocking libraries (e.g. authorization
+    token renewal, Spotify Connect device resolution, Sonos SoCo commands, and player state polling
+    when the `SpotifyClient.PlayerCommandConfirm` option is enabled) are run in the default executor.
+
+    The class covers catalog object lookups, player state, auto-paged track favorites and playlist
+    items, and player control (play, pause, resume, seek, skip, repeat, shuffle, volume, transfer).
+    Multi-step player commands (e.g. `PlayerMediaPlayContext`, `PlayerTransferPlayback`) run the
+    equivalent `SpotifyClient` method in the default executor.  Any other `SpotifyClient` method can
+    be called via `await asyncio.to_thread(client.Client.<method>, ...)`.
+
+    This class requires the optional `aiohttp` package, which can be installed with the `async`
+    extra (e.g. `pip install spotifywebapipython[async]`).
+
+    <details>
+        <summary>View Sample Code</summary>
+    ```python
+    spotify:SpotifyClient = SpotifyClient(spotifyConnectDirectoryEnabled=False)
+    spotify.SetAuthTokenAuthorizationCode(CLIENT_ID, SPOTIFY_SCOPES, tokenProfileId=TOKEN_PROFILE_ID)
+
+    async def main():
+        async with AsyncSpotifyClient(spotify) as client:
+            tracks = await asyncio.gather(*[client.GetTrack(trackId) for trackId in trackIds])
+            await client.PlayerMediaPause()
+
+    asyncio.run(main())
+    ```
+    </details>
+    """
+
+    def __init__(
+        self,
+        client:SpotifyClient,
+        session:aiohttp.ClientSession=None,
+        ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            client (SpotifyClient):
+                A `SpotifyClient` instance that contains the authorization access token
+                (e.g. one of its `SetAuthToken...` methods has been called).
+            session (aiohttp.ClientSession):
+                The aiohttp client session to use for HTTP requests, or null to create a new
+                session when the first request is made.  A session that is supplied by the
+                caller is not closed by the `Close` method.
+                Default is null.
+
+        Raises:
+            SpotifyApiError:
+                If the `client` argument is not a `SpotifyClient` instance.
+        """
+        # validations.
+        if (not isinstance(client, SpotifyClient)):
+            raise SpotifyApiError(SAAppMessages.ARGUMENT_TYPE_ERROR % ("__init__", 'client', 'SpotifyClient', type(client).__name__), logsi=_logsi)
+
+        # initialize storage.
+        self._Client:SpotifyClient = client
+        self._IsSessionOwned:bool = (session is None)
+        self._Session:aiohttp.ClientSession = session
+
+
+    async def __aenter__(self) -> 'AsyncSpotifyClient':
+        # if called via an async context manager (e.g. "async with" statement).
+        return self
+
+
+    async def __aexit__(self, etype, value, traceback) -> None:
+        # if called via an async context manager (e.g. "async with" statement).
+        await self.Close()
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def AuthToken(self) -> SpotifyAuthToken:
+        """
+        Authorization token used to access the Spotify Web API (from the underlying `SpotifyClient`).
+        """
+        return self._Client.AuthToken
+
+
+    @property
+    def Client(self) -> SpotifyClient:
+        """
+        The underlying `SpotifyClient` instance.
+        """
+        return self._Client
+
+
+    @property
+    def Session(self) -> aiohttp.ClientSession:
+        """
+        The aiohttp client session used for HTTP requests to the Spotify Web API, or null
+        if a session has not been created yet.
+        """
+        return self._Session
+
+
+    @property
+    def UserProfile(self) -> UserProfile:
+        """
+        Information about the user from their account profile (from the underlying `SpotifyClient`).
+        """
+        return self._Client.UserProfile
+
+
+    def _GetSession(self) -> aiohttp.ClientSession:
+        """
+        Returns the aiohttp client session, creating it if needed.
+        """
+        if (self._Session is None) or (self._Session.closed):
+            connector = aiohttp.TCPConnector(limit=30)
+            timeout = aiohttp.ClientTimeout(sock_connect=30)
+            self._Session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={'User-Agent': 'SpotifyWebApiPython/1.0.0'})
+            self._IsSessionOwned = True
+        return self._Session
+
+
+    async def _GetPagesWithOffset(
+        self,
+        msg:SpotifyApiMessage,
+        limitTotal:int,
+        pageRootKey:str=None,
+        ) -> list:
+        """
+        Retrieves a page of items that are navigated via an offset value, along with all
+        remaining pages (up to `limitTotal`) if auto-paging is in effect.
+
+        Args:
+            msg (SpotifyApiMessage):
+                The api message object for the first page to retrieve; its `UrlParameters` must
+                contain the `limit` and `offset` values of the page.
+            limitTotal (int):
+                The maximum number of items to return for the request; zero if auto-paging
+                is not in effect.
+            pageRootKey (str):
+                Response data key that contains the paging object (e.g. "tracks"), or null if
+                the response data is the paging object.
+
+        Returns:
+            A list of page response data dictionaries, in offset order.
+
+        The first page is retrieved, and its `total` value is used to determine the offsets of
+        the remaining pages.  The remaining pages are then retrieved concurrently (limited by the
+        `SpotifyClient.PagingConcurrency` value) using the same rules as the `SpotifyClient`
+        auto-paging methods.
+        """
+        await self.MakeRequest('GET', msg)
+        pageData:dict = msg.ResponseData
+        if (pageRootKey is not None) and isinstance(pageData, dict):
+            pageData = pageData.get(pageRootKey, None)
+        if pageData is None:
+            pageData = {}
+        result:list = [pageData]
+
+        # are we auto-paging, and are there more pages?
+        if (limitTotal <= 0) or (not isinstance(pageData, dict)) or (pageData.get('next', None) is None):
+            return result
+
+        # calculate remaining page offsets.
+        urlParms:dict = msg.UrlParameters
+        total:int = pageData.get('total', None) or 0
+        nextOffset:int = pageData.get('offset', None) or urlParms.get('offset', 0)
+        nextLimit:int = pageData.get('limit', None) or urlParms.get('limit', 0)
+        pageMsgs:list[SpotifyApiMessage] = []
+        while nextLimit > 0:
+            nextOffset = nextOffset + nextLimit
+            if (nextOffset >= total) or (nextOffset >= limitTotal):
+                break
+            if (nextOffset + nextLimit) > limitTotal:
+                nextLimit = limitTotal - nextOffset
+            pageUrlParms:dict = dict(urlParms)
+            pageUrlParms['offset'] = nextOffset
+            pageUrlParms['limit'] = nextLimit
+            pageMsgs.append(SpotifyApiMessage(msg.MethodName, msg.Uri, urlParameters=pageUrlParms, requestHeaders=dict(msg.RequestHeaders)))
+
+        # retrieve remaining pages concurrently.
+        semaphore:asyncio.Semaphore = asyncio.Semaphore(self._Client.PagingConcurrency)
+
+        async def getPage(pageMsg:SpotifyApiMessage) -> dict:
+            async with semaphore:
+                await self.MakeRequest('GET', pageMsg)
+            pageData = pageMsg.ResponseData
+            if (pageRootKey is not None) and isinstance(pageData, dict):
+                pageData = pageData.get(pageRootKey, None)
+            return pageData or {}
+
+        if len(pageMsgs) > 0:
+            _logsi.LogVerbose("Retrieving %d additional pages of items (concurrency=%d, total=%d, limitTotal=%d)" % (len(pageMsgs), self._Client.PagingConcurrency, total, limitTotal))
+            result.extend(await asyncio.gather(*[getPage(pageMsg) for pageMsg in pageMsgs]))
+        return result
+
+
+    async def _PlayerCommand(
+        self,
+        apiMethodName:str,
+        method:str,
+        uri:str,
+        urlParms:dict,
+        deviceId:str,
+        delay:float,
+        activateDevice:bool,
+        sonosCommand,
+        isConfirmed:Callable=None,
+        ) -> None:
+        """
+        Issues a player command to the specified Spotify Connect device.
+
+        Args:
+            apiMethodName (str):
+                Name of the calling method.
+            method (str):
+                The HTTP method of the Spotify Web API request (e.g. "PUT", "POST").
+            uri (str):
+                The Spotify Web API player endpoint uri (e.g. "/me/player/pause").
+            urlParms (dict):
+                Request parameters for the Spotify Web API request; the `device_id` parameter
+                is added by this method.
+            deviceId (str | SpotifyConnectDevice) | None):
+                The target player device identifier.
+            delay (float):
+                Time delay (in seconds) to wait AFTER issuing the command to the player.
+            activateDevice (bool):
+                True to activate the device if necessary; otherwise, False.
+            sonosCommand (Callable):
+                A method to call with the SoCo player instance (in the default executor) if
+                the resolved device is a Sonos device.
+            isConfirmed (Callable):
+                Method that is called with a `PlayerPlayState` object, and returns True if the 
+                player reports the state that is expected after the command (see the `_WaitForPlayerState`
+                method); or null to always wait for the delay.
+        """
+        # resolve the device object from the device id.
+        # this can block (e.g. Zeroconf / Sonos device activation), so run it in the default executor.
+        scDevice:SpotifyConnectDevice = await asyncio.to_thread(self._Client._ResolveDeviceObject, deviceId, activateDevice)
+
+        # are spotify web player credentials configured? if so, then we will use them to create
+        # an elevated authorization access token for the Spotify Web API endpoint call.
+        accessTokenHeaderValue:str = await asyncio.to_thread(self._Client._GetSpotifyWebPlayerTokenHeaderValue, scDevice)
+
+        # is this an active Sonos device?
+        # Sonos device can still be active, even if there is no active device in Spotify playstate.
+        if (scDevice is not None) and (scDevice.IsSonos) and (accessTokenHeaderValue is None):
+
+            _logsi.LogVerbose("Issuing command to Sonos device %s: %s" % (scDevice.Title, apiMethodName))
+            sonosPlayer:SoCo = await asyncio.to_thread(self._Client.SpotifyConnectDirectory.GetSonosPlayer, scDevice)
+            await asyncio.to_thread(sonosCommand, sonosPlayer)
+
+        else:
+
+            # was the deviceId resolved?
+            # if not, then raise an exception as the Spotify Web API request will fail anyway.
+            self._Client._CheckForDeviceNotFound(scDevice, deviceId)
+
+            # build spotify web api request parameters.
+            if (scDevice is not None):
+                urlParms['device_id'] = (scDevice.DeviceIdActivated or scDevice.Id)
+
+            # execute spotify web api request.
+            msg:SpotifyApiMessage = SpotifyApiMessage(apiMethodName, uri)
+            msg.RequestHeaders[self.AuthToken.HeaderKey] = accessTokenHeaderValue or self.AuthToken.HeaderValue
+            msg.UrlParameters = urlParms
+            await self.MakeRequest(method, msg)
+
+        # give spotify web api time to process the change (or until the player confirms it).
+        await self._WaitForPlayerState(delay, isConfirmed, scDevice, accessTokenHeaderValue)
+
+
+    async def _WaitForPlayerState(
+        self,
+        delay:float,
+        isConfirmed:Callable=None,
+        scDevice:SpotifyConnectDevice=None,
+        accessTokenHeaderValue:str=None,
+        ) -> bool:
+        """
+        Gives the player time to process a command, by waiting for the specified delay or (if the
+        `SpotifyClient.PlayerCommandConfirm` property is enabled) until the player reports the 
+        expected state.
+
+        Please refer to the `SpotifyClient._WaitForPlayerState` method for argument details.
+
+        The delay is awaited on the event loop; player state polling uses the `SpotifyClient` 
+        method, which is run in the default executor.
+        """
+        if (delay is None) or (delay <= 0):
+            return False
+
+        # is confirmation enabled (and supported by the command)? if so, then poll the player state.
+        if (self._Client.PlayerCommandConfirm) and (isConfirmed is not None):
+            return await asyncio.to_thread(self._Client._WaitForPlayerState, delay, isConfirmed, scDevice, accessTokenHeaderValue)
+
+        isSonos:bool = (scDevice is not None) and (scDevice.IsSonos) and (accessTokenHeaderValue is None)
+        _logsi.LogVerbose((TRACE_MSG_DELAY_DEVICE_SONOS if isSonos else TRACE_MSG_DELAY_DEVICE) % delay)
+        await asyncio.sleep(delay)
+        return False
+
+
+    async def _GetCatalogObject(
+        self,
+        apiMethodName:str,
+        uri:str,
+        market:str,
+        resultType:type,
+        ) -> object:
+        """
+        Retrieves a single catalog object (e.g. track, album, artist, etc) and converts it
+        to the specified model type.
+        """
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("uri", uri)
+            apiMethodParms.AppendKeyValue("market", market)
+            _logsi.LogMethodParmList(SILevel.Verbose, "Get Spotify catalog information for a single object", apiMethodParms)
+
+            # build spotify web api request parameters.
+            urlParms:dict = {}
+            if market is not None:
+                urlParms['market'] = market
+
+            # execute spotify web api request.
+            msg:SpotifyApiMessage = SpotifyApiMessage(apiMethodName, uri)
+            msg.RequestHeaders[self.AuthToken.HeaderKey] = self.AuthToken.HeaderValue
+            msg.UrlParameters = urlParms
+            await self.MakeRequest('GET', msg)
+
+            # process results.
+            result = resultType(root=msg.ResponseData)
+
+            # trace.
+            _logsi.LogObject(SILevel.Verbose, TRACE_METHOD_RESULT_TYPE % (apiMethodName, type(result).__name__), result, excludeNonPublic=True)
+            return result
+
+        except SpotifyApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiAuthenticationError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+
+            # format unhandled exception.
+            raise SpotifyApiError(SAAppMessages.UNHANDLED_EXCEPTION.format(apiMethodName, str(ex)), ex, logsi=_logsi)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    async def Close(self) -> None:
+        """
+        Closes the aiohttp client session (if it was created by this instance).
+
+        The underlying `SpotifyClient` instance is not disposed.
+        """
+        if (self._Session is not None) and (self._IsSessionOwned) and (not self._Session.closed):
+            await self._Session.close()
+        self._Session = None
+
+
+    async def MakeRequest(
+        self,
+        method:str,
+        msg:SpotifyApiMessage
+        ) -> int:
+        """
+        Performs a generic Spotify Web API request asynchronously.
+
+        Args:
+            method (str):
+                The preferred HTTP method (e.g. "GET", "POST", etc).
+            msg (SpotifyApiMessage):
+                The api message object that contains input parameters and the
+                output response.
+
+        Returns:
+            The status code (integer).
+
+        Raises:
+            SpotifyWebApiError:
+                If an error occurs while requesting content.
+
+        This method follows the same rules as the `SpotifyClient.MakeRequest` method, and
+        uses the same response cache, conditional request store and response error checks.
+        """
+        apiMethodName:str = 'MakeRequest'
+        apiMethodParms:SIMethodParmListContext = None
+        client:SpotifyClient = self._Client
+
+        try:
+
+            # trace.
+            _logsi.EnterMethod(SILevel.Debug, apiMethodName)
+
+            # validation.
+            if method is None or msg is None or (not isinstance(msg,SpotifyApiMessage)):
+                _logsi.LogVerbose("msg argument was not a valid SpotifyApiMessage instance")
+                return 400
+
+            # trace.
+            apiMethodParms = SIMethodParmListContext(apiMethodName)
+            apiMethodParms.AppendKeyValue("method", method)
+            apiMethodParms.AppendKeyValue("msg.Uri", msg.Uri)
+            apiMethodParms.AppendKeyValue("msg.UrlParameters", msg.UrlParameters)
+            apiMethodParms.AppendKeyValue("msg.RequestData", msg.RequestData)
+            apiMethodParms.AppendKeyValue("msg.RequestJson", msg.RequestJson)
+            _logsi.LogMethodParmList(SILevel.Verbose, "Making async HTTPS request to the Spotify Web API", apiMethodParms)
+
+            # is this a cacheable catalog object request?  if so, then check the response cache first.
+            cacheKey, cacheTtl, cacheData = client._GetResponseCacheEntry(method, msg)
+            if cacheData is not None:
+                _logsi.LogVerbose("AsyncSpotifyClient http request: '%s' (served from response cache)" % (cacheKey))
+                msg.ResponseData = cacheData
+                return 200
+
+            # formulate the request url.
+            url:str = client._GetRequestUrl(msg)
+
+            # is the authorization token expired?  if so, then refresh it via the client.
+            # the oauth2 token methods are blocking, so run them in the default executor.
+            if (client.AuthToken is not None) and (client.AuthToken.IsExpired):
+                await asyncio.to_thread(client._RenewAuthToken, msg)
+
+            # is this a conditional request candidate?  if so, then add validators from the previous response (if any).
+            requestHeaders, conditionalKey, conditionalEntry = client._GetConditionalRequestHeaders(method, url, msg)
+
+            # add querystring parameters to url.
+            if msg.HasUrlParameters:
+                urlParmSep:str = '&' if (url.find('?') > 0) else '?'
+                url = url + urlParmSep + urlencode(msg.UrlParameters)
+
+            # build request body.
+            headers:dict = dict(requestHeaders)
+            body:bytes = None
+            if (not msg.HasUrlParameters) and (msg.HasRequestData):
+                if msg.IsRequestDataEncoded:
+                    body = msg.RequestData
+                else:
+                    body = urlencode(msg.RequestData)
+                    if not ("content-type" in map(str.lower, headers.keys())):
+                        headers["Content-Type"] = "application/x-www-form-urlencoded"
+            elif msg.HasRequestJson:
+                if not ("content-type" in map(str.lower, headers.keys())):
+                    headers["Content-Type"] = "application/json"
+                body = json.dumps(msg.RequestJson, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+            # are spotify web api requests rate limited?  if so, then player requests take priority.
+            rateLimiter, rateLimiterPriority = client._GetRequestRateLimiter(url, msg)
+
+            # request retry loop for failed requests that are temporary in nature (504 Gateway Timeout, etc).
+            loopTotalDelay:float = 0
+            LOOP_DELAY:float = 0.200
+            LOOP_TIMEOUT:float = 1.000
+            session:aiohttp.ClientSession = self._GetSession()
+            while True:
+
+                # wait for a request token without blocking the event loop; if the wait would be
+                # too long, then fail the request immediately (with the time remaining).
+                if (rateLimiter is not None):
+                    rateLimitTotalWait:float = 0
+                    while True:
+                        rateLimitWait:float = rateLimiter.TryAcquire(rateLimiterPriority)
+                        if (rateLimitWait <= 0):
+                            break
+                        if (rateLimitTotalWait + rateLimitWait) > rateLimiter.MaxWait:
+                            exObj = SpotifyWebApiError(429, SAAppMessages.MSG_SPOTIFY_WEB_API_RATE_LIMITED % (rateLimitWait), msg.MethodName, 'Too Many Requests', logsi=_logsi)
+                            exObj.RetryAfter = math.ceil(rateLimitWait)
+                            raise exObj
+                        await asyncio.sleep(rateLimitWait)
+                        rateLimitTotalWait = rateLimitTotalWait + rateLimitWait
+
+                async with session.request(method, url, data=body, headers=headers, allow_redirects=True) as resp:
+                    data:bytes = await resp.read()
+                    response:HTTPResponse = HTTPResponse(
+                        body=data,
+                        headers=dict(resp.headers),
+                        status=resp.status,
+                        reason=resp.reason,
+                        preload_content=True,
+                        request_url=str(resp.url),
+                        )
+
+                # check for temporary server responses that should be retried.
+                if (not client._IsTemporaryResponse(response)):
+                    break
+
+                # only retry so many times before we give up;
+                if (loopTotalDelay >= LOOP_TIMEOUT):
+                    raise SpotifyApiError(SAAppMessages.MSG_SPOTIFY_WEB_API_RETRY_TIMEOUT % (loopTotalDelay), None, logsi=_logsi)
+
+                # wait just a bit between requests.
+                _logsi.LogVerbose(SAAppMessages.MSG_SPOTIFY_WEB_API_RETRY_RESPONSE_STATUS % (response.status, response.reason), colorValue=SIColors.Red)
+                _logsi.LogVerbose(SAAppMessages.MSG_SPOTIFY_WEB_API_RETRY_REQUEST_DELAY % (LOOP_DELAY))
+                await asyncio.sleep(LOOP_DELAY)
+                loopTotalDelay = loopTotalDelay + LOOP_DELAY
+
+            # process the response (rate limits, conditional responses, errors, caches).
+            return client._ProcessResponse(msg, response, rateLimiter, cacheKey, cacheTtl, conditionalKey, conditionalEntry)
+
+        except SpotifyApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiAuthenticationError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+
+            # format unhandled exception.
+            raise SpotifyApiError(SAAppMessages.UNHANDLED_EXCEPTION.format(apiMethodName, str(ex)), ex, logsi=_logsi)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    async def GetAlbum(
+        self,
+        albumId:str,
+        market:str=None,
+        ) -> Album:
+        """
+        Get Spotify catalog information for a single album.
+
+        Please refer to the `SpotifyClient.GetAlbum` method for argument details; note that
+        the `albumId` argument is required (the currently playing album is not used).
+        """
+        market = self._Client._ValidateMarket(market)
+        return await self._GetCatalogObject('GetAlbum', '/albums/{id}'.format(id=albumId), market, Album)
+
+
+    async def GetArtist(
+        self,
+        artistId:str,
+        ) -> Artist:
+        """
+        Get Spotify catalog information for a single artist identified by their unique Spotify ID.
+
+        Please refer to the `SpotifyClient.GetArtist` method for argument details; note that
+        the `artistId` argument is required (the currently playing artist is not used).
+        """
+        return await self._GetCatalogObject('GetArtist', '/artists/{id}'.format(id=artistId), None, Artist)
+
+
+    async def GetAudiobook(
+        self,
+        audiobookId:str,
+        market:str=None,
+        ) -> Audiobook:
+        """
+        Get Spotify catalog information for a single audiobook.
+
+        Please refer to the `SpotifyClient.GetAudiobook` method for argument details; note that
+        the `audiobookId` argument is required (the currently playing audiobook is not used).
+        """
+        market = self._Client._ValidateMarket(market)
+        return await self._GetCatalogObject('GetAudiobook', '/audiobooks/{id}'.format(id=audiobookId), market, Audiobook)
+
+
+    async def GetChapter(
+        self,
+        chapterId:str,
+        market:str=None,
+        ) -> Chapter:
+        """
+        Get Spotify catalog information for a single audiobook chapter.
+
+        Please refer to the `SpotifyClient.GetChapter` method for argument details; note that
+        the `chapterId` argument is required (the currently playing chapter is not used).
+        """
+        market = self._Client._ValidateMarket(market)
+        return await self._GetCatalogObject('GetChapter', '/chapters/{id}'.format(id=chapterId), market, Chapter)
+
+
+    async def GetEpisode(
+        self,
+        episodeId:str,
+        market:str=None,
+        ) -> Episode:
+        """
+        Get Spotify catalog information for a single episode.
+
+        Please refer to the `SpotifyClient.GetEpisode` method for argument details; note that
+        the `episodeId` argument is required (the currently playing episode is not used).
+        """
+        market = self._Client._ValidateMarket(market)
+        return await self._GetCatalogObject('GetEpisode', '/episodes/{id}'.format(id=episodeId), market, Episode)
+
+
+    async def GetShow(
+        self,
+        showId:str,
+        market:str=None,
+        ) -> Show:
+        """
+        Get Spotify catalog information for a single show.
+
+        Please refer to the `SpotifyClient.GetShow` method for argument details; note that
+        the `showId` argument is required (the currently playing show is not used).
+        """
+        market = self._Client._ValidateMarket(market)
+        return await self._GetCatalogObject('GetShow', '/shows/{id}'.format(id=showId), market, Show)
+
+
+    async def GetTrack(
+        self,
+        trackId:str,
+        market:str=None,
+        ) -> Track:
+        """
+        Get Spotify catalog information for a single track.
+
+        Please refer to the `SpotifyClient.GetTrack` method for argument details; note that
+        the `trackId` argument is required (the currently playing track is not used).
+        """
+        market = self._Client._ValidateMarket(market, forceReturnValue=True)
+        return await self._GetCatalogObject('GetTrack', '/tracks/{id}'.format(id=trackId), market, Track)
+
+
+    async def GetPlayerPlaybackState(
+        self,
+        market:str=None,
+        additionalTypes:str=None,
+        ) -> PlayerPlayState:
+        """
+        Get information about the user's current playback state, including track or episode, progress,
+        and active device.
+
+        This method requires the `user-read-playback-state` scope.
+
+        Please refer to the `SpotifyClient.GetPlayerPlaybackState` method for argument details.
+
+        Returns:
+            A `PlayerPlayState` object that contains the playback state details.
+        """
+        apiMethodName:str = 'GetPlayerPlaybackState'
+        apiMethodParms:SIMethodParmListContext = None
+        result:PlayerPlayState = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("market", market)
+            apiMethodParms.AppendKeyValue("additionalTypes", additionalTypes)
+            _logsi.LogMethodParmList(SILevel.Verbose, "Get the user's current playback state", apiMethodParms)
+
+            # ensure market was either supplied or implied; default if neither.
+            market = self._Client._ValidateMarket(market, forceReturnValue=True)
+
+            # build spotify web api request parameters.
+            urlParms:dict = {}
+            if market is not None:
+                urlParms['market'] = market
+            if additionalTypes is not None:
+                urlParms['additional_types'] = additionalTypes
+
+            # execute spotify web api request.
+            msg:SpotifyApiMessage = SpotifyApiMessage(apiMethodName, '/me/player')
+            msg.RequestHeaders[self.AuthToken.HeaderKey] = self.AuthToken.HeaderValue
+            msg.UrlParameters = urlParms
+            await self.MakeRequest('GET', msg)
+
+            # process results.
+            result = PlayerPlayState(root=msg.ResponseData)
+
+            # is this an episode?  if so, then determine the item type (e.g. podcast or audiobook).
+            if (not result.IsEmpty) and (result.Item is not None):
+                result.ItemType = SpotifyClient.GetTypeFromUri(result.Item.Uri)
+                if (result.CurrentlyPlayingType == SpotifyMediaTypes.EPISODE.value):
+                    uriId:str = SpotifyClient.GetIdFromUri(result.Item.Uri)
+                    if (await self.IsChapterEpisode(uriId)):
+                        result.ItemType = SpotifyMediaTypes.AUDIOBOOK.value
+                    else:
+                        result.ItemType = SpotifyMediaTypes.PODCAST.value
+
+            # trace.
+            _logsi.LogObject(SILevel.Verbose, TRACE_METHOD_RESULT_TYPE % (apiMethodName, type(result).__name__), result, excludeNonPublic=True)
+            return result
+
+        except SpotifyApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiAuthenticationError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+
+            # format unhandled exception.
+            raise SpotifyApiError(SAAppMessages.UNHANDLED_EXCEPTION.format(apiMethodName, str(ex)), ex, logsi=_logsi)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    async def GetPlaylistItems(
+        self,
+        playlistId:str,
+        limit:int=50,
+        offset:int=0,
+        market:str=None,
+        fields:str=None,
+        additionalTypes:str=None,
+        limitTotal:int=None,
+        ) -> PlaylistPage:
+        """
+        Get full details of the items of a playlist owned by a Spotify user.
+
+        This method requires the `playlist-read-private` scope.
+
+        Please refer to the `SpotifyClient.GetPlaylistItems` method for argument details; note
+        that the `playlistId` argument is required (the currently playing playlist is not used).
+
+        Returns:
+            A `PlaylistPage` object that contains playlist information.
+        """
+        apiMethodName:str = 'GetPlaylistItems'
+        apiMethodParms:SIMethodParmListContext = None
+        result:PlaylistPage = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("playlistId", playlistId)
+            apiMethodParms.AppendKeyValue("limit", limit)
+            apiMethodParms.AppendKeyValue("offset", offset)
+            apiMethodParms.AppendKeyValue("market", market)
+            apiMethodParms.AppendKeyValue("fields", fields)
+            apiMethodParms.AppendKeyValue("additionalTypes", additionalTypes)
+            apiMethodParms.AppendKeyValue("limitTotal", limitTotal)
+            _logsi.LogMethodParmList(SILevel.Verbose, "Get playlist items", apiMethodParms)
+
+            # validations.
+            if limit is None:
+                limit = 50
+            if offset is None:
+                offset = 0
+            if not isinstance(limitTotal, int):
+                limitTotal = 0
+            if (playlistId is None) or (len(playlistId.strip()) == 0):
+                raise SpotifyApiError(SAAppMessages.ARGUMENT_REQUIRED_ERROR % (apiMethodName, 'playlistId'), logsi=_logsi)
+
+            # are we auto-paging?  if so, then use max limit.
+            if limitTotal > 0:
+                limit = 50
+                if limit > limitTotal:
+                    limit = limitTotal
+
+            # ensure market was either supplied or implied; default if neither.
+            market = self._Client._ValidateMarket(market)
+
+            # build spotify web api request parameters.
+            urlParms:dict = \
+            {
+                'limit': limit,
+                'offset': offset,
+            }
+            if market is not None:
+                urlParms['market'] = market
+            if fields is not None:
+                urlParms['fields'] = fields
+            if additionalTypes is not None:
+                urlParms['additional_types'] = additionalTypes
+
+            # execute spotify web api request(s).
+            msg:SpotifyApiMessage = SpotifyApiMessage(apiMethodName, '/playlists/{id}/items'.format(id=playlistId))
+            msg.RequestHeaders[self.AuthToken.HeaderKey] = self.AuthToken.HeaderValue
+            msg.UrlParameters = urlParms
+            pages:list[dict] = await self._GetPagesWithOffset(msg, limitTotal)
+
+            # process results.
+            result = PlaylistPage(root=pages[0])
+            if (limitTotal > 0):
+                for pageData in pages[1:]:
+                    pageObj:PlaylistPage = PlaylistPage(root=pageData)
+                    _logsi.LogObject(SILevel.Verbose, (TRACE_METHOD_RESULT_TYPE_PAGE + pageObj.PagingInfo) % (apiMethodName, type(pageObj).__name__), pageObj, excludeNonPublic=True)
+                    result.Items.extend(pageObj.Items)
+                del result.Items[limitTotal:]
+                result.Limit = result.ItemsCount
+                result.DateLastRefreshed = datetime.utcnow().timestamp()
+
+            # trace.
+            _logsi.LogObject(SILevel.Verbose, (TRACE_METHOD_RESULT_TYPE + result.PagingInfo) % (apiMethodName, type(result).__name__), result, excludeNonPublic=True)
+            return result
+
+        except SpotifyApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiAuthenticationError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+
+            # format unhandled exception.
+            raise SpotifyApiError(SAAppMessages.UNHANDLED_EXCEPTION.format(apiMethodName, str(ex)), ex, logsi=_logsi)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    async def GetTrackFavorites(
+        self,
+        limit:int=20,
+        offset:int=0,
+        market:str=None,
+        limitTotal:int=None,
+        sortResult:bool=True,
+        ) -> TrackPageSaved:
+        """
+        Get a list of the tracks saved in the current Spotify user's 'Your Library'.
+
+        This method requires the `user-library-read` scope.
+
+        Please refer to the `SpotifyClient.GetTrackFavorites` method for argument details.
+
+        Returns:
+            An `TrackPageSaved` object that contains saved track information.
+        """
+        apiMethodName:str = 'GetTrackFavorites'
+        apiMethodParms:SIMethodParmListContext = None
+        result:TrackPageSaved = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("limit", limit)
+            apiMethodParms.AppendKeyValue("offset", offset)
+            apiMethodParms.AppendKeyValue("market", market)
+            apiMethodParms.AppendKeyValue("limitTotal", limitTotal)
+            apiMethodParms.AppendKeyValue("sortResult", sortResult)
+            _logsi.LogMethodParmList(SILevel.Verbose, "Get a list of the users track favorites", apiMethodParms)
+
+            # validations.
+            if limit is None:
+                limit = 20
+            if offset is None:
+                offset = 0
+            if not isinstance(limitTotal, int):
+                limitTotal = 0
+            if sortResult is None:
+                sortResult = True
+
+            # are we auto-paging?  if so, then use max limit.
+            if limitTotal > 0:
+                limit = 50
+                if limit > limitTotal:
+                    limit = limitTotal
+
+            # ensure we have a market value, in order to return track relinking (e.g. `linked_from`) data.
+            market = self._Client._ValidateMarket(market, forceReturnValue=True)
+
+            # build spotify web api request parameters.
+            urlParms:dict = \
+            {
+                'limit': limit,
+                'offset': offset,
+            }
+            if market is not None:
+                urlParms['market'] = market
+
+            # execute spotify web api request(s).
+            msg:SpotifyApiMessage = SpotifyApiMessage(apiMethodName, '/me/tracks')
+            msg.RequestHeaders[self.AuthToken.HeaderKey] = self.AuthToken.HeaderValue
+            msg.UrlParameters = urlParms
+            pages:list[dict] = await self._GetPagesWithOffset(msg, limitTotal)
+
+            # was limit total argument specified?
+            if (limitTotal <= 0):
+
+                # no - just return the initial page of results.
+                result = TrackPageSaved(root=pages[0])
+
+            else:
+
+                # append pages of items to final results.
+                # sometimes spotify api returns items with no information; discard these!
+                result = TrackPageSaved()
+                for pageData in pages:
+                    pageObj:TrackPageSaved = TrackPageSaved(root=pageData)
+                    _logsi.LogObject(SILevel.Verbose, (TRACE_METHOD_RESULT_TYPE_PAGE + pageObj.PagingInfo) % (apiMethodName, type(pageObj).__name__), pageObj, excludeNonPublic=True)
+                    result.Total = pageObj.Total
+                    item:TrackSaved
+                    for item in pageObj.Items:
+                        if (item.Track is not None) and (item.Track.Uri is not None):
+                            result.Items.append(item)
+                del result.Items[limitTotal:]
+                result.Limit = result.ItemsCount
+                result.DateLastRefreshed = datetime.utcnow().timestamp()
+
+                # sort result items.
+                if (sortResult is True):
+                    result.Items.sort(key=lambda x: (x.Track.Name or "").lower(), reverse=False)
+                else:
+                    result.Items.sort(key=lambda x: (x.AddedAt or "").lower(), reverse=True)
+
+            # trace.
+            _logsi.LogObject(SILevel.Verbose, (TRACE_METHOD_RESULT_TYPE + result.PagingInfo) % (apiMethodName, type(result).__name__), result, excludeNonPublic=True)
+            return result
+
+        except SpotifyApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiAuthenticationError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+
+            # format unhandled exception.
+            raise SpotifyApiError(SAAppMessages.UNHANDLED_EXCEPTION.format(apiMethodName, str(ex)), ex, logsi=_logsi)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    async def IsChapterEpisode(
+        self,
+        episodeId:str,
+        market:str=None,
+        ) -> bool:
+        """
+        Returns true if the specified episode id is an audiobook chapter; otherwise, false.
+
+        Please refer to the `SpotifyClient.IsChapterEpisode` method for argument details; note
+        that the `episodeId` argument is required (the currently playing episode is not used).
+
+        Classifications are shared with the underlying `SpotifyClient` instance, and follow the 
+        same rules: only definitive results (a chapter, or a `400` / `404` status) are remembered.
+        """
+        # has the id already been classified?  if so, then we are done.
+        isChapter:bool = self._Client._GetEpisodeClassification(episodeId)
+        if isChapter is not None:
+            return isChapter
+
+        try:
+            chapter:Chapter = await self.GetChapter(episodeId, market)
+            result:bool = (chapter.Id is not None)
+            isDefinitive:bool = result
+        except SpotifyWebApiError as ex:
+            # only a "bad request" or "not found" response tells us it's not a chapter.
+            result:bool = False
+            isDefinitive:bool = (ex.Status in (400, 404))
+        except Exception:
+            # at this point we can safely assume it's NOT an audiobook chapter (for now).
+            result:bool = False
+            isDefinitive:bool = False
+
+        # remember definitive classifications so we don't have to ask again.
+        # classifications are saved to the configuration data file, so run it in the default executor.
+        if isDefinitive:
+            await asyncio.to_thread(self._Client._SetEpisodeClassifications, [episodeId], result)
+        return result
+
+
+    async def PlayerMediaPause(
+        self,
+        deviceId:str=None,
+        delay:float=0.50
+        ) -> None:
+        """
+        Pause media play for the specified Spotify Connect device.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerMediaPause` method for argument details.
+        """
+        delay = validateDelay(delay, 0.50, 10)
+        await self._PlayerCommand('PlayerMediaPause', 'PUT', '/me/player/pause', {}, deviceId, delay, False,
+                                  lambda sonosPlayer: sonosPlayer.pause(),
+                                  lambda playerState: playerState.IsPlaying == False)
+
+
+    async def PlayerMediaPlayContext(
+        self,
+        contextUri:str,
+        offsetUri:str=None,
+        offsetPosition:int=None,
+        positionMS:int=0,
+        deviceId:str=None,
+        delay:float=0.50,
+        resolveDeviceId:bool=True,
+        shuffle:bool=None,
+        playShowLatestEpisode:bool=None,
+        ) -> None:
+        """
+        Start playing one or more tracks of the specified context on a Spotify Connect device.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerMediaPlayContext` method for argument details.
+
+        Starting play is a multi-step operation (device activation, shuffle / play state checks, 
+        Sonos local queue loading, etc), so the `SpotifyClient` method is run in the default executor.
+        """
+        await asyncio.to_thread(self._Client.PlayerMediaPlayContext, contextUri, offsetUri, offsetPosition, positionMS,
+                                deviceId, delay, resolveDeviceId, shuffle, playShowLatestEpisode)
+
+
+    async def PlayerMediaPlayTrackFavorites(
+        self,
+        deviceId:str=None,
+        shuffle:bool=None,
+        delay:float=0.50,
+        resolveDeviceId:bool=True,
+        limitTotal:int=200,
+        filterArtist:str=None,
+        filterAlbum:str=None,
+        ) -> None:
+        """
+        Get a list of the tracks saved in the current Spotify user's 'Your Library'
+        and starts playing them.
+
+        This method requires the `user-library-read` and `user-modify-playback-state` scopes.
+
+        Please refer to the `SpotifyClient.PlayerMediaPlayTrackFavorites` method for argument details.
+
+        Starting play is a multi-step operation, so the `SpotifyClient` method is run in the default executor.
+        """
+        await asyncio.to_thread(self._Client.PlayerMediaPlayTrackFavorites, deviceId, shuffle, delay, resolveDeviceId,
+                                limitTotal, filterArtist, filterAlbum)
+
+
+    async def PlayerMediaPlayTracks(
+        self,
+        uris:list[str],
+        positionMS:int=0,
+        deviceId:str=None,
+        delay:float=0.50,
+        resolveDeviceId:bool=True,
+        shuffle:bool=None,
+        ) -> None:
+        """
+        Start playing one or more tracks on the specified Spotify Connect device.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerMediaPlayTracks` method for argument details.
+
+        Starting play is a multi-step operation, so the `SpotifyClient` method is run in the default executor.
+        """
+        await asyncio.to_thread(self._Client.PlayerMediaPlayTracks, uris, positionMS, deviceId, delay, resolveDeviceId, shuffle)
+
+
+    async def PlayerMediaResume(
+        self,
+        deviceId:str=None,
+        delay:float=0.50
+        ) -> None:
+        """
+        Resume media play for the specified Spotify Connect device.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerMediaResume` method for argument details.
+        """
+        delay = validateDelay(delay, 0.50, 10)
+        await self._PlayerCommand('PlayerMediaResume', 'PUT', '/me/player/play', {}, deviceId, delay, True,
+                                  lambda sonosPlayer: sonosPlayer.play(),
+                                  lambda playerState: playerState.IsPlaying == True)
+
+
+    async def PlayerMediaSeek(
+        self,
+        positionMS:int=0,
+        deviceId:str=None,
+        delay:float=0.50
+        ) -> None:
+        """
+        Seeks to the given absolute position in the user's currently playing track
+        for the specified Spotify Connect device.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerMediaSeek` method for argument details; note
+        that relative seeking is not supported.
+        """
+        delay = validateDelay(delay, 0.50, 10)
+        if (positionMS is None) or (positionMS < 0):
+            positionMS = 0
+        sonosPosition:str = mediaPositionHMS_fromSeconds(positionMS / 1000)
+        await self._PlayerCommand('PlayerMediaSeek', 'PUT', '/me/player/seek', {'position_ms': positionMS}, deviceId, delay, False,
+                                  lambda sonosPlayer: sonosPlayer.seek(str(sonosPosition)),
+                                  lambda playerState: (positionMS - 1000) <= (playerState.ProgressMS or 0) <= (positionMS + 3000))
+
+
+    async def PlayerMediaSkipNext(
+        self,
+        deviceId:str=None,
+        delay:float=0.50
+        ) -> None:
+        """
+        Skips to next track in the user's queue for the specified Spotify Connect device.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerMediaSkipNext` method for argument details.
+        """
+        delay = validateDelay(delay, 0.50, 10)
+
+        # get the currently playing item (from cache), so that the change can be confirmed if requested.
+        itemUriBefore:str = None
+        if (self._Client.PlayerCommandConfirm):
+            playerStateBefore:PlayerPlayState = await asyncio.to_thread(self._Client.GetPlayerPlaybackState, refresh=False)
+            itemUriBefore = playerStateBefore.Item.Uri if (playerStateBefore.Item is not None) else None
+
+        await self._PlayerCommand('PlayerMediaSkipNext', 'POST', '/me/player/next', {}, deviceId, delay, False,
+                                  lambda sonosPlayer: sonosPlayer.next(),
+                                  lambda playerState: ((playerState.Item is not None) and (playerState.Item.Uri != itemUriBefore)) if (itemUriBefore is not None) else ((playerState.ProgressMS or 0) < 3000))
+
+
+    async def PlayerMediaSkipPrevious(
+        self,
+        deviceId:str=None,
+        delay:float=0.50
+        ) -> None:
+        """
+        Skips to previous track in the user's queue for the specified Spotify Connect device.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerMediaSkipPrevious` method for argument details.
+        """
+        delay = validateDelay(delay, 0.50, 10)
+        await self._PlayerCommand('PlayerMediaSkipPrevious', 'POST', '/me/player/previous', {}, deviceId, delay, False,
+                                  lambda sonosPlayer: sonosPlayer.previous(),
+                                  lambda playerState: (playerState.ProgressMS or 0) < 3000)
+
+
+    async def PlayerSetRepeatMode(
+        self,
+        state:str='off',
+        deviceId:str=None,
+        delay:float=0.50
+        ) -> None:
+        """
+        Set repeat mode for the specified Spotify Connect device.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerSetRepeatMode` method for argument details.
+
+        Sonos devices require the current play mode to be read before it is changed, and the
+        `PlayerCommandConfirm` option polls the player state, so the `SpotifyClient` method is 
+        run in the default executor.
+        """
+        await asyncio.to_thread(self._Client.PlayerSetRepeatMode, state, deviceId, delay)
+
+
+    async def PlayerSetShuffleMode(
+        self,
+        state:bool=False,
+        deviceId:str=None,
+        delay:float=0.50
+        ) -> None:
+        """
+        Set shuffle mode for the specified Spotify Connect device.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerSetShuffleMode` method for argument details.
+
+        Sonos devices require the current play mode to be read before it is changed, and the
+        `PlayerCommandConfirm` option polls the player state, so the `SpotifyClient` method is 
+        run in the default executor.
+        """
+        await asyncio.to_thread(self._Client.PlayerSetShuffleMode, state, deviceId, delay)
+
+
+    async def PlayerSetVolume(
+        self,
+        volumePercent:int,
+        deviceId:str=None,
+        delay:float=0.50
+        ) -> None:
+        """
+        Set the volume for the user's current playback device.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerSetVolume` method for argument details.
+        """
+        delay = validateDelay(delay, 0.50, 10)
+
+        def sonosCommand(sonosPlayer:SoCo) -> None:
+            sonosPlayer.volume = volumePercent
+
+        await self._PlayerCommand('PlayerSetVolume', 'PUT', '/me/player/volume', {'volume_percent': volumePercent}, deviceId, delay, False,
+                                  sonosCommand,
+                                  lambda playerState: (playerState.Device is not None) and (playerState.Device.VolumePercent == volumePercent))
+
+
+    async def PlayerTransferPlayback(
+        self,
+        deviceId:str=None,
+        play:bool=True,
+        delay:float=0.50,
+        refreshDeviceList:bool=True,
+        forceActivateDevice:bool=True,
+        deviceIdFrom:str=None,
+        ) -> SpotifyConnectDevice:
+        """
+        Transfer playback to a new Spotify Connect device and optionally begin playback.
+
+        This method requires the `user-modify-playback-state` scope.
+
+        Please refer to the `SpotifyClient.PlayerTransferPlayback` method for argument details.
+
+        Transferring playback relies on Spotify Connect device discovery and activation (Zeroconf,
+        Chromecast, Sonos), so the `SpotifyClient` method is run in the default executor.
+        """
+        return await asyncio.to_thread(self._Client.PlayerTransferPlayback, deviceId, play, delay, refreshDeviceList,
+                                       forceActivateDevice, deviceIdFrom)
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'AsyncSpotifyClient:'
+        msg = "%s\n Session=%s" % (msg, "open" if (self._Session is not None) and (not self._Session.closed) else "closed")
+        msg = "%s\n %s" % (msg, self._Client.ToString())
+        return msg
@@ -1,5 +1,6 @@
 # external package imports.
 from abc import abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 import copy
 from datetime import datetime
 import hashlib
@@ -11,6 +12,7 @@ import socket
 from soco import SoCo
 import threading
 import time
+from typing import Callable
 from uuid import UUID
 from zeroconf import Zeroconf, ServiceBrowser
 
@@ -50,6 +52,47 @@ if (_logsi == None):
     _logsi = SIAuto.Si.AddSession(__name__, True)
 _logsi.SystemLogger = logging.getLogger(__name__)
 
+GETINFO_CACHE_TTL:float = 300.0
+"""
+Time (in seconds) that Spotify Connect device information (`getInfo` result) is re-used for
+a device that is re-discovered with the same host and TXT record (300).
+"""
+
+GETINFO_DEVICEID_ERROR:str = "getInfoError"
+"""
+Device id assigned to a Spotify Connect device whose device information could not be retrieved.
+"""
+
+GETINFO_DEVICEID_PENDING:str = "getInfoPending"
+"""
+Device id assigned to a Spotify Connect device whose device information is being retrieved.
+"""
+
+GETINFO_MAX_WORKERS:int = 4
+"""
+Maximum number of Spotify Connect device information (`getInfo`) requests that are processed
+concurrently (4).
+"""
+
+GETINFO_RETRY_DELAY:float = 5.0
+"""
+Time (in seconds) to wait before retrying a failed Spotify Connect device information (`getInfo`)
+request (5); the delay doubles with each consecutive failure, up to `GETINFO_RETRY_DELAY_MAX`.
+"""
+
+GETINFO_RETRY_DELAY_MAX:float = 300.0
+"""
+Maximum time (in seconds) to wait before retrying a failed Spotify Connect device information
+(`getInfo`) request (300).
+"""
+
+INITIAL_DISCOVERY_QUIET_PERIOD:float = 1.0
+"""
+Time (in seconds) that Zeroconf discovery must be quiet (no service notifications being processed,
+and no pending device information requests) before initial discovery is considered complete (1).
+This covers the response delay (up to 500ms) that mDNS responders apply to browse queries.
+"""
+
 
 class SpotifyConnectDirectoryTask(threading.Thread):
     """
@@ -87,7 +130,9 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         time to process initial Zeroconf service information changes prior to setting the 
         `WaitForInitComplete` event as complete.  This gives the directory thread task 
         time to discover all of the Spotify Connect devices currently attached to the 
-        local network.
+        local network.  Initial discovery completes sooner if discovery has been quiet
+        for `INITIAL_DISCOVERY_QUIET_PERIOD` seconds (no service notifications being processed,
+        and no pending device information requests); the timeout is the upper bound.
         """
         # invoke base class method.
         super().__init__()
@@ -110,15 +155,29 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         self._CastAppTasks:dict[str, SpotifyConnectZeroconfCastAppTask] = {}
         self._CastBrowser:CastBrowser = None
         self._CastMultiZoneControllers:dict[str, MultizoneController] = {}
+        self._CastMultiZoneControllerListeners:dict[str, SpotifyConnectZeroconfCastMultiZoneControllerListener] = {}
         self._CastMultiZoneManager:MultizoneManager = None
         self._CastMultiZoneManagerListeners:dict[str, MultiZoneManagerListener] = {}
+        self._DevicesChangedIds:set[int] = set()
+        self._DevicesSnapshot:SpotifyConnectDevices = SpotifyConnectDevices()
+        self._DevicesSnapshotItems:dict[int, tuple[SpotifyConnectDevice, SpotifyConnectDevice]] = {}
+        self._DevicesVersion:int = 0
+        self._GetInfoCache:dict[tuple, tuple[float, ZeroconfGetInfo, str]] = {}
+        self._GetInfoExecutor:ThreadPoolExecutor = None
+        self._GetInfoFailures:dict[tuple, tuple[int, float, str]] = {}
+        self._GetInfoProbes:dict[str, Future] = {}
+        self._DiscoveryActivityTime:float = time.monotonic()
+        self._InitialDiscoveryFuture:Future = Future()
         self._InitialDiscoveryTimeout = initialDiscoveryTimeout
+        self._IsDevicesChanged:bool = False
         self._IsStopRequested:bool = False
         self._SonosPlayers:dict = {}
         self._SpotifyClientInstance = spotifyClientInstance
         self._SpotifyConnectBrowser:ServiceBrowser = None
         self._SpotifyConnectDevices:SpotifyConnectDevices = SpotifyConnectDevices()
         self._SpotifyConnectDevices_RLock = threading.RLock()   # re-entrant lock to sync access to devices collection.
+        self._StopEvent = threading.Event()   # posted when the task has been asked to stop.
+        self._DiscoveryCondition = threading.Condition(self._SpotifyConnectDevices_RLock)   # notified when discovery activity occurs.
         self._ZeroconfInstance:Zeroconf = zeroconfInstance
         self._Zeroconf_RLock = threading.RLock()   # re-entrant lock to sync access to zeroconf service state changes.
 
@@ -168,10 +227,22 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         self.WaitForTransferComplete.set()      # indicate transfer is complete (initial state).
       
 
+    @property
+    def InitialDiscoveryFuture(self) -> Future:
+        """ 
+        Future that is resolved when the task has been initialized (the same time the
+        `WaitForInitComplete` event is posted).
+
+        The result is the `SpotifyConnectDevices` collection of devices that were discovered 
+        during initial discovery.  Use `asyncio.wrap_future` to await it from asyncio code.
+        """
+        return self._InitialDiscoveryFuture
+
+
     @property
     def InitialDiscoveryTimeout(self) -> float:
         """ 
-        Time to wait (in seconds) after starting the Zeroconf discovery thread
+        Maximum time to wait (in seconds) after starting the Zeroconf discovery thread
         tasks before marking the directory task initialization as complete.  
         """
         return self._InitialDiscoveryTimeout
@@ -191,6 +262,12 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         """
         if isinstance(value, bool):
             self._IsStopRequested = value
+            if (value):
+                self._StopEvent.set()
+                with self._DiscoveryCondition:
+                    self._DiscoveryCondition.notify_all()
+            else:
+                self._StopEvent.clear()
 
 
     @property
@@ -210,6 +287,15 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         return self._CastBrowser
 
 
+    @property
+    def DevicesVersion(self) -> int:
+        """
+        Version number of the devices snapshot returned by `GetDevices`; the value is
+        incremented each time a changed snapshot is published.
+        """
+        return self._DevicesVersion
+
+
     @property
     def IsZeroconDiscoveryEnabled(self) -> bool:
         """ 
@@ -251,7 +337,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
             _logsi.LogThread(SILevel.Debug, "%s - Thread information" % (self.name), self)
 
             # refresh dynamic device list.
-            self.RefreshDynamicDevices()
+            self._RefreshDynamicDevices()
 
             # is zeroconf discovery enabled?
             if (not self.IsZeroconDiscoveryEnabled):
@@ -290,7 +376,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 self._CastBrowser.start_discovery()
 
                 # give child Zeroconf discovery threads time to process initial service information discovery.
-                time.sleep(self._InitialDiscoveryTimeout)
+                self._WaitForInitialDiscovery()
 
             # trace - dump devices discovered initially.
             if (_logsi.IsOn(SILevel.Verbose)):
@@ -315,25 +401,12 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                         _logsi.LogVerbose("Spotify Connect device: %s [%s]%s" % (scDevice.Title, scDevice.DiscoveryResult.Description, isActive))
 
             # indicate we are ready for commands.
-            self.WaitForInitComplete.set()
+            self._SetInitComplete()
 
-            # event loop.
+            # keep going until we are asked to stop.
             # note that the directory task must be kept running in order to control Chromecast devices!
-            while True:
-
-                try:
-                
-                    # keep going until we are asked to stop.
-                    if (self.IsStopRequested):
-                        _logsi.LogVerbose("%s - Thread task stop requested" % (self.name))
-                        break
-                    time.sleep(0.50)
-
-                except Exception as ex:
-
-                    # trace.
-                    _logsi.LogException("%s - Exception: %s" % (str(ex)), ex, logToSystemLogger=False)
-                    # ignore exceptions, as we can't do anything about them.
+            self._StopEvent.wait()
+            _logsi.LogVerbose("%s - Thread task stop requested" % (self.name))
 
             # at this point we have been requested to stop;
             # loop through all active cast app tasks and unregister handlers.
@@ -358,7 +431,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
             # ignore exceptions, since we are shutting down.
             
             # indicate we are ready for commands.
-            self.WaitForInitComplete.set()
+            self._SetInitComplete(ex)
 
         finally:
 
@@ -393,6 +466,23 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 _logsi.LogException("%s - An unhandled exception occured while stopping Spotify Connect Zeroconf discovery browser: %s" % (self.name, str(ex)), ex, logToSystemLogger=False)
                 # ignore exceptions, since we are shutting down.
 
+            try:
+
+                # stop spotify connect device information worker pool; pending requests are discarded.
+                with self._SpotifyConnectDevices_RLock:
+                    executor:ThreadPoolExecutor = self._GetInfoExecutor
+                    self._GetInfoExecutor = None
+                    self._GetInfoProbes.clear()
+                if (executor is not None):
+                    _logsi.LogVerbose("%s - Stopping Spotify Connect device information worker pool" % (self.name))
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+            except Exception as ex:
+
+                # trace.
+                _logsi.LogException("%s - An unhandled exception occured while stopping Spotify Connect device information worker pool: %s" % (self.name, str(ex)), ex, logToSystemLogger=False)
+                # ignore exceptions, since we are shutting down.
+
             try:
 
                 # stop chromecast zeroconf discovery browser.
@@ -408,6 +498,575 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 # ignore exceptions, since we are shutting down.
 
 
+    def _AddSpotifyConnectDevice(
+        self,
+        scDevice:SpotifyConnectDevice,
+        sonosPlayer:SoCo=None,
+        isUpdate:bool=False,
+        ) -> None:
+        """
+        Adds a Spotify Connect Zeroconf device (with device information) to the devices collection,
+        and raises the `DeviceAdded` (or `DeviceUpdated`) event.
+
+        Args:
+            scDevice (SpotifyConnectDevice):
+                Spotify Connect device to add.
+            sonosPlayer (SoCo):
+                Sonos Controller instance for the device if one was already created; otherwise, 
+                null to create one if the device is a Sonos device.
+            isUpdate (bool):
+                True to raise the `DeviceUpdated` event (e.g. the device entry was already announced
+                with default device information); otherwise, False to raise the `DeviceAdded` event.
+
+        This method must be called while holding the `_SpotifyConnectDevices_RLock` lock.
+        """
+        # did this device change from a dynamic device (e.g. non-zeroconf) to a zeroconf device?
+        # this can happen if the device is initially added as a dynamic device, then the zeroconf
+        # device is discovered.  if so, we will remove the dynamic device entry.
+        spDynamicDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.GetDeviceById(scDevice.DeviceInfo.DeviceId)
+        if (spDynamicDevice is not None):
+
+            # trace.
+            _logsi.LogVerbose("Spotify Connect Zeroconf is converting SpotifyConnectDevice entry %s from dynamic to zeroconf" % (spDynamicDevice.Title))
+
+            # copy real-time status dynamic properties to zerconf object.
+            scDevice.IsActiveDevice = spDynamicDevice.IsActiveDevice
+            scDevice.IsInDeviceList = spDynamicDevice.IsInDeviceList
+
+            # at this point we will remove the device from the collection so that it can be
+            # replaced with the static device entry; this will also remove any duplicate
+            # device id entries, which can appear for some manufacturers when devices are 
+            # grouped, zoned, or stereo paired (e.g. Bose).
+            dynamicOnly:bool = True
+            if (scDevice.DiscoveryResult.IsDynamicDevice == False) and (spDynamicDevice.DiscoveryResult.IsDynamicDevice == False):
+                dynamicOnly = False
+            self.RemoveDevice(spDynamicDevice.Id, dynamicDeviceOnly=dynamicOnly)
+
+        # add new Spotify Connect Device to devices collection (sorted by device name).
+        self._SpotifyConnectDevices.AddSorted(scDevice)
+        self._SpotifyConnectDevices.DateLastRefreshed = datetime.utcnow().timestamp()
+
+        # trace.
+        _logsi.LogObject(SILevel.Verbose, "Spotify Connect Zeroconf %s SpotifyConnectDevices collection entry: \"%s\" (%s)" % ("updated" if isUpdate else "added", scDevice.Name, scDevice.DiscoveryResult.Name), scDevice, excludeNonPublic=True, colorValue=SIColors.ForestGreen)
+        _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DeviceInfo / getInfo)" % (scDevice.Title), scDevice.DeviceInfo, excludeNonPublic=True)
+        _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DiscoveryResult) [%s]" % (scDevice.Title, scDevice.DiscoveryResult.HostIpTitle), scDevice.DiscoveryResult, excludeNonPublic=True)
+
+        self._SetDeviceChanged(scDevice)
+
+        # is this a Sonos device?  if so, then add the Sonos Controller instance to the Sonos players 
+        # collection.  use device ip address as the key, as the Spotify Web API reports "id=null" 
+        # for restricted devices in playerstate!
+        if (scDevice.IsSonos):
+            hostIpAddress:str = scDevice.DiscoveryResult.HostIpAddress
+            if (sonosPlayer is None):
+                sonosPlayer = self._SonosPlayers.get(hostIpAddress, None)
+            if (sonosPlayer is None):
+                sonosPlayer = self._CreateSonosPlayer(hostIpAddress, scDevice.Title)
+            if (sonosPlayer is not None):
+                self._SonosPlayers[hostIpAddress] = sonosPlayer
+
+        # raise event.
+        if (isUpdate):
+            self._RaiseDeviceUpdated(scDevice)
+        else:
+            self._RaiseDeviceAdded(scDevice)
+
+
+    def _CreateSonosPlayer(
+        self,
+        hostIpAddress:str,
+        title:str,
+        ) -> SoCo:
+        """
+        Creates a Sonos Controller instance for a device, and retrieves the Sonos speaker information.
+
+        Args:
+            hostIpAddress (str):
+                IP address of the Sonos device.
+            title (str):
+                Device title, used for tracing.
+
+        Returns:
+            A `SoCo` instance, or null if the instance could not be created.
+
+        This method makes blocking network calls, and should not be called while holding the 
+        `_SpotifyConnectDevices_RLock` lock if it can be avoided.
+        """
+        try:
+
+            # trace.
+            _logsi.LogVerbose("Sonos device detected; creating Sonos Controller instance for device: %s (ip=%s)" % (title, hostIpAddress))
+
+            # create a Sonos Controller instance for the device, and retrieve the Sonos speaker information.
+            sonosPlayer:SoCo = SoCo(hostIpAddress)
+
+            try:
+                sonosPlayer.get_speaker_info()
+            except Exception as ex:
+                _logsi.LogException("Could not get speaker info for Sonos Controller instance: %s" % (str(ex)), ex, logToSystemLogger=False)
+
+            # trace.
+            if (_logsi.IsOn(SILevel.Verbose)):
+                _logsi.LogObject(SILevel.Verbose, "Sonos Controller instance for device: %s" % (title), sonosPlayer)
+                _logsi.LogDictionary(SILevel.Verbose, "Sonos Controller instance for device: %s (speaker_info)" % (title), sonosPlayer.speaker_info)
+                _logsi.LogObject(SILevel.Verbose, "Sonos Controller instance for device: %s (group)" % (title), sonosPlayer.group)
+                _logsi.LogObject(SILevel.Verbose, "Sonos Controller instance for device: %s (zone_group_state)" % (title), sonosPlayer.zone_group_state)
+                _logsi.LogEnumerable(SILevel.Verbose, "Sonos Controller instance for device: %s (all_zones)" % (title), sonosPlayer.all_zones)
+
+            return sonosPlayer
+
+        except Exception as ex:
+
+            # trace.
+            _logsi.LogException("%s - Could not create Sonos Control API reference: %s" % (self.name, str(ex)), ex, logToSystemLogger=False)
+
+            # ignore exceptions, as there is nothing we can do at this point.
+            return None
+
+
+    @staticmethod
+    def _GetDeviceInformationPlaceholder(
+        zeroconfDiscoveryResult:ZeroconfDiscoveryResult,
+        deviceId:str,
+        statusString:str,
+        ) -> ZeroconfGetInfo:
+        """
+        Returns default device information for a Spotify Connect Zeroconf device whose device 
+        information is not (yet) available.
+
+        Args:
+            zeroconfDiscoveryResult (ZeroconfDiscoveryResult):
+                Zeroconf discovery details of the device.
+            deviceId (str):
+                Device id to assign (`GETINFO_DEVICEID_PENDING` or `GETINFO_DEVICEID_ERROR`).
+            statusString (str):
+                Status text to assign (e.g. the reason the device information is not available).
+        """
+        deviceInfo:ZeroconfGetInfo = ZeroconfGetInfo()
+        deviceInfo.DeviceId = deviceId
+        deviceInfo.RemoteName = zeroconfDiscoveryResult.DeviceName
+        deviceInfo.ResponseSource = "spotifywebapiPython"
+        deviceInfo.Status = 9999
+        deviceInfo.StatusString = statusString
+        return deviceInfo
+
+
+    def _GetDeviceSnapshot(
+        self,
+        scDevice:SpotifyConnectDevice,
+        ) -> SpotifyConnectDevice:
+        """
+        Returns the published snapshot entry of a master device entry.
+
+        Args:
+            scDevice (SpotifyConnectDevice):
+                Master device entry from the devices collection.
+
+        Returns:
+            The snapshot entry that corresponds to the master device entry; otherwise, a
+            copy of the master device entry if it is not part of the devices collection.
+        """
+        # syncronize access via lock, as we are accessing the collection.
+        with self._SpotifyConnectDevices_RLock:
+
+            self._PublishDevices()
+            entry:tuple = self._DevicesSnapshotItems.get(id(scDevice), None)
+            if (entry is not None) and (entry[0] is scDevice):
+                return entry[1]
+            return copy.deepcopy(scDevice)
+
+
+    @staticmethod
+    def _GetInfoCacheKey(
+        zeroconfDiscoveryResult:ZeroconfDiscoveryResult,
+        ) -> tuple:
+        """
+        Returns the key used to cache Spotify Connect device information (`getInfo` results) and 
+        failures for a device (host address, port, server name, and TXT record properties).
+
+        Args:
+            zeroconfDiscoveryResult (ZeroconfDiscoveryResult):
+                Zeroconf discovery details of the device.
+        """
+        return (
+            zeroconfDiscoveryResult.HostIpAddress,
+            zeroconfDiscoveryResult.HostIpPort,
+            zeroconfDiscoveryResult.Server,
+            tuple((prop.Name, prop.Value) for prop in (zeroconfDiscoveryResult.Properties or [])),
+        )
+
+
+    def _GetInfoProbeExecutor(self) -> ThreadPoolExecutor:
+        """
+        Returns the worker pool used to retrieve Spotify Connect device information, creating
+        it if needed.
+
+        This method must be called while holding the `_SpotifyConnectDevices_RLock` lock.
+        """
+        if self._GetInfoExecutor is None:
+            self._GetInfoExecutor = ThreadPoolExecutor(max_workers=GETINFO_MAX_WORKERS, thread_name_prefix='SpotifyConnectGetInfo')
+        return self._GetInfoExecutor
+
+
+    def _GetInfoProbeTask(
+        self,
+        zeroconfDiscoveryResult:ZeroconfDiscoveryResult,
+        cacheKey:tuple,
+        ) -> None:
+        """
+        Retrieves Spotify Connect device information for a device; runs on the getInfo worker pool.
+
+        Args:
+            zeroconfDiscoveryResult (ZeroconfDiscoveryResult):
+                Zeroconf discovery details of the device.
+            cacheKey (tuple):
+                Cache key of the device, as returned by `_GetInfoCacheKey`.
+
+        The `getInfo` request is made by ip address first; if that fails, then it is retried by DNS 
+        server alias.  The devices collection is only locked to store the result.
+        """
+        deviceInfo:ZeroconfGetInfo = None
+        resolvedIpAddress:str = None
+        sonosPlayer:SoCo = None
+        statusString:str = None
+
+        try:
+
+            # trace.
+            _logsi.LogVerbose("Retrieving Spotify Connect device information: %s" % (zeroconfDiscoveryResult.Id))
+
+            # create connection object to retrieve spotify connect device information (via direct ip address).
+            zconn:ZeroconfConnect = ZeroconfConnect(
+                zeroconfDiscoveryResult.HostIpAddress,
+                zeroconfDiscoveryResult.HostIpPort,
+                zeroconfDiscoveryResult.SpotifyConnectCPath,
+                zeroconfDiscoveryResult.SpotifyConnectVersion,
+                useSSL=False,
+                tokenStorageDir=self.SpotifyClientInstance.TokenStorageDir,
+                tokenStorageFile=self.SpotifyClientInstance.TokenStorageFile
+            )
+
+            # retrieve initial spotify connect device information (by ip address).
+            deviceInfo = zconn.GetInformation()
+
+        except Exception as ex:
+
+            # trace.
+            _logsi.LogVerbose("Could not retrieve Spotify Connect device information by ip address; retrying with DNS server alias \"%s\"" % (zeroconfDiscoveryResult.Server))
+
+            try:
+
+                # *IMPORTANT* This call can take up to 20 seconds to timeout because it is using DNS
+                # resolution to find the device.  the timeout is a system-level value, so it cannot be
+                # controlled by this api!
+            
+                # create connection object to retrieve spotify connect device information (via dns alias).
+                zconn:ZeroconfConnect = ZeroconfConnect(
+                    zeroconfDiscoveryResult.Server,
+                    zeroconfDiscoveryResult.HostIpPort,
+                    zeroconfDiscoveryResult.SpotifyConnectCPath,
+                    zeroconfDiscoveryResult.SpotifyConnectVersion,
+                    useSSL=False,
+                    tokenStorageDir=self.SpotifyClientInstance.TokenStorageDir,
+                    tokenStorageFile=self.SpotifyClientInstance.TokenStorageFile
+                )
+
+                # retrieve initial spotify connect device information (by dns alias).
+                deviceInfo = zconn.GetInformation()
+
+                # resolve the dns alias, so that the HostIpAddress in discovery result can be updated.
+                _logsi.LogVerbose("Spotify Connect Zeroconf GetInformation call for Instance Name \"%s\" (%s) was resolved using DNS Server alias; HostIpAddress will be updated with the resolved ip address" % (zeroconfDiscoveryResult.DeviceName, zeroconfDiscoveryResult.Server))
+                resolvedIpAddress = socket.gethostbyname(zeroconfDiscoveryResult.Server)
+
+            except Exception as ex:
+
+                # trace.
+                _logsi.LogException("Spotify Connect Zeroconf GetInformation call failed for device instance \"%s\" (ip=%s:%s): %s" % (zeroconfDiscoveryResult.DeviceName, zeroconfDiscoveryResult.HostIpAddress, zeroconfDiscoveryResult.HostIpPort, str(ex)), ex, logToSystemLogger=False)
+                deviceInfo = None
+                statusString = str(ex)
+
+        # is this a Sonos device?  if so, then create the Sonos Controller instance now, as it
+        # also makes blocking network calls.
+        if (deviceInfo is not None) and (deviceInfo.IsBrandSonos) and (not self.IsStopRequested):
+            hostIpAddress:str = resolvedIpAddress or zeroconfDiscoveryResult.HostIpAddress
+            if (hostIpAddress not in self._SonosPlayers):
+                sonosPlayer = self._CreateSonosPlayer(hostIpAddress, deviceInfo.RemoteName)
+
+        self._OnGetInfoProbeCompleted(zeroconfDiscoveryResult, cacheKey, deviceInfo, resolvedIpAddress, sonosPlayer, statusString)
+
+
+    def _OnGetInfoProbeCompleted(
+        self,
+        zeroconfDiscoveryResult:ZeroconfDiscoveryResult,
+        cacheKey:tuple,
+        deviceInfo:ZeroconfGetInfo,
+        resolvedIpAddress:str,
+        sonosPlayer:SoCo,
+        statusString:str,
+        ) -> None:
+        """
+        Stores the result of a Spotify Connect device information request, and fills in the device
+        entry that was waiting for it.
+
+        Args:
+            zeroconfDiscoveryResult (ZeroconfDiscoveryResult):
+                Zeroconf discovery details of the device.
+            cacheKey (tuple):
+                Cache key of the device, as returned by `_GetInfoCacheKey`.
+            deviceInfo (ZeroconfGetInfo):
+                Device information that was retrieved, or null if the request failed.
+            resolvedIpAddress (str):
+                IP address the DNS server alias resolved to, or null if the ip address was used.
+            sonosPlayer (SoCo):
+                Sonos Controller instance that was created for the device, or null.
+            statusString (str):
+                Reason the request failed, or null if the request succeeded.
+        """
+        # syncronize access via lock, as we are accessing the collection.
+        with self._SpotifyConnectDevices_RLock:
+
+            try:
+
+                self._GetInfoProbes.pop(zeroconfDiscoveryResult.Name, None)
+                self._DiscoveryCondition.notify_all()
+
+                # cache the result; failures are retried after a delay that doubles with each consecutive failure.
+                if (deviceInfo is not None):
+                    self._GetInfoCache[cacheKey] = (time.monotonic(), deviceInfo, resolvedIpAddress)
+                    self._GetInfoFailures.pop(cacheKey, None)
+                else:
+                    failureCount:int = self._GetInfoFailures.get(cacheKey, (0, 0, None))[0] + 1
+                    retryDelay:float = min(GETINFO_RETRY_DELAY * (2 ** min(failureCount - 1, 16)), GETINFO_RETRY_DELAY_MAX)
+                    self._GetInfoFailures[cacheKey] = (failureCount, time.monotonic() + retryDelay, statusString)
+                    _logsi.LogVerbose("Spotify Connect device information retrieval failed %d time(s) for device \"%s\"; next retry in %s seconds" % (failureCount, zeroconfDiscoveryResult.DeviceName, retryDelay))
+
+                if (self.IsStopRequested):
+                    return
+
+                # was the device removed while the request was pending?
+                idx:int = self._SpotifyConnectDevices.GetDeviceIndexByDiscoveryName(zeroconfDiscoveryResult.Name)
+                if (idx == -1):
+                    _logsi.LogVerbose("SpotifyConnectDevice instance was removed before its device information was retrieved: \"%s\" (%s)" % (zeroconfDiscoveryResult.DeviceName, zeroconfDiscoveryResult.Name))
+                    return
+
+                # was this a retry that failed again?  if so, then just update the failure reason.
+                scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.Items[idx]
+                isUpdate:bool = (scDevice.DeviceInfo.DeviceId != GETINFO_DEVICEID_PENDING)
+                if (deviceInfo is None) and (isUpdate):
+                    scDevice.DeviceInfo.StatusString = statusString
+                    self._SetDeviceChanged(scDevice)
+                    return
+
+                # remove the device entry while its device information is filled in, so that it is not
+                # mistaken for a dynamic device entry with the same device id; it is re-added (sorted 
+                # by its new name) afterwards.
+                self._SpotifyConnectDevices.Items.pop(idx)
+                self._SetDeviceChanged()
+                if (deviceInfo is not None):
+                    self._SetDeviceInformation(scDevice, copy.deepcopy(deviceInfo), resolvedIpAddress)
+                else:
+                    scDevice.DeviceInfo = self._GetDeviceInformationPlaceholder(scDevice.DiscoveryResult, GETINFO_DEVICEID_ERROR, statusString)
+                    scDevice.Id = scDevice.DeviceInfo.DeviceId
+                    scDevice.Name = scDevice.DeviceInfo.RemoteName
+                self._AddSpotifyConnectDevice(scDevice, sonosPlayer, isUpdate)
+
+            except Exception as ex:
+
+                # trace.
+                _logsi.LogException("%s - Exception: %s" % (self.name, str(ex)), ex, logToSystemLogger=False)
+            
+                # ignore exceptions, as there is nothing we can do at this point.
+
+
+    def _PublishDevices(self) -> SpotifyConnectDevices:
+        """
+        Publishes a new devices snapshot if the master devices collection has changed
+        since the last snapshot was published.
+
+        Returns:
+            The current devices snapshot.
+
+        Snapshots are never modified once they are published, so readers can use them
+        without locking or copying.  Snapshot entries of unchanged devices are re-used
+        from the previous snapshot; only new or changed devices are copied.  Placeholder
+        entries whose getInfo request is still pending are not published.
+        """
+        # syncronize access via lock, as we are accessing the collection.
+        with self._SpotifyConnectDevices_RLock:
+
+            if (not self._IsDevicesChanged):
+                return self._DevicesSnapshot
+
+            # build the snapshot in the same order as the master devices collection.
+            snapshotItems:dict[int, tuple[SpotifyConnectDevice, SpotifyConnectDevice]] = {}
+            snapshot:SpotifyConnectDevices = SpotifyConnectDevices()
+            for scDevice in self._SpotifyConnectDevices.Items:
+                if (scDevice.DeviceInfo is not None) and (scDevice.DeviceInfo.DeviceId == GETINFO_DEVICEID_PENDING):
+                    continue
+                key:int = id(scDevice)
+                entry:tuple = self._DevicesSnapshotItems.get(key, None)
+                if (entry is None) or (entry[0] is not scDevice) or (key in self._DevicesChangedIds):
+                    entry = (scDevice, copy.deepcopy(scDevice))
+                snapshotItems[key] = entry
+                snapshot.Items.append(entry[1])
+            snapshot.DateLastRefreshed = self._SpotifyConnectDevices.DateLastRefreshed
+
+            # swap in the new snapshot; readers that already hold the old one are unaffected.
+            self._DevicesSnapshotItems = snapshotItems
+            self._DevicesChangedIds.clear()
+            self._IsDevicesChanged = False
+            self._DevicesVersion += 1
+            self._DevicesSnapshot = snapshot
+            return snapshot
+
+
+    def _SetDeviceChanged(
+        self,
+        scDevice:SpotifyConnectDevice=None,
+        ) -> None:
+        """
+        Indicates that the master devices collection has changed, and that a new devices
+        snapshot must be published.
+
+        Args:
+            scDevice (SpotifyConnectDevice):
+                Master device entry that was modified; otherwise, null if only the collection
+                itself was modified (e.g. entries added, removed, or sorted).
+        """
+        # syncronize access via lock, as we are accessing the collection.
+        with self._SpotifyConnectDevices_RLock:
+
+            if (scDevice is not None):
+                self._DevicesChangedIds.add(id(scDevice))
+            self._IsDevicesChanged = True
+
+            # device names / ids may have changed, so lookup indexes must be rebuilt.
+            self._SpotifyConnectDevices.RefreshIndexes()
+
+
+    def _SetDevicesChangedFromSnapshot(
+        self,
+        selector:Callable[[SpotifyConnectDevice], object],
+        ) -> None:
+        """
+        Marks master device entries as changed if the selected value differs from the value
+        of the published snapshot entry.
+
+        Args:
+            selector (Callable):
+                Function that returns the value(s) to compare for a device entry.
+        """
+        # syncronize access via lock, as we are accessing the collection.
+        with self._SpotifyConnectDevices_RLock:
+
+            for scDevice in self._SpotifyConnectDevices.Items:
+                entry:tuple = self._DevicesSnapshotItems.get(id(scDevice), None)
+                if (entry is None) or (entry[0] is not scDevice) or (selector(entry[1]) != selector(scDevice)):
+                    self._SetDeviceChanged(scDevice)
+
+
+    def _SetDeviceInformation(
+        self,
+        scDevice:SpotifyConnectDevice,
+        deviceInfo:ZeroconfGetInfo,
+        resolvedIpAddress:str,
+        ) -> None:
+        """
+        Sets the device information (`getInfo` result) of a Spotify Connect Zeroconf device,
+        along with the device id and name.
+
+        Args:
+            scDevice (SpotifyConnectDevice):
+                Spotify Connect device to update.
+            deviceInfo (ZeroconfGetInfo):
+                Device information that was retrieved for the device.
+            resolvedIpAddress (str):
+                IP address the DNS server alias resolved to, or null if the ip address was used.
+        """
+        scDevice.DeviceInfo = deviceInfo
+        scDevice.Id = scDevice.DeviceInfo.DeviceId
+        scDevice.Name = scDevice.DeviceInfo.RemoteName
+
+        # if remote name was not specified, then set device name to first alias name.
+        # note that we will not reset the RemoteName, as the "" value indicates an alias is in use.
+        if ((scDevice.DeviceInfo.RemoteName + "").strip() == ""):
+            if (scDevice.DeviceInfo.HasAliases):
+                _logsi.LogVerbose("Spotify Connect Zeroconf GetInformation alias name will be utilized for Zeroconf Discovery Result: \"%s\" (%s)" % (scDevice.DiscoveryResult.DeviceName, scDevice.DiscoveryResult.Name))
+                scDevice.Name = scDevice.DeviceInfo.Aliases[0].Name
+
+        # update HostIpAddress in discovery result so it knows to use the dns alias
+        # instead of the ip address.
+        if (resolvedIpAddress is not None):
+            scDevice.DiscoveryResult.HostIpAddress = resolvedIpAddress
+
+
+    def _SetDiscoveryActivity(self) -> None:
+        """
+        Notes that discovery activity occured (e.g. a service notification was processed, or
+        a device information request completed), and wakes up the initial discovery wait.
+        """
+        with self._DiscoveryCondition:
+            self._DiscoveryActivityTime = time.monotonic()
+            self._DiscoveryCondition.notify_all()
+
+
+    def _SetInitComplete(
+        self,
+        ex:Exception=None,
+        ) -> None:
+        """
+        Posts the `WaitForInitComplete` event, and resolves the `InitialDiscoveryFuture`.
+
+        Args:
+            ex (Exception):
+                Exception that ended the task before initialization completed, or null if
+                initialization completed normally.
+        """
+        if (not self._InitialDiscoveryFuture.done()):
+            if (ex is not None):
+                self._InitialDiscoveryFuture.set_exception(ex)
+            else:
+                self._InitialDiscoveryFuture.set_result(self.GetDevices())
+        self.WaitForInitComplete.set()
+
+
+    def _SubmitGetInfoProbe(
+        self,
+        zeroconfDiscoveryResult:ZeroconfDiscoveryResult,
+        ) -> bool:
+        """
+        Submits a Spotify Connect device information (`getInfo`) request for a device to the 
+        getInfo worker pool, unless one is already pending or a previous request failed within
+        the retry delay.
+
+        Args:
+            zeroconfDiscoveryResult (ZeroconfDiscoveryResult):
+                Zeroconf discovery details of the device.
+
+        Returns:
+            True if a request is pending for the device; otherwise, False.
+        """
+        # syncronize access via lock, as we are accessing the collection.
+        with self._SpotifyConnectDevices_RLock:
+
+            if (zeroconfDiscoveryResult.Name in self._GetInfoProbes):
+                return True
+            if (self.IsStopRequested):
+                return False
+
+            # did a previous request fail within the retry delay?
+            cacheKey:tuple = self._GetInfoCacheKey(zeroconfDiscoveryResult)
+            failure:tuple = self._GetInfoFailures.get(cacheKey, None)
+            if (failure is not None) and (time.monotonic() < failure[1]):
+                return False
+
+            # trace.
+            _logsi.LogVerbose("Submitting Spotify Connect device information request (%d pending): %s" % (len(self._GetInfoProbes), zeroconfDiscoveryResult.Id))
+
+            self._GetInfoProbes[zeroconfDiscoveryResult.Name] = self._GetInfoProbeExecutor().submit(self._GetInfoProbeTask, zeroconfDiscoveryResult, cacheKey)
+            return True
+
+
     def _TraceMultizoneGroupMembers(
         self,
         group_uuid:str,
@@ -484,6 +1143,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                     # remove inactive multizone controller listener.
                     castMultizoneController.tear_down()
                     self._CastMultiZoneControllers.pop(str(castDevice.uuid), None)
+                    self._CastMultiZoneControllerListeners.pop(str(castDevice.uuid), None)
                     castMultizoneController = None
 
                 # is multizone controller still registered?
@@ -495,9 +1155,11 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                     # add cast device to multizone controller instance.  
                     # this will add a listener for multizone status events to be processed.
                     castMultizoneController = MultizoneController(castDevice.uuid)
-                    castMultizoneController.register_listener(SpotifyConnectZeroconfCastMultiZoneControllerListener(self, self._ZeroconfInstance, self._Zeroconf_RLock, castMultizoneController, castDevice))
+                    castMultizoneControllerListener = SpotifyConnectZeroconfCastMultiZoneControllerListener(self, self._ZeroconfInstance, self._Zeroconf_RLock, castMultizoneController, castDevice)
+                    castMultizoneController.register_listener(castMultizoneControllerListener)
                     castDevice.register_handler(castMultizoneController)
                     self._CastMultiZoneControllers[str(castDevice.uuid)] = castMultizoneController
+                    self._CastMultiZoneControllerListeners[str(castDevice.uuid)] = castMultizoneControllerListener
 
                     # request an initial status update.
                     castMultizoneController.update_members()
@@ -509,6 +1171,55 @@ class SpotifyConnectDirectoryTask(threading.Thread):
             # ignore exception, as nothing can be done about it.
 
 
+    def _WaitForInitialDiscovery(self) -> None:
+        """
+        Waits for initial Zeroconf discovery to settle.
+
+        Initial discovery is complete once discovery has been quiet for `INITIAL_DISCOVERY_QUIET_PERIOD`
+        seconds: no service notifications were processed or are being processed (the `_Zeroconf_RLock`
+        is held while they are), and no device information requests are pending.  The `InitialDiscoveryTimeout`
+        value is the upper bound.
+        """
+        timeStart:float = time.monotonic()
+        timeDeadline:float = timeStart + self._InitialDiscoveryTimeout
+        reason:str = "timeout"
+
+        # syncronize access via lock, as we are accessing the collection.
+        with self._DiscoveryCondition:
+
+            # the quiet period starts no sooner than now.
+            self._DiscoveryActivityTime = max(self._DiscoveryActivityTime, timeStart)
+
+            while (not self.IsStopRequested):
+
+                timeNow:float = time.monotonic()
+                if (timeNow >= timeDeadline):
+                    break
+
+                # has discovery been quiet long enough?
+                timeQuiet:float = self._DiscoveryActivityTime + INITIAL_DISCOVERY_QUIET_PERIOD
+                if (len(self._GetInfoProbes) == 0) and (timeNow >= timeQuiet):
+
+                    # is a service notification being processed?  if not, then we are done;
+                    # otherwise, check again shortly (its activity resets the quiet period).
+                    if (self._Zeroconf_RLock.acquire(blocking=False)):
+                        self._Zeroconf_RLock.release()
+                        reason = "quiet"
+                        break
+                    timeQuiet = timeNow + 0.1
+
+                # wait for discovery activity, the end of the quiet period, or the deadline.
+                # note that pending device information requests notify us when they complete.
+                timeWait:float = timeDeadline if (len(self._GetInfoProbes) > 0) else min(timeQuiet, timeDeadline)
+                self._DiscoveryCondition.wait(timeWait - timeNow)
+
+            if (self.IsStopRequested):
+                reason = "stop requested"
+
+        # trace.
+        _logsi.LogVerbose("%s - Initial discovery completed after %.3f seconds (%s; %d devices, %d device information requests pending)" % (self.name, time.monotonic() - timeStart, reason, len(self._SpotifyConnectDevices), len(self._GetInfoProbes)))
+
+
     def ActivateCastAppSpotify(
         self,
         deviceName:str,
@@ -585,6 +1296,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
 
                 # match was found; reset device id activated before we activate a device.
                 scDevice.DeviceIdActivated = None
+                self._SetDeviceChanged(scDevice)
 
             # is this a chromecast device?
             if (not scDevice.IsChromeCast):
@@ -636,6 +1348,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
 
                 # reset device zeroconf response, as we are re-using an existing object.
                 scDevice.ZeroconfResponseInfo = ZeroconfResponse()
+                self._SetDeviceChanged(scDevice)
 
             castDevice:Chromecast = None
             deviceWaitTimeoutSecs:float = 20.0
@@ -668,8 +1381,14 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                     # status, which will then update the members list via event listener callbacks.
                     castMultizoneController:MultizoneController = self._CastMultiZoneControllers.get(str(castInfo.uuid), None)
                     if (castMultizoneController) and (castMultizoneController._socket_client):
+
+                        # give controller some time to update member list (until the multizone status is received).
+                        castMultizoneControllerListener:SpotifyConnectZeroconfCastMultiZoneControllerListener = self._CastMultiZoneControllerListeners.get(str(castInfo.uuid), None)
+                        if (castMultizoneControllerListener is not None):
+                            castMultizoneControllerListener.WaitForStatusReceived.clear()
                         castMultizoneController.update_members()
-                        time.sleep(2.0)  # give controller some time to update member list.
+                        if (castMultizoneControllerListener is not None) and (not castMultizoneControllerListener.WaitForStatusReceived.wait(2.0)):
+                            _logsi.LogVerbose("%s - Timed out waiting for Chromecast multizone status for group \"%s\"; using current member list" % (self.name, castInfo.friendly_name), colorValue=SIColors.Coral)
 
                         # activate media receiver app for each member in the group.
                         # process all device members in the group / zone.
@@ -719,8 +1438,8 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                                         zone_member_castDevice.start()
                                         zone_member_castDevice.wait(timeout=5.0)
 
-                                # media receiver app needs time to start.
-                                time.sleep(2.0)
+                                # media receiver app needs time to start (unless we are asked to stop).
+                                self._StopEvent.wait(2.0)
 
                 except Exception as ex:
             
@@ -827,28 +1546,24 @@ class SpotifyConnectDirectoryTask(threading.Thread):
             # this occurs when we receive any of the following zeroconf response 
             # messages: `addUserResponse`, `addUserError`, `getInfoError`, `launchError`.
 
-            counter = 0
-            while counter < (timeoutActivation + 1):
-                if (self.WaitForActivationComplete.wait(1)):
-                    # syncronize access via lock, as we are accessing the collection.
-                    with self._SpotifyConnectDevices_RLock:
-                        scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.GetDeviceByDiscoveryKey(str(castDevice.uuid))
-                    if (scDevice is not None):
-                        response = scDevice.ZeroconfResponseInfo
-                        if (response.ResponseSource == TYPE_LAUNCH_ERROR):
-                            raise SpotifyApiError("Spotify Cast Application could not be activated on Chromecast device \"%s\": %s" % (deviceName, response.StatusString), logsi=_logsi)
-                        elif (response.ResponseSource == TYPE_ADD_USER_RESPONSE):
-                            scDevice.WasReConnected = True
-                            break
-                        raise SpotifyApiError("Spotify Cast App could not be activated on Chromecast device \"%s\": %s" % (deviceName, response.ToString(False)), logsi=_logsi)
+            isActivationComplete:bool = self.WaitForActivationComplete.wait(timeoutActivation)
+
+            # syncronize access via lock, as we are accessing the collection.
+            with self._SpotifyConnectDevices_RLock:
+                scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.GetDeviceByDiscoveryKey(str(castDevice.uuid))
+
+            if (isActivationComplete):
+                if (scDevice is None):
                     raise SpotifyApiError("Spotify Cast App could not activated on Chromecast device: unknown error.", logsi=_logsi)
-                if (counter >= timeoutActivation):
-                    # syncronize access via lock, as we are accessing the collection.
-                    with self._SpotifyConnectDevices_RLock:
-                        scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.GetDeviceByDiscoveryKey(str(castDevice.uuid))
-                    if (scDevice is not None):
-                        raise SpotifyApiError("Spotify Cast App activation timeout (%s seconds) was exceeded while trying to activate Chromecast device \"%s\"." % (timeoutActivation, deviceName), logsi=_logsi)
-                counter += 1
+                response = scDevice.ZeroconfResponseInfo
+                if (response.ResponseSource == TYPE_LAUNCH_ERROR):
+                    raise SpotifyApiError("Spotify Cast Application could not be activated on Chromecast device \"%s\": %s" % (deviceName, response.StatusString), logsi=_logsi)
+                elif (response.ResponseSource != TYPE_ADD_USER_RESPONSE):
+                    raise SpotifyApiError("Spotify Cast App could not be activated on Chromecast device \"%s\": %s" % (deviceName, response.ToString(False)), logsi=_logsi)
+                scDevice.WasReConnected = True
+                self._SetDeviceChanged(scDevice)
+            elif (scDevice is not None):
+                raise SpotifyApiError("Spotify Cast App activation timeout (%s seconds) was exceeded while trying to activate Chromecast device \"%s\"." % (timeoutActivation, deviceName), logsi=_logsi)
 
             # at this point we have received an `adduserResponse` from the Chromecast device, indicating 
             # that it has launched the Spotify Cast App and that the user is logged in.
@@ -866,25 +1581,20 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 # this occurs when we receive any of the following zeroconf response 
                 # messages: `transferSuccess`, `transferError`.
 
-                counter = 0
-                while counter < (timeoutTransfer + 1):
-                    if (self.WaitForTransferComplete.wait(1)):
-                        # syncronize access via lock, as we are accessing the collection.
-                        with self._SpotifyConnectDevices_RLock:
-                            scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.GetDeviceByDiscoveryKey(str(castDevice.uuid))
-                        if (scDevice is not None):
-                            response = scDevice.ZeroconfResponseInfo
-                            if (response.ResponseSource == TYPE_TRANSFER_SUCCESS):
-                                break
-                            raise SpotifyApiError("Spotify Cast App failed to receive playback transfer on Chromecast device \"%s\": %s" % (deviceName, response.ToString(False)), logsi=_logsi)
+                isTransferComplete:bool = self.WaitForTransferComplete.wait(timeoutTransfer)
+
+                # syncronize access via lock, as we are accessing the collection.
+                with self._SpotifyConnectDevices_RLock:
+                    scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.GetDeviceByDiscoveryKey(str(castDevice.uuid))
+
+                if (isTransferComplete):
+                    if (scDevice is None):
                         raise SpotifyApiError("Spotify Cast App failed to receive playback transfer on Chromecast device: unknown error.", logsi=_logsi)
-                    if (counter >= timeoutTransfer):
-                        # syncronize access via lock, as we are accessing the collection.
-                        with self._SpotifyConnectDevices_RLock:
-                            scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.GetDeviceByDiscoveryKey(str(castDevice.uuid))
-                        if (scDevice is not None):
-                            raise SpotifyApiError("Spotify Cast App transfer playback timeout (%s seconds) was exceeded while waiting for transfer of playback on Chromecast device \"%s\"." % (timeoutTransfer, deviceName), logsi=_logsi)
-                    counter += 1
+                    response = scDevice.ZeroconfResponseInfo
+                    if (response.ResponseSource != TYPE_TRANSFER_SUCCESS):
+                        raise SpotifyApiError("Spotify Cast App failed to receive playback transfer on Chromecast device \"%s\": %s" % (deviceName, response.ToString(False)), logsi=_logsi)
+                elif (scDevice is not None):
+                    raise SpotifyApiError("Spotify Cast App transfer playback timeout (%s seconds) was exceeded while waiting for transfer of playback on Chromecast device \"%s\"." % (timeoutTransfer, deviceName), logsi=_logsi)
 
                 # at this point we have received an `transferSuccess` from the Chromecast device, indicating 
                 # that transfer of playback was a success; it should now be playing a track!
@@ -897,6 +1607,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                     # store the deviceId that was activated, if it's different than the original deviceId.
                     if (scDevice.Id != castAppTask.DeviceIdActivated):
                         scDevice.DeviceIdActivated = castAppTask.DeviceIdActivated
+                        self._SetDeviceChanged(scDevice)
 
             # return the device id that was activated.
             return castAppTask.DeviceIdActivated
@@ -991,12 +1702,10 @@ class SpotifyConnectDirectoryTask(threading.Thread):
             scDevice.Name = info.RemoteName
             scDevice.DeviceInfo = info
             scDevice.DiscoveryResult = discoverResult
-            self._SpotifyConnectDevices.Items.append(scDevice)
+            # devices collection is kept sorted by device name.
+            self._SpotifyConnectDevices.AddSorted(scDevice)
             self._SpotifyConnectDevices.DateLastRefreshed = datetime.utcnow().timestamp()
-
-            # sort devices collection by device name.
-            if (len(self._SpotifyConnectDevices.Items) > 0):
-                self._SpotifyConnectDevices.Items.sort(key=lambda x: (x.Name or "").lower(), reverse=False)
+            self._SetDeviceChanged(scDevice)
 
             # trace.
             _logsi.LogVerbose("Added SpotifyConnectDevices collection entry: %s - %s" % (scDevice.Title, scDevice.DiscoveryResult.Description), colorValue=SIColors.ForestGreen)
@@ -1005,6 +1714,38 @@ class SpotifyConnectDirectoryTask(threading.Thread):
             self._RaiseDeviceAdded(scDevice)
 
 
+    def _GetActiveDevice(
+        self, 
+        refresh:bool=False,
+        ) -> SpotifyConnectDevice:
+        """
+        Returns the device currently marked as active if found; otherwise, null.
+
+        The object returned is shared with other callers and must be treated as read-only;
+        it is not copied.
+        """
+        # no lock is taken here, as only the published devices snapshot is read (the refresh
+        # takes the lock while it updates the devices collection).
+        result:SpotifyConnectDevice = None
+
+        # if refresh selected then retrieve the active device from playerState.
+        if (refresh):
+            result = self._UpdateActiveDevice(None)
+            if (result is not None):
+                return result
+
+        # find active device in the devices snapshot.
+        for scDevice in self._GetDevices().Items:
+            if (scDevice.DeviceInfo is not None):
+                if (scDevice.IsActiveDevice):
+                    _logsi.LogVerbose("Spotify Connect active device detected: %s" % (scDevice.Title))
+                    result = scDevice
+                    break
+
+        # returns null if no active device found.
+        return result
+
+
     def GetActiveDevice(
         self, 
         refresh:bool=False,
@@ -1020,8 +1761,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         Returns:
             The device currently marked as active if found; otherwise, null.
 
-        The object returned is a copy of the internal master device entry; any changes made
-        to the copy do not affect the internal master device entry.
+        The object returned is a copy of the device entry, which the caller is free to modify.
 
         <details>
           <summary>Sample Code</summary>
@@ -1030,27 +1770,150 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         ```
         </details>
         """
-        # syncronize access via lock, as we are accessing the collection.
-        with self._SpotifyConnectDevices_RLock:
+        return copy.deepcopy(self._GetActiveDevice(refresh))
+
+
+    def _GetDevice(
+        self,
+        value:str,
+        refreshDynamicDevices:bool=True,
+        raiseExceptionIfNotFound:bool=True,
+        ) -> SpotifyConnectDevice:
+        """
+        Returns the device for the specified device name / id (see `GetDevice` for details).
+
+        The object returned is shared with other callers and must be treated as read-only;
+        it is not copied.
+        """
+        # no lock is taken here, as only the published devices snapshot is read (the refresh
+        # takes the lock while it updates the devices collection).
+        apiMethodName:str = "GetDevice"
+        apiMethodParms:SIMethodParmListContext = None
+        scDevice:SpotifyConnectDevice = None
+        scActiveDevice:SpotifyConnectDevice = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("value", value)
+            apiMethodParms.AppendKeyValue("refreshDynamicDevices", refreshDynamicDevices)
+            apiMethodParms.AppendKeyValue("SpotifyClient.DefaultDeviceId", self.SpotifyClientInstance.DefaultDeviceId)
+            _logsi.LogMethodParmList(SILevel.Verbose, "Getting Spotify Connect device instance for value \"%s\"" % (value), apiMethodParms)
+
+            # validations.
+            if (value is not None) and (not isinstance(value, str)):
+                value = None
+            if (not isinstance(refreshDynamicDevices, bool)):
+                refreshDynamicDevices = True
+            if (not isinstance(raiseExceptionIfNotFound, bool)):
+                raiseExceptionIfNotFound = True
+            valueOriginal:str = value
+
+            # get currently active player device.
+            if (refreshDynamicDevices):
+                scActiveDevice = self._RefreshDynamicDevices()
+            else:
+                scActiveDevice = self._UpdateActiveDevice()
+
+            # was the active spotify player device value specified (e.g. null / empty string)?
+            if (value is None) or (value.strip() == ""):
+
+                # is there an active player device?
+                if (scActiveDevice is not None):
+                    _logsi.LogObject(SILevel.Verbose, "Spotify Player device \"%s\" (%s) was found in the Spotify Connect Devices collection (by Active PlayerState)" % (scActiveDevice.Name, scActiveDevice.Id), scActiveDevice, excludeNonPublic=True)
+                    return scActiveDevice
+
+                # if no active player device, then let's use the default device value.
+                _logsi.LogVerbose("Spotify Player has no active device; defaulting device selection to use DefaultDeviceId: \"%s\"" % (self.SpotifyClientInstance.DefaultDeviceId))
+                value = self.SpotifyClientInstance.DefaultDeviceId
+
+            # was a default device value specified?
+            # if so, then use the `defaultDeviceId` value; if the `defaultDeviceId` value is not in the device list, 
+            # then we will catch it with the `GetDeviceById` / `GetDeviceByName` logic.
+            # if `defaultDeviceId` was not configured, then use active player device (via playerstate).
+            # if `defaultDeviceId` value is not in the device list, then use active player device (via playerstate).
+            # if no active player device, then it's an exception!
+            if (value == "*"):
+
+                # get default device id value from the client.
+                defaultDeviceId:str = self.SpotifyClientInstance.DefaultDeviceId
+
+                # was a default device specified? 
+                if (defaultDeviceId is None) or (defaultDeviceId.strip() == ""):
+                    # is there an active player device?
+                    if (scActiveDevice is not None):
+                        _logsi.LogObject(SILevel.Verbose, "Spotify Player default device (*) was not configured; using active player device: %s" % (scActiveDevice.Title), scActiveDevice, excludeNonPublic=True)
+                        return scActiveDevice
+                    # if no default device and no active player, then it's an error!
+                    #raise SpotifyApiError("Spotify Player default device (*) was not configured, and there is no active Spotify Player device", logsi=_logsi)
+                
+                # assign default device value.
+                _logsi.LogVerbose("Spotify Player device default \"%s\" will be used for selecting a device (by default *)" % (defaultDeviceId))
+                value = defaultDeviceId
+
+            # check for the device id in the devices snapshot.
+            devices:SpotifyConnectDevices = self._GetDevices()
+            scDevice = devices.GetDeviceById(value)
+            if (scDevice is not None):
+                _logsi.LogObject(SILevel.Verbose, "Spotify Player device %s was found in the Spotify Connect Devices collection (by Id)" % (scDevice.Title), scDevice, excludeNonPublic=True)
+                return scDevice
+            
+            # check for the device name in the devices snapshot.
+            scDevice = devices.GetDeviceByName(value)
+            if (scDevice is not None):
+
+                # we have a device match by name!
+                # is there an active player device? 
+                if (scActiveDevice is not None):
+
+                    # does the active device have the same name, but a different device id?
+                    if (scActiveDevice.Name == scDevice.Name) and (scActiveDevice.Id != scDevice.Id):
+                        # this denotes that we have 2 devices in the device list with the same name
+                        # but different id's.  in this case we will use the active device, since it
+                        # is already active.
+                        _logsi.LogObject(SILevel.Verbose, "Spotify Player device %s was found in the Spotify Connect Devices collection (by Duplicate Name), which denotes that we have 2 devices in the device list with the same name but different id's; in this case we will use the active device (id=%s), since it is already active" % (scDevice.Title, scActiveDevice.Id), scDevice, excludeNonPublic=True)
+                        scDevice = scActiveDevice
 
-            result:SpotifyConnectDevice = None
+                _logsi.LogObject(SILevel.Verbose, "Spotify Player device %s was found in the Spotify Connect Devices collection (by Name)" % (scDevice.Title), scDevice, excludeNonPublic=True)
+                return scDevice
 
-            # if refresh selected then retrieve the active device from playerState.
-            if (refresh):
-                result = self.UpdateActiveDevice(None)
-                if (result is not None):
-                    return result
+            # is there an active player device?
+            if (scActiveDevice is not None):
+
+                # check if the active device is restricted; if it is, then it may not show up in the
+                # available device list of devices (common issue with Sonos devices).  in this case,
+                # it WILL show up in the player state device property as the active device.
+                # note that the PlayerPlayState device is a name and not a device id.
+                if (scActiveDevice.IsRestricted):
+                    value = ("" + value).lower()
+                    if (scActiveDevice.Id.lower() == value) or (scActiveDevice.Name.lower() == value):
+                        _logsi.LogObject(SILevel.Verbose, "Spotify Player device %s was found to be a restricted device (by Active PlayerState)" % (scDevice.Title), scDevice, excludeNonPublic=True)
+                        return scActiveDevice
+            
+                # if `defaultDeviceId` value is not in the device list, then use active player device.
+                if (valueOriginal == "*"):
+                    _logsi.LogObject(SILevel.Verbose, "Spotify Player default device \"%s\" was not found in the Spotify Connect Devices collection; using active player device: %s" % (value, scActiveDevice.Title), scActiveDevice, excludeNonPublic=True)
+                    return scActiveDevice
+
+            # at this point we could not resolve the device name / id, and there is no active player
+            # available; raise exception / return null as requested by the caller.
+            if (raiseExceptionIfNotFound):
+                raise SpotifyConnectDeviceNotFound("Spotify Player device \"%s\" was not found, and there is no active Spotify player" % (value), logsi=_logsi)
+            else:
+                _logsi.LogVerbose("Spotify Player device \"%s\" was not found, and there is no active Spotify player" % (value))
+                return None
 
-            # find active device in the devices collection.
-            for scDevice in self._SpotifyConnectDevices.Items:
-                if (scDevice.DeviceInfo is not None):
-                    if (scDevice.IsActiveDevice):
-                        _logsi.LogVerbose("Spotify Connect active device detected: %s" % (scDevice.Title))
-                        result = copy.deepcopy(scDevice)
-                        break
+        except SpotifyApiError: raise  # pass handled exceptions on thru
+        except Exception as ex:
 
-            # returns null if no active device found.
-            return result
+            # format unhandled exception.
+            raise SpotifyApiError("%s - Could not retrieve dynamic device list: %s" % (self.name, str(ex)), ex, logsi=_logsi)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug)
 
 
     def GetDevice(
@@ -1091,8 +1954,8 @@ class SpotifyConnectDirectoryTask(threading.Thread):
             SpotifyApiError: 
                 If an error occured while obtaining current Spotify Web API Player device data.
 
-        If a SpotifyConnectDevice object is returned, it will be a copy of the internal master 
-        device entry; any changes made to the copy do not affect the internal master device entry.
+        If a SpotifyConnectDevice object is returned, it will be a copy of the device entry, which
+        the caller is free to modify.
 
         <details>
           <summary>Sample Code</summary>
@@ -1101,135 +1964,28 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         ```
         </details>
         """
-        # syncronize access via lock, as we are accessing the collection.
-        with self._SpotifyConnectDevices_RLock:
-
-            apiMethodName:str = "GetDevice"
-            apiMethodParms:SIMethodParmListContext = None
-            scDevice:SpotifyConnectDevice = None
-            scActiveDevice:SpotifyConnectDevice = None
-
-            try:
-
-                # trace.
-                apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
-                apiMethodParms.AppendKeyValue("value", value)
-                apiMethodParms.AppendKeyValue("refreshDynamicDevices", refreshDynamicDevices)
-                apiMethodParms.AppendKeyValue("SpotifyClient.DefaultDeviceId", self.SpotifyClientInstance.DefaultDeviceId)
-                _logsi.LogMethodParmList(SILevel.Verbose, "Getting Spotify Connect device instance for value \"%s\"" % (value), apiMethodParms)
-
-                # validations.
-                if (value is not None) and (not isinstance(value, str)):
-                    value = None
-                if (not isinstance(refreshDynamicDevices, bool)):
-                    refreshDynamicDevices = True
-                if (not isinstance(raiseExceptionIfNotFound, bool)):
-                    raiseExceptionIfNotFound = True
-                valueOriginal:str = value
-
-                # get currently active player device.
-                if (refreshDynamicDevices):
-                    scActiveDevice = self.RefreshDynamicDevices()
-                else:
-                    scActiveDevice = self.UpdateActiveDevice()
-
-                # was the active spotify player device value specified (e.g. null / empty string)?
-                if (value is None) or (value.strip() == ""):
-
-                    # is there an active player device?
-                    if (scActiveDevice is not None):
-                        _logsi.LogObject(SILevel.Verbose, "Spotify Player device \"%s\" (%s) was found in the Spotify Connect Devices collection (by Active PlayerState)" % (scActiveDevice.Name, scActiveDevice.Id), scActiveDevice, excludeNonPublic=True)
-                        return scActiveDevice
-
-                    # if no active player device, then let's use the default device value.
-                    _logsi.LogVerbose("Spotify Player has no active device; defaulting device selection to use DefaultDeviceId: \"%s\"" % (self.SpotifyClientInstance.DefaultDeviceId))
-                    value = self.SpotifyClientInstance.DefaultDeviceId
-
-                # was a default device value specified?
-                # if so, then use the `defaultDeviceId` value; if the `defaultDeviceId` value is not in the device list, 
-                # then we will catch it with the `GetDeviceById` / `GetDeviceByName` logic.
-                # if `defaultDeviceId` was not configured, then use active player device (via playerstate).
-                # if `defaultDeviceId` value is not in the device list, then use active player device (via playerstate).
-                # if no active player device, then it's an exception!
-                if (value == "*"):
-
-                    # get default device id value from the client.
-                    defaultDeviceId:str = self.SpotifyClientInstance.DefaultDeviceId
-
-                    # was a default device specified? 
-                    if (defaultDeviceId is None) or (defaultDeviceId.strip() == ""):
-                        # is there an active player device?
-                        if (scActiveDevice is not None):
-                            _logsi.LogObject(SILevel.Verbose, "Spotify Player default device (*) was not configured; using active player device: %s" % (scActiveDevice.Title), scActiveDevice, excludeNonPublic=True)
-                            return scActiveDevice
-                        # if no default device and no active player, then it's an error!
-                        #raise SpotifyApiError("Spotify Player default device (*) was not configured, and there is no active Spotify Player device", logsi=_logsi)
-                    
-                    # assign default device value.
-                    _logsi.LogVerbose("Spotify Player device default \"%s\" will be used for selecting a device (by default *)" % (defaultDeviceId))
-                    value = defaultDeviceId
-
-                # check for the device id in the devices collection.
-                scDevice = self._SpotifyConnectDevices.GetDeviceById(value)
-                if (scDevice is not None):
-                    _logsi.LogObject(SILevel.Verbose, "Spotify Player device %s was found in the Spotify Connect Devices collection (by Id)" % (scDevice.Title), scDevice, excludeNonPublic=True)
-                    return copy.deepcopy(scDevice)
-                
-                # check for the device name in the devices collection.
-                scDevice = self._SpotifyConnectDevices.GetDeviceByName(value)
-                if (scDevice is not None):
-
-                    # we have a device match by name!
-                    # is there an active player device? 
-                    if (scActiveDevice is not None):
-
-                        # does the active device have the same name, but a different device id?
-                        if (scActiveDevice.Name == scDevice.Name) and (scActiveDevice.Id != scDevice.Id):
-                            # this denotes that we have 2 devices in the device list with the same name
-                            # but different id's.  in this case we will use the active device, since it
-                            # is already active.
-                            _logsi.LogObject(SILevel.Verbose, "Spotify Player device %s was found in the Spotify Connect Devices collection (by Duplicate Name), which denotes that we have 2 devices in the device list with the same name but different id's; in this case we will use the active device (id=%s), since it is already active" % (scDevice.Title, scActiveDevice.Id), scDevice, excludeNonPublic=True)
-                            scDevice = scActiveDevice
-
-                    _logsi.LogObject(SILevel.Verbose, "Spotify Player device %s was found in the Spotify Connect Devices collection (by Name)" % (scDevice.Title), scDevice, excludeNonPublic=True)
-                    return copy.deepcopy(scDevice)
-
-                # is there an active player device?
-                if (scActiveDevice is not None):
-
-                    # check if the active device is restricted; if it is, then it may not show up in the
-                    # available device list of devices (common issue with Sonos devices).  in this case,
-                    # it WILL show up in the player state device property as the active device.
-                    # note that the PlayerPlayState device is a name and not a device id.
-                    if (scActiveDevice.IsRestricted):
-                        value = ("" + value).lower()
-                        if (scActiveDevice.Id.lower() == value) or (scActiveDevice.Name.lower() == value):
-                            _logsi.LogObject(SILevel.Verbose, "Spotify Player device %s was found to be a restricted device (by Active PlayerState)" % (scDevice.Title), scDevice, excludeNonPublic=True)
-                            return scActiveDevice
-                
-                    # if `defaultDeviceId` value is not in the device list, then use active player device.
-                    if (valueOriginal == "*"):
-                        _logsi.LogObject(SILevel.Verbose, "Spotify Player default device \"%s\" was not found in the Spotify Connect Devices collection; using active player device: %s" % (value, scActiveDevice.Title), scActiveDevice, excludeNonPublic=True)
-                        return scActiveDevice
-
-                # at this point we could not resolve the device name / id, and there is no active player
-                # available; raise exception / return null as requested by the caller.
-                if (raiseExceptionIfNotFound):
-                    raise SpotifyConnectDeviceNotFound("Spotify Player device \"%s\" was not found, and there is no active Spotify player" % (value), logsi=_logsi)
-                else:
-                    _logsi.LogVerbose("Spotify Player device \"%s\" was not found, and there is no active Spotify player" % (value))
-                    return None
+        return copy.deepcopy(self._GetDevice(value, refreshDynamicDevices, raiseExceptionIfNotFound))
 
-            except SpotifyApiError: raise  # pass handled exceptions on thru
-            except Exception as ex:
 
-                # format unhandled exception.
-                raise SpotifyApiError("%s - Could not retrieve dynamic device list: %s" % (self.name, str(ex)), ex, logsi=_logsi)
+    def _GetDevices(self,
+        ) -> SpotifyConnectDevices:
+        """
+        Returns the current devices snapshot.
 
+        The object returned is shared with other callers and must be treated as read-only;
+        it is not copied.
+        """
+        # DO NOT wait on the lock here!
+        # doing so can cause thread deadlocks in Home Assistant state machine.
+        # if changes are pending and the lock is free then publish them; otherwise, return
+        # the last published snapshot, which is always internally consistent.
+        if (self._IsDevicesChanged) and (self._SpotifyConnectDevices_RLock.acquire(blocking=False)):
+            try:
+                self._PublishDevices()
             finally:
+                self._SpotifyConnectDevices_RLock.release()
 
-                # trace.
-                _logsi.LeaveMethod(SILevel.Debug)
+        return self._DevicesSnapshot
 
 
     def GetDevices(self,
@@ -1237,8 +1993,9 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         """
         Returns a collection of available Spotify Connect devices.
 
-        The object returned is a copy of the internal master device list; any changes made
-        to the copy do not affect the internal master device list.
+        The object returned is a copy of the current devices snapshot, which the caller is free
+        to modify.  The copy is made without holding the devices lock.  Use the `DevicesVersion` 
+        property to detect changes.
 
         <details>
           <summary>Sample Code</summary>
@@ -1247,15 +2004,45 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         ```
         </details>
         """
-        result:SpotifyConnectDevices
+        return copy.deepcopy(self._GetDevices())
 
-        # DO NOT syncronize access via lock here!
-        # doing so can cause thread deadlocks in Home Assistant state machine.
-        # with self._SpotifyConnectDevices_RLock:
 
-        # creates a completely independent copy of the devices collection (no references),
-        # and return it to the caller.
-        result = copy.deepcopy(self._SpotifyConnectDevices)
+    def _GetPlayerDevice(
+        self, 
+        value:str,
+        refresh:bool=False,
+        ) -> SpotifyConnectDevice:
+        """
+        Returns the device instance if it is currently in the Spotify Web API player device list;
+        otherwise, null.
+
+        The object returned is shared with other callers and must be treated as read-only;
+        it is not copied.
+        """
+        # no lock is taken here, as only the published devices snapshot is read (the refresh
+        # takes the lock while it updates the devices collection).
+        result:SpotifyConnectDevice = None
+
+        # validations.
+        if (value is None):
+            return result
+
+        # if refresh selected then update player devices from Spotify Web API.
+        if (refresh):
+            self.UpdatePlayerDevices()
+
+        # prepare for compare.
+        value = "" + value.strip().lower()
+
+        # find specified player device in the devices snapshot.
+        for scDevice in self._GetDevices().Items:
+            if (scDevice.IsInDeviceList):
+                if (scDevice.Id.lower() == value) or (scDevice.Name.lower() == value)  or (scDevice.DiscoveryResult.DeviceName.lower() == value):
+                    _logsi.LogVerbose("Spotify Connect player device detected: %s" % (scDevice.Title))
+                    result = scDevice
+                    break
+
+        # returns null if no active device found.
         return result
 
 
@@ -1279,8 +2066,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
             The device instance if it is currently in the Spotify Web API player device list; 
             otherwise, null.
 
-        The object returned is a copy of the internal master device entry; any changes made
-        to the copy do not affect the internal master device entry.
+        The object returned is a copy of the device entry, which the caller is free to modify.
 
         <details>
           <summary>Sample Code</summary>
@@ -1289,32 +2075,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         ```
         </details>
         """
-        # syncronize access via lock, as we are accessing the collection.
-        with self._SpotifyConnectDevices_RLock:
-
-            result:SpotifyConnectDevice = None
-
-            # validations.
-            if (value is None):
-                return result
-
-            # if refresh selected then update player devices from Spotify Web API.
-            if (refresh):
-                self.UpdatePlayerDevices()
-
-            # prepare for compare.
-            value = "" + value.strip().lower()
-
-            # find specified player device in the devices collection.
-            for scDevice in self._SpotifyConnectDevices._Items:
-                if (scDevice.IsInDeviceList):
-                    if (scDevice.Id.lower() == value) or (scDevice.Name.lower() == value)  or (scDevice.DiscoveryResult.DeviceName.lower() == value):
-                        _logsi.LogVerbose("Spotify Connect player device detected: %s" % (scDevice.Title))
-                        result = copy.deepcopy(scDevice)
-                        break
-
-            # returns null if no active device found.
-            return result
+        return copy.deepcopy(self._GetPlayerDevice(value, refresh))
 
 
     def GetSonosPlayer(
@@ -1423,30 +2184,14 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         return deviceId
     
 
-    def RefreshDynamicDevices(
+    def _RefreshDynamicDevices(
         self,
         ) -> SpotifyConnectDevice:
         """
-        Refreshes dynamic Spotify Connect devices, and also determines the currently
-        active device (if any).
-
-        Returns:
-            A SpotifyConnectDevice object that contains the active device if one was found;
-            otherwise, null to indicate no active device.
-
-        Dynamic devices are Spotify Connect devices that are not found in Zeroconf discovery
-        process, but exist in the player device list.  These are usually Spotify Connect
-        web or mobile players with temporary device id's.
-
-        The object returned is a copy of the internal master device entry; any changes made
-        to the copy do not affect the internal master device entry.
+        Refreshes the list of dynamically added devices (see `RefreshDynamicDevices` for details).
 
-        <details>
-          <summary>Sample Code</summary>
-        ```python
-        .. include:: ../../docs/include/samplecode/SpotifyConnectDirectoryTask/RefreshDynamicDevices.py
-        ```
-        </details>
+        The object returned is shared with other callers and must be treated as read-only;
+        it is not copied.
         """
         # syncronize access via lock, as we are accessing the collection.
         with self._SpotifyConnectDevices_RLock:
@@ -1459,17 +2204,17 @@ class SpotifyConnectDirectoryTask(threading.Thread):
 
                 # trace.
                 if (_logsi.IsOn(SILevel.Verbose)):
-                    _logsi.LogDictionary(SILevel.Verbose, "Current Spotify Connect device list (before refresh)", self.GetDevices().ToDictionary(), prettyPrint=True)
+                    _logsi.LogDictionary(SILevel.Verbose, "Current Spotify Connect device list (before refresh)", self._GetDevices().ToDictionary(), prettyPrint=True)
 
                 # update player devices known to the Spotify Web API (e.g. dynamic devices).
                 self.UpdatePlayerDevices()
 
                 # update the currently active device (if any).  
-                scDevice:SpotifyConnectDevice = self.UpdateActiveDevice()
+                scDevice:SpotifyConnectDevice = self._UpdateActiveDevice()
 
                 # trace.
                 if (_logsi.IsOn(SILevel.Verbose)):
-                    _logsi.LogDictionary(SILevel.Verbose, "Current Spotify Connect device list (after refresh)", self.GetDevices().ToDictionary(), prettyPrint=True)
+                    _logsi.LogDictionary(SILevel.Verbose, "Current Spotify Connect device list (after refresh)", self._GetDevices().ToDictionary(), prettyPrint=True)
                     if (scDevice is None):
                         _logsi.LogVerbose("Spotify Player playstate device is not present; no active device")
                     else:
@@ -1490,6 +2235,33 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 _logsi.LeaveMethod(SILevel.Debug)
 
 
+    def RefreshDynamicDevices(
+        self,
+        ) -> SpotifyConnectDevice:
+        """
+        Refreshes dynamic Spotify Connect devices, and also determines the currently
+        active device (if any).
+
+        Returns:
+            A SpotifyConnectDevice object that contains the active device if one was found;
+            otherwise, null to indicate no active device.
+
+        Dynamic devices are Spotify Connect devices that are not found in Zeroconf discovery
+        process, but exist in the player device list.  These are usually Spotify Connect
+        web or mobile players with temporary device id's.
+
+        The object returned is a copy of the device entry, which the caller is free to modify.
+
+        <details>
+          <summary>Sample Code</summary>
+        ```python
+        .. include:: ../../docs/include/samplecode/SpotifyConnectDirectoryTask/RefreshDynamicDevices.py
+        ```
+        </details>
+        """
+        return copy.deepcopy(self._RefreshDynamicDevices())
+
+
     def RemoveDevice(
         self,
         deviceId:str,
@@ -1517,8 +2289,8 @@ class SpotifyConnectDirectoryTask(threading.Thread):
         process, but still exist in the player device list.  These are usually Spotify Player
         client devices (e.g. mobile / web / desktop players) that utilize temporary device id's.
 
-        The object returned is a copy of the internal master device entry; any changes made
-        to the copy do not affect the internal master device entry.
+        The object returned is the removed device entry, which is no longer referenced by the
+        devices collection.
 
         <details>
           <summary>Sample Code</summary>
@@ -1565,7 +2337,10 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                         if (isFound):
 
                             # remove the device.
-                            scDevice:SpotifyConnectDevice = copy.deepcopy(self._SpotifyConnectDevices.Items.pop(idx))
+                            # the removed entry is no longer referenced by the collection, so it is
+                            # passed on as-is instead of being copied.
+                            scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.Items.pop(idx)
+                            self._SetDeviceChanged()
                             _logsi.LogVerbose("Removed SpotifyConnectDevices collection entry: %s - %s" % (scDevice.Title, scDevice.DiscoveryResult.Description), colorValue=SIColors.Orange)
 
                             # raise event.
@@ -1618,6 +2393,11 @@ class SpotifyConnectDirectoryTask(threading.Thread):
             for scDevice in self._SpotifyConnectDevices.Items:
                 scDevice.IsInDeviceList = False
 
+            # map device entries by getInfo device id (first entry wins, same as a sequential search).
+            scDevicesByDeviceId:dict[str, SpotifyConnectDevice] = {}
+            for scDevice in self._SpotifyConnectDevices.Items:
+                scDevicesByDeviceId.setdefault(scDevice.DeviceInfo.DeviceId, scDevice)
+
             # add dynamic devices.
             scDevice:SpotifyConnectDevice
             device:Device
@@ -1626,112 +2406,94 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 # is the player device present in the collection? if not, then add it.
                 if (not self._SpotifyConnectDevices.ContainsDeviceId(device.Id)):
                     self.AddDynamicDevice(device)
+                    scDevicesByDeviceId.clear()
+                    for scDevice in self._SpotifyConnectDevices.Items:
+                        scDevicesByDeviceId.setdefault(scDevice.DeviceInfo.DeviceId, scDevice)
                         
-                # check all registered Spotify Connect device entries.
-                for scDevice in self._SpotifyConnectDevices.Items:
-        
-                    # do we have a match on the device id?
-                    if (scDevice.DeviceInfo.DeviceId == device.Id) and ((device.Id or "") != ""):
+                # do we have a match on the device id?
+                scDevice = scDevicesByDeviceId.get(device.Id, None)
+                if (scDevice is not None) and ((device.Id or "") != ""):
 
-                        # indicate the device is in the available device list.
-                        scDevice.IsInDeviceList = True
+                    # indicate the device is in the available device list.
+                    scDevice.IsInDeviceList = True
 
-                        # is the device an alias entry?
-                        # if Spotify Web API device entry is an alias, then the device id and device name
-                        # values will USUALLY be the same (e.g. a device id value) and the SpotifyConnectDevices
-                        # collection entry's DeviceInfo.RemoteName value will be an empty string (e.g. "").
-                        if (scDevice.DeviceInfo.HasAliases) and (device.Id == device.Name):
+                    # is the device an alias entry?
+                    # if Spotify Web API device entry is an alias, then the device id and device name
+                    # values will USUALLY be the same (e.g. a device id value) and the SpotifyConnectDevices
+                    # collection entry's DeviceInfo.RemoteName value will be an empty string (e.g. "").
+                    if (scDevice.DeviceInfo.HasAliases) and (device.Id == device.Name):
 
-                            # yes - DO NOT change the RemoteName value, as an alias is in use.
-                            _logsi.LogVerbose("Detected Spotify Connect Alias in use for SpotifyConnectDevices collection entry %s [%s]; first Alias name is \"%s\"; RemoteName is \"%s\"" % (scDevice.Title, scDevice.DiscoveryResult.Description, scDevice.DeviceInfo.Aliases[0].Name, scDevice.DeviceInfo.RemoteName), colorValue=SIColors.Coral)
+                        # yes - DO NOT change the RemoteName value, as an alias is in use.
+                        _logsi.LogVerbose("Detected Spotify Connect Alias in use for SpotifyConnectDevices collection entry %s [%s]; first Alias name is \"%s\"; RemoteName is \"%s\"" % (scDevice.Title, scDevice.DiscoveryResult.Description, scDevice.DeviceInfo.Aliases[0].Name, scDevice.DeviceInfo.RemoteName), colorValue=SIColors.Coral)
 
-                        else:
+                    else:
 
-                            # did the player device remote name change?
-                            # if so, then update the collection RemoteName as well as the Name.
-                            # this can happen for devices that are added to / removed from groups
-                            # and do not correctly inform interested parties via a zeroconf 
-                            # OnServiceStateChange event that the name has changed (e.g. Denon HEOS devices, etc).
-                            if (scDevice.DeviceInfo.RemoteName != device.Name) and ((device.Name or "") != ""):
-                                _logsi.LogVerbose("Detected Spotify Connect RemoteName change for SpotifyConnectDevices collection entry %s [%s]; updated Spotify Web API PlayerDevice Name is \"%s\" - this is usually caused by a Speaker Group membership change" % (scDevice.Title, scDevice.DiscoveryResult.Description, device.Name), colorValue=SIColors.Coral)
-                                scDevice.DeviceInfo.RemoteName = device.Name
-                                scDevice.Name = device.Name
-                                self._SpotifyConnectDevices.DateLastRefreshed = datetime.utcnow().timestamp()
-                                # ???? - we should probably call getInfo again to update DeviceInfo since GroupStatus has 
-                                # probably changed from "NONE" to "GROUP" or vice versa!
-                                # we will start with this to see how it goes.
-                                self._RaiseDeviceUpdated(scDevice)
-
-                        # don't need to search any more devices since we found the device id.
-                        break
+                        # did the player device remote name change?
+                        # if so, then update the collection RemoteName as well as the Name.
+                        # this can happen for devices that are added to / removed from groups
+                        # and do not correctly inform interested parties via a zeroconf 
+                        # OnServiceStateChange event that the name has changed (e.g. Denon HEOS devices, etc).
+                        if (scDevice.DeviceInfo.RemoteName != device.Name) and ((device.Name or "") != ""):
+                            _logsi.LogVerbose("Detected Spotify Connect RemoteName change for SpotifyConnectDevices collection entry %s [%s]; updated Spotify Web API PlayerDevice Name is \"%s\" - this is usually caused by a Speaker Group membership change" % (scDevice.Title, scDevice.DiscoveryResult.Description, device.Name), colorValue=SIColors.Coral)
+                            scDevice.DeviceInfo.RemoteName = device.Name
+                            scDevice.Name = device.Name
+                            self._SpotifyConnectDevices.UpdateSortOrder(scDevice)
+                            self._SpotifyConnectDevices.DateLastRefreshed = datetime.utcnow().timestamp()
+                            self._SetDeviceChanged(scDevice)
+                            # ???? - we should probably call getInfo again to update DeviceInfo since GroupStatus has 
+                            # probably changed from "NONE" to "GROUP" or vice versa!
+                            # we will start with this to see how it goes.
+                            self._RaiseDeviceUpdated(scDevice)
+
+            # mark devices whose device list indicator differs from the published snapshot;
+            # unchanged devices are not marked, so that polling the player device list does
+            # not publish a new snapshot every time.
+            self._SetDevicesChangedFromSnapshot(lambda x: x.IsInDeviceList)
 
             # remove stale dynamic devices from results collection;
             # the reversed() function creates an iterator that traverses the list in reverse order. 
             # this ensures that removing an element doesn't affect the indices of the subsequent 
             # elements we're going to iterate over.
+            playerDeviceIds:set[str] = set([playerDevice.Id for playerDevice in playerDevices])
             for idx in reversed(range(len(self._SpotifyConnectDevices.Items))):
 
                 # only process dynamic devices.
                 scDevice = self._SpotifyConnectDevices.Items[idx]
                 if (scDevice.DiscoveryResult.IsDynamicDevice):
 
-                    # process all player devices.
-                    wasFound:bool = False
-                    playerDevice:Device
-                    for playerDevice in playerDevices:
-                        if (scDevice.Id == playerDevice.Id):
-                            wasFound = True
-                            break
-
                     # if collection entry was not found in the player device list then remove it.
-                    if (not wasFound):
+                    if (scDevice.Id not in playerDeviceIds):
 
                         # remove the device.
-                        scDevice:SpotifyConnectDevice = copy.deepcopy(self._SpotifyConnectDevices.Items.pop(idx))
+                        scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.Items.pop(idx)
+                        self._SetDeviceChanged()
                         _logsi.LogVerbose("Removed SpotifyConnectDevices collection entry: %s - %s" % (scDevice.Title, scDevice.DiscoveryResult.Description), colorValue=SIColors.Orange)
 
                         # raise event.
                         self._RaiseDeviceRemoved(scDevice)
 
 
-    def UpdateActiveDevice(
+    def _UpdateActiveDevice(
         self, 
         playerState:PlayerPlayState=None
         ) -> SpotifyConnectDevice:
-        """ 
-        Updates the currently active device based on playerState.
-        
-        Args:
-            playerState (PlayerPlayState):
-                Current player state obtained via a call to `GetPlayerPlaybackState` method
-                which will be used to set the active device in the `Items` collection;
-                otherwise, null to bypass active device set.
+        """
+        Updates the currently active device based on playerState (see `UpdateActiveDevice` for details).
 
-        Returns:
-            The currently active Spotify Player device instance if one was found; otherwise, null.
-            
-        The Spotify Web API GetPlayerPlaybackState method is called to retrieve the active device
-        information.
+        The object returned is shared with other callers and must be treated as read-only;
+        it is not copied.
+        """
+        result:SpotifyConnectDevice = None
+        scActiveDevice:SpotifyConnectDevice = None
 
-        The object returned is a copy of the internal master device entry; any changes made
-        to the copy do not affect the internal master device entry.
+        # if playerState object not supplied, then go get it.
+        # this is done before the lock is taken, so that readers are not held up by the request.
+        if (playerState is None):
+            playerState:PlayerPlayState = self._SpotifyClientInstance.GetPlayerPlaybackState(additionalTypes=SpotifyMediaTypes.EPISODE.value)
 
-        <details>
-          <summary>Sample Code</summary>
-        ```python
-        .. include:: ../../docs/include/samplecode/SpotifyConnectDirectoryTask/UpdateActiveDevice.py
-        ```
-        </details>
-        """
         # syncronize access via lock, as we are accessing the collection.
         with self._SpotifyConnectDevices_RLock:
 
-            result:SpotifyConnectDevice = None
-
-            # if playerState object not supplied, then go get it.
-            if (playerState is None):
-                playerState:PlayerPlayState = self._SpotifyClientInstance.GetPlayerPlaybackState(additionalTypes=SpotifyMediaTypes.EPISODE.value)
-
             # if valid object then process it.
             if (isinstance(playerState, PlayerPlayState)):
 
@@ -1756,14 +2518,21 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                                 _logsi.LogVerbose("Spotify Connect active device detected (By Id): %s" % (scDevice.Title))
                                 scDevice.IsActiveDevice = True
                                 scDevice.IsRestricted = playerState.Device.IsRestricted
-                                result = copy.deepcopy(scDevice)
+                                scActiveDevice = scDevice
 
                         # no - compare on the device name.
                         elif (device.Name == scDevice.Name):
                             _logsi.LogVerbose("Spotify Connect active device detected (By Name): %s" % (scDevice.Title))
                             scDevice.IsActiveDevice = True
                             scDevice.IsRestricted = playerState.Device.IsRestricted
-                            result = copy.deepcopy(scDevice)
+                            scActiveDevice = scDevice
+
+                    # mark devices whose active status differs from the published snapshot.
+                    self._SetDevicesChangedFromSnapshot(lambda x: (x.IsActiveDevice, x.IsRestricted))
+
+                    # return the snapshot entry of the active device.
+                    if (scActiveDevice is not None):
+                        result = self._GetDeviceSnapshot(scActiveDevice)
 
             # returns null if the `playerState` argument was not specified; 
             # otherwise, the currently active Spotify Player device instance as determined by
@@ -1771,6 +2540,37 @@ class SpotifyConnectDirectoryTask(threading.Thread):
             return result
 
 
+    def UpdateActiveDevice(
+        self, 
+        playerState:PlayerPlayState=None
+        ) -> SpotifyConnectDevice:
+        """ 
+        Updates the currently active device based on playerState.
+        
+        Args:
+            playerState (PlayerPlayState):
+                Current player state obtained via a call to `GetPlayerPlaybackState` method
+                which will be used to set the active device in the `Items` collection;
+                otherwise, null to bypass active device set.
+
+        Returns:
+            The currently active Spotify Player device instance if one was found; otherwise, null.
+            
+        The Spotify Web API GetPlayerPlaybackState method is called to retrieve the active device
+        information.
+
+        The object returned is a copy of the device entry, which the caller is free to modify.
+
+        <details>
+          <summary>Sample Code</summary>
+        ```python
+        .. include:: ../../docs/include/samplecode/SpotifyConnectDirectoryTask/UpdateActiveDevice.py
+        ```
+        </details>
+        """
+        return copy.deepcopy(self._UpdateActiveDevice(playerState))
+
+
     def OnServiceInfoAddedUpdatedChromecast(
         self, 
         zeroconfDiscoveryResult:ZeroconfDiscoveryResult,
@@ -1804,6 +2604,9 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 # trace.
                 _logsi.EnterMethod(SILevel.Debug)
 
+                # note discovery activity (used to detect when initial discovery has settled).
+                self._SetDiscoveryActivity()
+
                 # add / update discovered results by serviceinfo key value.
                 # examples: 
                 # - Name="SHIELD-Android-TV-72735c92dead1a2d62df0229b1590a65._googlecast._tcp.local.",   Key="72735c92-dead-1a2d-62df-0229b1590a65"
@@ -1937,10 +2740,11 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                             # update existing Spotify Connect Device in devices collection.
                             self._SpotifyConnectDevices.Items[idx] = scDevice
                             self._SpotifyConnectDevices.DateLastRefreshed = datetime.utcnow().timestamp()
+                            self._SetDeviceChanged(scDevice)
                             return
 
-                    # add new Spotify Connect Device to devices collection.
-                    self._SpotifyConnectDevices.Items.append(scDevice)
+                    # add new Spotify Connect Device to devices collection (sorted by device name).
+                    self._SpotifyConnectDevices.AddSorted(scDevice)
                     self._SpotifyConnectDevices.DateLastRefreshed = datetime.utcnow().timestamp()
 
                     # trace.
@@ -1948,9 +2752,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                     _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DeviceInfo / getInfo)" % (scDevice.Title), scDevice.DeviceInfo, excludeNonPublic=True)
                     _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DiscoveryResult) [%s]" % (scDevice.Title, scDevice.DiscoveryResult.HostIpTitle), scDevice.DiscoveryResult, excludeNonPublic=True)
 
-                    # sort devices collection by device name.
-                    if (len(self._SpotifyConnectDevices.Items) > 0):
-                        self._SpotifyConnectDevices.Items.sort(key=lambda x: (x.Name or "").lower(), reverse=False)
+                    self._SetDeviceChanged(scDevice)
 
                     # raise event.
                     self._RaiseDeviceAdded(scDevice)
@@ -1996,6 +2798,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                             scDevice.DeviceInfo.DeviceId = newDeviceId
                             scDevice.DeviceInfo.RemoteName = newDeviceName
                             deviceNameChanged = True
+                            self._SetDeviceChanged(scDevice)
 
                         # is this a Google Cast Group "update_cast" event? 
                         # if so, AND the device name did not change, then ignore the update since
@@ -2021,9 +2824,9 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                         _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DeviceInfo / getInfo)" % (scDevice.Title), scDevice.DeviceInfo, excludeNonPublic=True)
                         _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DiscoveryResult) [%s]" % (scDevice.Title, scDevice.DiscoveryResult.HostIpTitle), scDevice.DiscoveryResult, excludeNonPublic=True)
 
-                        # sort devices collection by device name.
-                        if (len(self._SpotifyConnectDevices.Items) > 0):
-                            self._SpotifyConnectDevices.Items.sort(key=lambda x: (x.Name or "").lower(), reverse=False)
+                        # move the device to its sorted position (by device name), in case the name changed.
+                        self._SpotifyConnectDevices.UpdateSortOrder(scDevice)
+                        self._SetDeviceChanged(scDevice)
 
                         # raise event.
                         self._RaiseDeviceUpdated(scDevice)
@@ -2082,6 +2885,9 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 # trace.
                 _logsi.EnterMethod(SILevel.Debug)
 
+                # note discovery activity (used to detect when initial discovery has settled).
+                self._SetDiscoveryActivity()
+
                 # get cast device instance by discovery key.
                 # note that we cannot use discovery name here, as Google Groups use different
                 # names that refer to the same key value!
@@ -2104,6 +2910,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                             _logsi.LogVerbose("Chromecast Multizone Controller Listener is being removed for Cast device: \"%s\" (%s) [%s]" % (zeroconfDiscoveryResult.DeviceName, zeroconfDiscoveryResult.Name, zeroconfDiscoveryResult.Key), colorValue=SIColors.Lavender)
                             castMultizoneController.tear_down()
                             self._CastMultiZoneControllers.pop(zeroconfDiscoveryResult.Key, None)
+                            self._CastMultiZoneControllerListeners.pop(zeroconfDiscoveryResult.Key, None)
 
                     except Exception as ex:
 
@@ -2134,6 +2941,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                     # remove existing Spotify Connect Device instance from devices collection.
                     scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.Items.pop(idx)
                     self._SpotifyConnectDevices.DateLastRefreshed = datetime.utcnow().timestamp()
+                    self._SetDeviceChanged()
 
                     # trace.
                     _logsi.LogObject(SILevel.Verbose, "Chromecast Zeroconf removed SpotifyConnectDevices collection entry: \"%s\" (%s)" % (scDevice.Name, scDevice.DiscoveryResult.Name), scDevice, excludeNonPublic=True, colorValue=SIColors.DarkOrange)
@@ -2246,6 +3054,8 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                     scDevice.DeviceInfo.Status = info.Status
                     scDevice.DeviceInfo.StatusString = info.StatusString
 
+                self._SetDeviceChanged(scDevice)
+
                 # trace.
                 _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DeviceInfo / getInfo, OnCastGetInfoResponseReceived)" % (scDevice.Title), scDevice.DeviceInfo, excludeNonPublic=True)
 
@@ -2280,6 +3090,7 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 scDevice.ZeroconfResponseInfo.SpotifyError = response.SpotifyError
                 scDevice.ZeroconfResponseInfo.Status = response.Status
                 scDevice.ZeroconfResponseInfo.StatusString = response.StatusString
+                self._SetDeviceChanged(scDevice)
 
                 # trace.
                 _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: \"%s\" (ZeroconfResponseInfo)" % (scDevice.Name), scDevice.ZeroconfResponseInfo, excludeNonPublic=True)
@@ -2317,6 +3128,9 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 # trace.
                 _logsi.EnterMethod(SILevel.Debug)
 
+                # note discovery activity (used to detect when initial discovery has settled).
+                self._SetDiscoveryActivity()
+
                 # add / update discovered results by serviceinfo key value. 
                 # we use the serviceinfo NAME value (not KEY) since some manufacturers use random ip port 
                 # numbers, and the port number could have been updated.  in this case, the name SHOULD remain the same.
@@ -2355,157 +3169,42 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                     if (zeroconfDiscoveryResult.SpotifyConnectCPath is None):
                         _logsi.LogWarning("Spotify Connect device Zeroconf ServiceInfo data did not contain a CPath value: \"%s\" (%s)" % (zeroconfDiscoveryResult.DeviceName, zeroconfDiscoveryResult.Name))
 
-                    try:
-
-                        # trace.
-                        _logsi.LogVerbose("Retrieving Spotify Connect device information: %s" % (zeroconfDiscoveryResult.Id))
-
-                        # create connection object to retrieve spotify connect device information (via direct ip address).
-                        zconn:ZeroconfConnect = ZeroconfConnect(
-                            zeroconfDiscoveryResult.HostIpAddress,
-                            zeroconfDiscoveryResult.HostIpPort,
-                            zeroconfDiscoveryResult.SpotifyConnectCPath,
-                            zeroconfDiscoveryResult.SpotifyConnectVersion,
-                            useSSL=False,
-                            tokenStorageDir=self.SpotifyClientInstance.TokenStorageDir,
-                            tokenStorageFile=self.SpotifyClientInstance.TokenStorageFile
-                        )
-
-                        # retrieve initial spotify connect device information (by ip address).
-                        scDevice.DeviceInfo = zconn.GetInformation()
-                        scDevice.Id = scDevice.DeviceInfo.DeviceId
-                        scDevice.Name = scDevice.DeviceInfo.RemoteName
-
-                        # if remote name was not specified, then set device name to first alias name.
-                        # note that we will not reset the RemoteName, as the "" value indicates an alias is in use.
-                        if ((scDevice.DeviceInfo.RemoteName + "").strip() == ""):
-                            if (scDevice.DeviceInfo.HasAliases):
-                                _logsi.LogVerbose("Spotify Connect Zeroconf GetInformation alias name will be utilized for Zeroconf Discovery Result: \"%s\" (%s)" % (zeroconfDiscoveryResult.DeviceName, zeroconfDiscoveryResult.Name))
-                                scDevice.Name = scDevice.DeviceInfo.Aliases[0].Name
-
-                    except Exception as ex:
+                    # was device information retrieved for this host and TXT record recently?  if so, then
+                    # re-use it; otherwise, it is retrieved on the getInfo worker pool so that a slow (or
+                    # offline) device does not delay the discovery of other devices.
+                    cacheKey:tuple = self._GetInfoCacheKey(zeroconfDiscoveryResult)
+                    cacheEntry:tuple = self._GetInfoCache.get(cacheKey, None)
+                    if (cacheEntry is not None) and ((time.monotonic() - cacheEntry[0]) <= GETINFO_CACHE_TTL):
 
                         # trace.
-                        _logsi.LogVerbose("Could not retrieve Spotify Connect device information by ip address; retrying with DNS server alias \"%s\"" % (zeroconfDiscoveryResult.Server))
+                        _logsi.LogVerbose("Spotify Connect device information was retrieved from the getInfo cache: %s" % (zeroconfDiscoveryResult.Id))
 
-                        try:
+                        # add new Spotify Connect Device to devices collection.
+                        self._SetDeviceInformation(scDevice, copy.deepcopy(cacheEntry[1]), cacheEntry[2])
+                        self._AddSpotifyConnectDevice(scDevice)
 
-                            # *IMPORTANT* This call can take up to 20 seconds to timeout because it is using DNS
-                            # resolution to find the device.  the timeout is a system-level value, so it cannot be
-                            # controlled by this api!
-                        
-                            # create connection object to retrieve spotify connect device information (via dns alias).
-                            zconn:ZeroconfConnect = ZeroconfConnect(
-                                zeroconfDiscoveryResult.Server,
-                                zeroconfDiscoveryResult.HostIpPort,
-                                zeroconfDiscoveryResult.SpotifyConnectCPath,
-                                zeroconfDiscoveryResult.SpotifyConnectVersion,
-                                useSSL=False,
-                                tokenStorageDir=self.SpotifyClientInstance.TokenStorageDir,
-                                tokenStorageFile=self.SpotifyClientInstance.TokenStorageFile
-                            )
-
-                            # retrieve initial spotify connect device information (by dns alias).
-                            scDevice.DeviceInfo = zconn.GetInformation()
-                            scDevice.Id = scDevice.DeviceInfo.DeviceId
-                            scDevice.Name = scDevice.DeviceInfo.RemoteName
-                    
-                            # if remote name was not specified, then set device name to first alias name.
-                            # note that we will not reset the RemoteName, as the "" value indicates an alias is in use.
-                            if ((scDevice.DeviceInfo.RemoteName + "").strip() == ""):
-                                if (scDevice.DeviceInfo.HasAliases):
-                                    _logsi.LogVerbose("Spotify Connect Zeroconf GetInformation alias name will be utilized for Zeroconf Discovery Result: \"%s\" (%s)" % (zeroconfDiscoveryResult.DeviceName, zeroconfDiscoveryResult.Name))
-                                    scDevice.Name = scDevice.DeviceInfo.Aliases[0].Name
-
-                            # update HostIpAddress in discovery result so it knows to use the dns alias
-                            # instead of the ip address.
-                            _logsi.LogVerbose("Spotify Connect Zeroconf GetInformation call for Instance Name \"%s\" (%s) was resolved using DNS Server alias; HostIpAddress will be updated with the resolved ip address" % (zeroconfDiscoveryResult.DeviceName, zeroconfDiscoveryResult.Server))
-                            resolvedIpAddress = socket.gethostbyname(zeroconfDiscoveryResult.Server)
-                            zeroconfDiscoveryResult.HostIpAddress = resolvedIpAddress
-                            
-                        except Exception as ex:
-                            
-                            # trace.
-                            _logsi.LogException("Spotify Connect Zeroconf GetInformation call failed for device instance \"%s\" (ip=%s:%s): %s" % (scDevice.Name, zeroconfDiscoveryResult.HostIpAddress, zeroconfDiscoveryResult.HostIpPort, str(ex)), ex, logToSystemLogger=False)
-                    
-                            # if Getinformation call failed, then default device information.
-                            scDevice.DeviceInfo = ZeroconfGetInfo()
-                            scDevice.DeviceInfo.DeviceId = "getInfoError"
-                            scDevice.DeviceInfo.RemoteName = zeroconfDiscoveryResult.DeviceName
-                            scDevice.DeviceInfo.ResponseSource = "spotifywebapiPython"
-                            scDevice.DeviceInfo.Status = 9999
-                            scDevice.DeviceInfo.StatusString = str(ex)
-                            scDevice.Id = scDevice.DeviceInfo.DeviceId
+                    elif (self._SubmitGetInfoProbe(zeroconfDiscoveryResult)):
 
-                    # did this device change from a dynamic device (e.g. non-zeroconf) to a zeroconf device?
-                    # this can happen if the device is initially added as a dynamic device, then the zeroconf
-                    # device is discovered.  if so, we will remove the dynamic device entry.
-                    spDynamicDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.GetDeviceById(scDevice.DeviceInfo.DeviceId)
-                    if (spDynamicDevice is not None):
+                        # add a placeholder entry to devices collection (sorted by device name); the entry is
+                        # filled in (and the `DeviceAdded` event raised) when the getInfo request completes.
+                        scDevice.DeviceInfo = self._GetDeviceInformationPlaceholder(zeroconfDiscoveryResult, GETINFO_DEVICEID_PENDING, "getInfo request pending")
+                        scDevice.Id = scDevice.DeviceInfo.DeviceId
+                        self._SpotifyConnectDevices.AddSorted(scDevice)
+                        self._SpotifyConnectDevices.DateLastRefreshed = datetime.utcnow().timestamp()
+                        self._SetDeviceChanged(scDevice)
 
                         # trace.
-                        _logsi.LogVerbose("Spotify Connect Zeroconf is converting SpotifyConnectDevice entry %s from dynamic to zeroconf" % (spDynamicDevice.Title))
-
-                        # copy real-time status dynamic properties to zerconf object.
-                        scDevice.IsActiveDevice = spDynamicDevice.IsActiveDevice
-                        scDevice.IsInDeviceList = spDynamicDevice.IsInDeviceList
-
-                        # at this point we will remove the device from the collection so that it can be
-                        # replaced with the static device entry; this will also remove any duplicate
-                        # device id entries, which can appear for some manufacturers when devices are 
-                        # grouped, zoned, or stereo paired (e.g. Bose).
-                        dynamicOnly:bool = True
-                        if (scDevice.DiscoveryResult.IsDynamicDevice == False) and (spDynamicDevice.DiscoveryResult.IsDynamicDevice == False):
-                            dynamicOnly = False
-                        self.RemoveDevice(spDynamicDevice.Id, dynamicDeviceOnly=dynamicOnly)
-
-                    # add new Spotify Connect Device to devices collection.
-                    self._SpotifyConnectDevices.Items.append(scDevice)
-                    self._SpotifyConnectDevices.DateLastRefreshed = datetime.utcnow().timestamp()
-
-                    # trace.
-                    _logsi.LogObject(SILevel.Verbose, "Spotify Connect Zeroconf added SpotifyConnectDevices collection entry: \"%s\" (%s)" % (scDevice.Name, scDevice.DiscoveryResult.Name), scDevice, excludeNonPublic=True, colorValue=SIColors.ForestGreen)
-                    _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DeviceInfo / getInfo)" % (scDevice.Title), scDevice.DeviceInfo, excludeNonPublic=True)
-                    _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DiscoveryResult) [%s]" % (scDevice.Title, scDevice.DiscoveryResult.HostIpTitle), scDevice.DiscoveryResult, excludeNonPublic=True)
-
-                    # sort devices collection by device name.
-                    if (len(self._SpotifyConnectDevices.Items) > 0):
-                        self._SpotifyConnectDevices.Items.sort(key=lambda x: (x.Name or "").lower(), reverse=False)
-
-                    try:
+                        _logsi.LogVerbose("Spotify Connect Zeroconf added SpotifyConnectDevices placeholder entry (getInfo request pending): \"%s\" (%s)" % (scDevice.Name, scDevice.DiscoveryResult.Name))
 
-                        # is this a Sonos device?
-                        if (scDevice.IsSonos):
-
-                            # create a Sonos Controller instance for the device, retrieve the Sonos speaker information, 
-                            # and add it to the Sonos players collection.  use device ip address as the key, as the
-                            # Spotify Web API reports "id=null" for restricted devices in playerstate!
-                            _logsi.LogVerbose("Sonos device detected; creating Sonos Controller instance for device: %s (ip=%s)" % (scDevice.Title, zeroconfDiscoveryResult.HostIpAddress))
-                            sonosPlayer:SoCo = SoCo(zeroconfDiscoveryResult.HostIpAddress)
-                            self._SonosPlayers[zeroconfDiscoveryResult.HostIpAddress] = sonosPlayer
-
-                            try:
-                                sonosPlayer.get_speaker_info()
-                            except Exception as ex:
-                                _logsi.LogException("Could not get speaker info for Sonos Controller instance: %s" % (str(ex)), ex, logToSystemLogger=False)
-
-                            # trace.
-                            if (_logsi.IsOn(SILevel.Verbose)):
-                                _logsi.LogObject(SILevel.Verbose, "Sonos Controller instance for device: %s" % (scDevice.Title), sonosPlayer)
-                                _logsi.LogDictionary(SILevel.Verbose, "Sonos Controller instance for device: %s (speaker_info)" % (scDevice.Title), sonosPlayer.speaker_info)
-                                _logsi.LogObject(SILevel.Verbose, "Sonos Controller instance for device: %s (group)" % (scDevice.Title), sonosPlayer.group)
-                                _logsi.LogObject(SILevel.Verbose, "Sonos Controller instance for device: %s (zone_group_state)" % (scDevice.Title), sonosPlayer.zone_group_state)
-                                _logsi.LogEnumerable(SILevel.Verbose, "Sonos Controller instance for device: %s (all_zones)" % (scDevice.Title), sonosPlayer.all_zones)
-
-                    except:
-
-                        # trace.
-                        _logsi.LogException("%s - Could not create Sonos Control API reference: %s" % (self.name, str(ex)), ex, logToSystemLogger=False)
-            
-                        # ignore exceptions, as there is nothing we can do at this point.
+                    else:
 
-                    # raise event.
-                    self._RaiseDeviceAdded(scDevice)
+                        # device could not be reached recently; add it with default device information.
+                        # the getInfo request is retried on a later zeroconf update, after the retry delay.
+                        failure:tuple = self._GetInfoFailures.get(cacheKey, None)
+                        _logsi.LogVerbose("Spotify Connect device information retrieval is being retried later (device could not be reached recently): %s" % (zeroconfDiscoveryResult.Id))
+                        scDevice.DeviceInfo = self._GetDeviceInformationPlaceholder(zeroconfDiscoveryResult, GETINFO_DEVICEID_ERROR, failure[2] if (failure is not None) else None)
+                        scDevice.Id = scDevice.DeviceInfo.DeviceId
+                        self._AddSpotifyConnectDevice(scDevice)
 
                 else:
 
@@ -2515,6 +3214,11 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                     # get existing Spotify Connect Device instance.
                     scDevice = self._SpotifyConnectDevices.Items[idx]
 
+                    # did the device information retrieval fail for this device?  if so, then retry it
+                    # (once the retry delay has elapsed).
+                    if (scDevice.DeviceInfo.DeviceId == GETINFO_DEVICEID_ERROR):
+                        self._SubmitGetInfoProbe(zeroconfDiscoveryResult)
+
                     # were any changes made to the zeroconf discovery results?
                     if (not scDevice.DiscoveryResult.Equals(zeroconfDiscoveryResult)):
 
@@ -2525,6 +3229,11 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                         # set zeroconf discovery result properties.
                         scDevice.DiscoveryResult = zeroconfDiscoveryResult
 
+                        # is this a placeholder entry whose getInfo request is still pending?  if so, then
+                        # its id properties are left alone, so that the entry is still added (and the
+                        # `DeviceAdded` event raised) when the getInfo request completes.
+                        isPending:bool = (scDevice.DeviceInfo.DeviceId == GETINFO_DEVICEID_PENDING)
+
                         # did the device name change?  if so, then update name and id properties,
                         # as well as the corresponding getInfo properties.
                         if (scDevice.Name != zeroconfDiscoveryResult.DeviceName):
@@ -2532,9 +3241,10 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                             newDeviceId:str = self.GetSpotifyDeviceIDFromName(zeroconfDiscoveryResult.DeviceName)
                             _logsi.LogVerbose("Spotify Connect Zeroconf SpotifyConnectDevice entry name and id changed from %s to \"%s\" (%s)" % (scDevice.Title, newDeviceName, newDeviceId))
                             scDevice.Name = newDeviceName
-                            scDevice.Id = newDeviceId
-                            scDevice.DeviceInfo.DeviceId = newDeviceId
                             scDevice.DeviceInfo.RemoteName = newDeviceName
+                            if (not isPending):
+                                scDevice.Id = newDeviceId
+                                scDevice.DeviceInfo.DeviceId = newDeviceId
 
                         # update existing Spotify Connect Device in devices collection.
                         self._SpotifyConnectDevices.Items[idx] = scDevice
@@ -2545,12 +3255,13 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                         _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DeviceInfo / getInfo)" % (scDevice.Title), scDevice.DeviceInfo, excludeNonPublic=True)
                         _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DiscoveryResult) [%s]" % (scDevice.Title, scDevice.DiscoveryResult.HostIpTitle), scDevice.DiscoveryResult, excludeNonPublic=True)
 
-                        # sort devices collection by device name.
-                        if (len(self._SpotifyConnectDevices.Items) > 0):
-                            self._SpotifyConnectDevices.Items.sort(key=lambda x: (x.Name or "").lower(), reverse=False)
+                        # move the device to its sorted position (by device name), in case the name changed.
+                        self._SpotifyConnectDevices.UpdateSortOrder(scDevice)
+                        self._SetDeviceChanged(scDevice)
 
-                        # raise event.
-                        self._RaiseDeviceUpdated(scDevice)
+                        # raise event (placeholder entries have not been announced yet).
+                        if (not isPending):
+                            self._RaiseDeviceUpdated(scDevice)
 
                     else:
 
@@ -2592,6 +3303,9 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 # trace.
                 _logsi.EnterMethod(SILevel.Debug)
 
+                # note discovery activity (used to detect when initial discovery has settled).
+                self._SetDiscoveryActivity()
+
                 # remove discovered results by serviceinfo key value. 
                 # we use the serviceinfo NAME value (not KEY) since that is the only information available on
                 # a remove serviceinfo request.
@@ -2609,14 +3323,16 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                     # remove existing Spotify Connect Device instance from devices collection.
                     scDevice:SpotifyConnectDevice = self._SpotifyConnectDevices.Items.pop(idx)
                     self._SpotifyConnectDevices.DateLastRefreshed = datetime.utcnow().timestamp()
+                    self._SetDeviceChanged()
 
                     # trace.
                     _logsi.LogObject(SILevel.Verbose, "Spotify Connect Zeroconf removed SpotifyConnectDevices collection entry: \"%s\" (%s)" % (scDevice.Name, scDevice.DiscoveryResult.Name), scDevice, excludeNonPublic=True, colorValue=SIColors.DarkOrange)
                     _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DeviceInfo / getInfo)" % (scDevice.Title), scDevice.DeviceInfo, excludeNonPublic=True)
                     _logsi.LogObject(SILevel.Debug, "SpotifyConnectDevice info: %s (DiscoveryResult) [%s]" % (scDevice.Title, scDevice.DiscoveryResult.HostIpTitle), scDevice.DiscoveryResult, excludeNonPublic=True)
 
-                    # raise event.
-                    self._RaiseDeviceRemoved(scDevice)
+                    # raise event (placeholder entries were never announced, so they are removed quietly).
+                    if (scDevice.DeviceInfo.DeviceId != GETINFO_DEVICEID_PENDING):
+                        self._RaiseDeviceRemoved(scDevice)
 
             except Exception as ex:
 
@@ -2643,6 +3359,9 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 Spotify Connect device that was added.
         """
         try:
+
+            # publish the change first, so that handlers see it in the devices snapshot.
+            self._PublishDevices()
         
             # raise event.
             args:SpotifyConnectDeviceEventArgs = SpotifyConnectDeviceEventArgs(device)
@@ -2691,6 +3410,9 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 Spotify Connect device that was removed.
         """
         try:
+
+            # publish the change first, so that handlers see it in the devices snapshot.
+            self._PublishDevices()
         
             # raise event.
             args:SpotifyConnectDeviceEventArgs = SpotifyConnectDeviceEventArgs(device)
@@ -2739,6 +3461,9 @@ class SpotifyConnectDirectoryTask(threading.Thread):
                 Spotify Connect device that was updated.
         """
         try:
+
+            # publish the change first, so that handlers see it in the devices snapshot.
+            self._PublishDevices()
         
             # raise event.
             args:SpotifyConnectDeviceEventArgs = SpotifyConnectDeviceEventArgs(device)
@@ -1,10 +1,9 @@
 # external package imports.
 from pychromecast import Chromecast
 import threading
-import time
 
 # our package imports.
-from .spotifyconnectzeroconfcastcontroller import SpotifyConnectZeroconfCastController, TYPE_LAUNCH_ERROR, WAIT_INTERVAL
+from .spotifyconnectzeroconfcastcontroller import SpotifyConnectZeroconfCastController, TYPE_LAUNCH_ERROR
 from spotifywebapipython.spotifyauthtoken import SpotifyAuthToken
 from spotifywebapipython.zeroconfapi import ZeroconfGetInfo, ZeroconfResponse
 from spotifywebapipython.oauthcli.authclient import AuthClient
@@ -79,6 +78,7 @@ class SpotifyConnectZeroconfCastAppTask(threading.Thread):
         self._IsStopRequested:bool = False
         self._SpotifyConnectZeroconfCastController:SpotifyConnectZeroconfCastController = None
         self._SpotifyClientInstance = spotifyClientInstance
+        self._StopEvent = threading.Event()   # posted when the task has been asked to stop.
         self._TransferPlayback:bool = transferPlayback
         self._ZeroconfResponseReceivedCallback = zeroconfResponseReceivedCallback
 
@@ -121,6 +121,14 @@ class SpotifyConnectZeroconfCastAppTask(threading.Thread):
         """
         if isinstance(value, bool):
             self._IsStopRequested = value
+            if (value):
+                self._StopEvent.set()
+
+                # wake up a pending playback transfer wait; the stop request is checked when it returns.
+                if (self._SpotifyConnectZeroconfCastController is not None):
+                    self._SpotifyConnectZeroconfCastController.waitPlaybackTransfer.set()
+            else:
+                self._StopEvent.clear()
 
 
     @property
@@ -306,18 +314,16 @@ class SpotifyConnectZeroconfCastAppTask(threading.Thread):
             # through the `PlayerTransferPlayback` executed above OR from another Spotify Connect 
             # capable player.
             timeout:float = 20.0
-            counter:float = 0
-            while counter < (timeout + 1):
-                if (self._SpotifyConnectZeroconfCastController.waitPlaybackTransfer.wait(WAIT_INTERVAL)):
-                    if (self._SpotifyConnectZeroconfCastController.isPlaybackTransferError):
-                        self._PostLaunchErrorEvent(1001, "Playback transfer error: %s" % (self._SpotifyConnectZeroconfCastController.zeroconfResponse.StatusString))
-                        return
-                    break
-                if (counter >= timeout):
-                    self._PostLaunchErrorEvent(1002, "Playback transfer error - Timed out waiting for playback transfer to device.")
-                    return
-                counter += WAIT_INTERVAL
-                _logsi.LogVerbose("Waiting for transferSuccess Chromecast Message (%f seconds from initial request)" % (counter))
+            _logsi.LogVerbose("Waiting for transferSuccess Chromecast Message (up to %f seconds)" % (timeout))
+            if (not self._SpotifyConnectZeroconfCastController.waitPlaybackTransfer.wait(timeout)):
+                self._PostLaunchErrorEvent(1002, "Playback transfer error - Timed out waiting for playback transfer to device.")
+                return
+            if (self.IsStopRequested):
+                _logsi.LogVerbose("%s - Thread task stop requested" % (self.name))
+                return
+            if (self._SpotifyConnectZeroconfCastController.isPlaybackTransferError):
+                self._PostLaunchErrorEvent(1001, "Playback transfer error: %s" % (self._SpotifyConnectZeroconfCastController.zeroconfResponse.StatusString))
+                return
 
             # update task status.
             _logsi.LogVerbose("%s - Transfer Playback complete for loginId \"%s\"" % (self.name, self.SpotifyClientInstance.SpotifyConnectLoginId))
@@ -327,13 +333,9 @@ class SpotifyConnectZeroconfCastAppTask(threading.Thread):
 
             # event loop; we have to keep this thread active in order to keep the 
             # Spotify App on the Chromecast device active and available.
-            while True:
-                
-                # keep going until we are asked to stop.
-                if (self.IsStopRequested):
-                    _logsi.LogVerbose("%s - Thread task stop requested" % (self.name))
-                    break
-                time.sleep(0.50)
+            # keep going until we are asked to stop.
+            self._StopEvent.wait()
+            _logsi.LogVerbose("%s - Thread task stop requested" % (self.name))
 
             # trace.
             _logsi.LogVerbose("%s - Thread task was stopped" % (self.name))
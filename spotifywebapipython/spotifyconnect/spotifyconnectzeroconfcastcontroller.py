@@ -53,8 +53,6 @@ TYPE_LAUNCH_ERROR = "launchError"
 
 SPOTIFY_WEB_API_DEVICEAUTH_REFRESH = "https://spclient.wg.spotify.com/device-auth/v1/refresh"
 
-WAIT_INTERVAL:float = 0.5
-
 
 class SpotifyConnectZeroconfCastController(BaseController):
     """
@@ -179,14 +177,9 @@ class SpotifyConnectZeroconfCastController(BaseController):
 
         # wait for the launched spotify app to fully initialize.  this occurs when we receive one
         # of the following messages: `addUserResponse`, `addUserError`, `getInfoError`, `launchError`.
-        counter:float = 0
-        while counter < (timeout + 1):
-            if (self.waitAddUser.wait(WAIT_INTERVAL)):
-                break
-            if (counter >= timeout):
-                raise SpotifyZeroconfApiError(0, "Timed out while waiting for a response", "launch_app", "timeout")
-            counter += WAIT_INTERVAL
-            _logsi.LogVerbose("Waiting for Spotify Cast App to launch (%f seconds from initial request)" % (counter))
+        _logsi.LogVerbose("Waiting for Spotify Cast App to launch (up to %f seconds)" % (timeout))
+        if (not self.waitAddUser.wait(timeout)):
+            raise SpotifyZeroconfApiError(0, "Timed out while waiting for a response", "launch_app", "timeout")
 
         # check for error conditions.
         if (self.isAddUserError):
@@ -589,16 +582,11 @@ class SpotifyConnectZeroconfCastController(BaseController):
                 return
             
             # if we are NOT in the process of launching, then we will wait for a response here.
-            counter:float = 0
-            while counter < (timeout + 1):
-                if (self.waitAddUser.wait(WAIT_INTERVAL)):
-                    if (self.isAddUserError):
-                        raise SpotifyZeroconfApiError(self.zeroconfResponse.Status, "AddUser request failed", "AddUser", self.zeroconfResponse.StatusString)
-                    break
-                if (counter >= timeout):
-                    raise SpotifyZeroconfApiError(0, "Timed out while waiting for a response", "AddUser", "timeout")
-                counter += WAIT_INTERVAL
-                _logsi.LogVerbose("Waiting for addUserResponse Chromecast Message payload (%f seconds from initial request)" % (counter), colorValue=SIColors.Tan)
+            _logsi.LogVerbose("Waiting for addUserResponse Chromecast Message payload (up to %f seconds)" % (timeout), colorValue=SIColors.Tan)
+            if (not self.waitAddUser.wait(timeout)):
+                raise SpotifyZeroconfApiError(0, "Timed out while waiting for a response", "AddUser", "timeout")
+            if (self.isAddUserError):
+                raise SpotifyZeroconfApiError(self.zeroconfResponse.Status, "AddUser request failed", "AddUser", self.zeroconfResponse.StatusString)
 
             # if we make it here, then addUser request was processed successfully.
             return
@@ -683,16 +671,11 @@ class SpotifyConnectZeroconfCastController(BaseController):
                 return True
 
             # if we are NOT in the process of launching, then we will wait for a response here.
-            counter:float = 0
-            while counter < (timeout + 1):
-                if (self.waitGetInfo.wait(WAIT_INTERVAL)):
-                    if (self.isGetInfoError):
-                        raise SpotifyZeroconfApiError(self.zeroconfGetInfo.Status, "GetInformation request failed", "GetInformation", self.zeroconfGetInfo.StatusString)
-                    break
-                if (counter >= timeout):
-                    raise SpotifyZeroconfApiError(0, "Timed out while waiting for a response", "GetInformation", "timeout")
-                counter += WAIT_INTERVAL
-                _logsi.LogVerbose("Waiting for getInfoResponse Chromecast Message payload (%f seconds from initial request)" % (counter), colorValue=SIColors.Tan)
+            _logsi.LogVerbose("Waiting for getInfoResponse Chromecast Message payload (up to %f seconds)" % (timeout), colorValue=SIColors.Tan)
+            if (not self.waitGetInfo.wait(timeout)):
+                raise SpotifyZeroconfApiError(0, "Timed out while waiting for a response", "GetInformation", "timeout")
+            if (self.isGetInfoError):
+                raise SpotifyZeroconfApiError(self.zeroconfGetInfo.Status, "GetInformation request failed", "GetInformation", self.zeroconfGetInfo.StatusString)
 
             # if we make it here, then getInfo request was processed successfully.
             # return response to the caller.
@@ -71,6 +71,13 @@ class SpotifyConnectZeroconfCastMultiZoneControllerListener(MultiZoneControllerL
         self._ZeroconfInstance:Zeroconf = zeroconfInstance
         self._Zeroconf_RLock:threading.RLock = zeroconf_RLock
 
+        # define all threading events raised by this class.
+        self.WaitForStatusReceived = threading.Event()
+        """
+        Event that will be posted when a multizone status has been received (e.g. in response to
+        a `MultizoneController.update_members` request).
+        """
+
 
     def multizone_member_added(
         self, 
@@ -202,6 +209,10 @@ class SpotifyConnectZeroconfCastMultiZoneControllerListener(MultiZoneControllerL
         """
         Called when Multizone status has been updated.
         """
+        # inform waiters that the member list was updated; this is done before taking the lock, 
+        # as the waiter could be holding it.
+        self.WaitForStatusReceived.set()
+
         # use lock, as multiple threads could be calling this method simultaneously.
         with self._Zeroconf_RLock:
 
@@ -0,0 +1,225 @@
+# external package imports.
+from typing import Callable
+
+# our package imports.
+from .sautils import export
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+@export
+class SpotifyItemFilter:
+    """
+    Applies name / uri filter criteria (and custom predicates) to a list of items in a single
+    linear pass.
+
+    Each criteria is applied to a field of the item (e.g. the track, its album, or its artists),
+    which is obtained via a selector method.  When the filter is applied, a lowercased name / uri
+    index is built once for each field; all criteria and predicates are then evaluated against
+    each item, and the items that match all of them are kept (in their original order).
+
+    A criteria value that is a Spotify URI (e.g. `spotify:artist:6APm8EjxOHSYM5B4i3vT3q`) matches
+    items whose field uri is equal to it; any other value matches items whose field name contains it.
+    Both comparisons are case-insensitive.
+
+    <details>
+        <summary>View Sample Code</summary>
+    ```python
+    itemFilter = SpotifyItemFilter()
+    itemFilter.AddCriteria('artist', 'Queen', lambda item: item.Track.Artists)
+    itemFilter.AddCriteria('album', 'greatest', lambda item: item.Track.Album)
+    itemFilter.AddPredicate(SpotifyItemFilter.Any(
+        lambda item: item.Track.Explicit,
+        lambda item: (item.Track.DurationMS or 0) > 300000,
+    ))
+    itemFilter.Apply(result.Items)
+    ```
+    </details>
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+        """
+        self._Criteria:list[tuple] = []
+        self._Fields:dict[str, Callable] = {}
+        self._Predicates:list[Callable] = []
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def IsEmpty(self) -> bool:
+        """
+        True if no criteria or predicates have been added to the filter; otherwise, False.
+        """
+        return (len(self._Criteria) == 0) and (len(self._Predicates) == 0)
+
+
+    @staticmethod
+    def _IndexField(value:object) -> tuple:
+        """
+        Returns a tuple of (lowercased name, lowercased uri) tuples for a field value, which
+        can be a single object or a list of objects (e.g. artists).
+        """
+        if value is None:
+            return ()
+        if not isinstance(value, (list, tuple)):
+            value = (value,)
+        return tuple(((getattr(obj, 'Name', None) or "").lower(), (getattr(obj, 'Uri', None) or "").lower()) for obj in value if obj is not None)
+
+
+    def AddCriteria(
+        self,
+        fieldName:str,
+        criteria:str,
+        selector:Callable,
+        ) -> 'SpotifyItemFilter':
+        """
+        Adds name / uri filter criteria for a field of the item.
+
+        Args:
+            fieldName (str):
+                Name of the field (e.g. "track", "album", "artist"); criteria with the same field
+                name share the same index, and must use an equivalent selector.
+            criteria (str):
+                Value to compare; a Spotify URI matches the field uri exactly, otherwise the value
+                is searched for in the field name.  A null value is ignored.
+            selector (Callable):
+                Method that returns the field value of an item (e.g. `lambda item: item.Track.Album`);
+                the field value must contain `Name` and `Uri` attributes, or be a list of such objects
+                (in which case the criteria matches if any of the objects match).
+
+        Returns:
+            This filter instance, so that calls can be chained.
+        """
+        if criteria is None:
+            return self
+
+        # import here to avoid a circular import at module load time.
+        from .spotifyclient import SpotifyClient
+
+        compare:str = criteria.lower()
+        isUri:bool = SpotifyClient.IsSpotifyUri(compare)
+        self._Fields.setdefault(fieldName, selector)
+        self._Criteria.append((fieldName, compare, isUri))
+        return self
+
+
+    def AddPredicate(
+        self,
+        predicate:Callable,
+        ) -> 'SpotifyItemFilter':
+        """
+        Adds a custom predicate to the filter.
+
+        Args:
+            predicate (Callable):
+                Method that is called with an item, and returns True if the item should be kept.
+                Use the `All`, `Any` and `Not` methods to build compound predicates.
+
+        Returns:
+            This filter instance, so that calls can be chained.
+        """
+        if predicate is not None:
+            self._Predicates.append(predicate)
+        return self
+
+
+    @staticmethod
+    def All(*predicates:Callable) -> Callable:
+        """
+        Returns a predicate that is True if all of the specified predicates are True.
+        """
+        return lambda item: all(predicate(item) for predicate in predicates)
+
+
+    @staticmethod
+    def Any(*predicates:Callable) -> Callable:
+        """
+        Returns a predicate that is True if any of the specified predicates are True.
+        """
+        return lambda item: any(predicate(item) for predicate in predicates)
+
+
+    @staticmethod
+    def Not(predicate:Callable) -> Callable:
+        """
+        Returns a predicate that is True if the specified predicate is False.
+        """
+        return lambda item: not predicate(item)
+
+
+    def Apply(
+        self,
+        items:list,
+        ) -> list:
+        """
+        Removes items that do not match the filter from the specified list (in place).
+
+        Args:
+            items (list):
+                List of items to filter; the list is updated in place, and the order of the
+                remaining items is preserved.
+
+        Returns:
+            The `items` list argument.
+        """
+        if (items is None) or (self.IsEmpty) or (len(items) == 0):
+            return items
+
+        _logsi.LogVerbose("Applying filter criteria to results list: %s" % (self.ToString()))
+
+        # build the lowercased name / uri index of each field once.
+        index:dict[str, list] = {}
+        for fieldName, selector in self._Fields.items():
+            index[fieldName] = [SpotifyItemFilter._IndexField(selector(item)) for item in items]
+
+        # evaluate all criteria and predicates against each item in one pass.
+        criteria:list[tuple] = self._Criteria
+        predicates:list[Callable] = self._Predicates
+        keep:list = []
+        for idx, item in enumerate(items):
+            isMatch:bool = True
+            for fieldName, compare, isUri in criteria:
+                entries:tuple = index[fieldName][idx]
+                if isUri:
+                    isMatch = any(uri == compare for _, uri in entries)
+                else:
+                    isMatch = any(name.find(compare) > -1 for name, _ in entries)
+                if not isMatch:
+                    break
+            if isMatch:
+                for predicate in predicates:
+                    if not predicate(item):
+                        isMatch = False
+                        break
+            if isMatch:
+                keep.append(item)
+
+        items[:] = keep
+        return items
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SpotifyItemFilter:'
+        for fieldName, compare, _ in self._Criteria:
+            msg = '%s %s="%s"' % (msg, fieldName, compare)
+        if len(self._Predicates) > 0:
+            msg = '%s predicates=%d' % (msg, len(self._Predicates))
+        return msg
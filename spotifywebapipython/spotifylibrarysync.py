@@ -0,0 +1,544 @@
+# external package imports.
+from concurrent.futures import Future
+from datetime import datetime
+import json
+import math
+import os
+import sqlite3
+import threading
+
+# our package imports.
+from .models import *
+from .saappmessages import SAAppMessages
+from .sautils import export
+from .spotifyapierror import SpotifyApiError
+from .spotifyapimessage import SpotifyApiMessage
+from .spotifywebapiauthenticationerror import SpotifyWebApiAuthenticationError
+from .spotifywebapierror import SpotifyWebApiError
+from .const import (
+    SPOTIFYWEBAPIPYTHON_LIBRARY_FILE,
+    TRACE_METHOD_RESULT_TYPE,
+)
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession, SIMethodParmListContext
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+@export
+class SpotifyLibrarySync:
+    """
+    Keeps a persistent local copy of the current user's saved library items (e.g. track, album,
+    show, episode, and audiobook favorites) in a SQLite database, and refreshes it incrementally.
+
+    Saved items are returned by the Spotify Web API in newest-first order.  A refresh retrieves
+    pages from newest to oldest only until a page reaches an item that is already stored (with the
+    same `added_at` value); the new items are then added to the store.  If there are more stored items
+    than the `total` value reported by the Spotify Web API after that (e.g. items were removed from the
+    library), then the stored items are checked (newest first) with the Spotify Web API `contains`
+    endpoint until the removed items are found, and they are deleted from the store.  A full refresh is
+    only performed if the removed items cannot be reconciled that way.
+
+    For a library that has not changed, a refresh requires a single request.
+
+    The raw item dictionaries are stored, so that the same model objects that are returned by the
+    `SpotifyClient` favorites methods can be created from them (e.g. `TrackPageSaved`).
+
+    Items are stored per user profile id, so multiple Spotify accounts can share the same database.
+    """
+
+    LIBRARY_TYPES:dict = \
+    {
+        'albums': ('/me/albums', 'album', 'album'),
+        'audiobooks': ('/me/audiobooks', None, 'audiobook'),
+        'episodes': ('/me/episodes', 'episode', 'episode'),
+        'shows': ('/me/shows', 'show', 'show'),
+        'tracks': ('/me/tracks', 'track', 'track'),
+    }
+    """
+    Supported library types, keyed by library type name; each value contains the Spotify Web API
+    endpoint uri, the item key that contains the saved object (or null if the item is the object),
+    and the object type used to build a Spotify URI from a stored id.
+    """
+
+    CONTAINS_LIMIT:int = 40
+    """
+    Maximum number of uris that can be checked by a single Spotify Web API `contains` request.
+    """
+
+    PAGE_TYPES:dict = \
+    {
+        'albums': AlbumPageSaved,
+        'audiobooks': AudiobookPageSimplified,
+        'episodes': EpisodePageSaved,
+        'shows': ShowPageSaved,
+        'tracks': TrackPageSaved,
+    }
+    """
+    Model page types that are returned by the `GetPage` method, keyed by library type name.
+    """
+
+
+    def __init__(
+        self,
+        client,
+        databasePath:str=None,
+        ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            client (SpotifyClient):
+                A `SpotifyClient` instance that contains the authorization access token and user
+                profile of the library owner.
+            databasePath (str):
+                Path and filename of the SQLite database that stores the library items.
+                Default is null, which stores the database in the `SpotifyClient` token storage
+                directory (e.g. `SpotifyWebApiPython_library.db`).
+        """
+        # get default database path if one was not specified.
+        if databasePath is None:
+            databasePath = os.path.join(os.path.dirname(client._ConfigurationDataPath), SPOTIFYWEBAPIPYTHON_LIBRARY_FILE)
+
+        # initialize storage.
+        self._Client = client
+        self._DatabasePath:str = databasePath
+        self._IsInitialized:bool = False
+        self._RLock:threading.RLock = threading.RLock()
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def DatabasePath(self) -> str:
+        """
+        Path and filename of the SQLite database that stores the library items.
+        """
+        return self._DatabasePath
+
+
+    def _Connect(self) -> sqlite3.Connection:
+        """
+        Opens a connection to the library database, creating the database tables if needed.
+        """
+        conn:sqlite3.Connection = sqlite3.connect(self._DatabasePath, timeout=30)
+        if not self._IsInitialized:
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS library_items ("
+                             "user_id TEXT NOT NULL, library_type TEXT NOT NULL, item_id TEXT NOT NULL, "
+                             "added_at TEXT, position INTEGER NOT NULL, data TEXT NOT NULL, "
+                             "PRIMARY KEY (user_id, library_type, item_id))")
+                conn.execute("CREATE TABLE IF NOT EXISTS library_state ("
+                             "user_id TEXT NOT NULL, library_type TEXT NOT NULL, total INTEGER NOT NULL, "
+                             "last_refreshed REAL NOT NULL, PRIMARY KEY (user_id, library_type))")
+            self._IsInitialized = True
+        return conn
+
+
+    def _GetItemKey(self, libraryType:str, item:dict) -> tuple:
+        """
+        Returns the (id, added_at) values of a saved item, or null if the item contains no information.
+
+        Sometimes the Spotify Web API returns items with no information; these are discarded.
+        """
+        itemKey:str = SpotifyLibrarySync.LIBRARY_TYPES[libraryType][1]
+        obj:dict = item.get(itemKey, None) if (itemKey is not None) else item
+        if (not isinstance(obj, dict)) or (obj.get('uri', None) is None):
+            return None
+        return (obj.get('id', None) or obj['uri'], item.get('added_at', None))
+
+
+    def _GetRemovedItemIds(self, libraryType:str, itemIds:list[str], removedCount:int, maxRequests:int) -> tuple:
+        """
+        Checks stored item ids with the Spotify Web API `contains` endpoint, in the order given,
+        until the specified number of removed items are found.
+
+        Args:
+            libraryType (str):
+                Library type of the items.
+            itemIds (list[str]):
+                Stored item ids to check, newest first.
+            removedCount (int):
+                Number of removed items to find.
+            maxRequests (int):
+                Maximum number of `contains` requests to make.
+
+        Returns:
+            A tuple of the list of removed item ids that were found, and the number of Spotify Web
+            API requests that were made.
+
+        Removals are usually recent favorites, so the newest stored items are checked first and
+        the check stops as soon as all of the removed items have been found.
+        """
+        uriType:str = SpotifyLibrarySync.LIBRARY_TYPES[libraryType][2]
+        removedIds:list[str] = []
+        requestCount:int = 0
+
+        for idx in range(0, len(itemIds), SpotifyLibrarySync.CONTAINS_LIMIT):
+
+            if (len(removedIds) >= removedCount) or (requestCount >= maxRequests):
+                break
+
+            # build uri's from the stored ids (ids without a Spotify id are stored by uri).
+            batchIds:list[str] = itemIds[idx:idx + SpotifyLibrarySync.CONTAINS_LIMIT]
+            arrUris:list[str] = [itemId if (itemId.find(':') != -1) else 'spotify:%s:%s' % (uriType, itemId) for itemId in batchIds]
+
+            msg:SpotifyApiMessage = SpotifyApiMessage('SpotifyLibrarySync', '/me/library/contains')
+            msg.RequestHeaders[self._Client.AuthToken.HeaderKey] = self._Client.AuthToken.HeaderValue
+            msg.UrlParameters = {'uris': ",".join(arrUris)}
+            self._Client.MakeRequest('GET', msg)
+            requestCount += 1
+
+            flags:list = msg.ResponseData
+            if (not isinstance(flags, list)) or (len(flags) != len(batchIds)):
+                break
+            for itemId, isSaved in zip(batchIds, flags):
+                if isSaved is False:
+                    removedIds.append(itemId)
+
+        return (removedIds, requestCount)
+
+
+    def _GetPageMessage(self, libraryType:str, offset:int, limit:int) -> SpotifyApiMessage:
+        """
+        Returns an api message for a page of saved items.
+        """
+        urlParms:dict = \
+        {
+            'limit': limit,
+            'offset': offset,
+        }
+        if libraryType == 'tracks':
+            urlParms['market'] = self._Client._ValidateMarket(None, forceReturnValue=True)
+        elif libraryType == 'albums':
+            market:str = self._Client._ValidateMarket(None)
+            if market is not None:
+                urlParms['market'] = market
+
+        msg:SpotifyApiMessage = SpotifyApiMessage('SpotifyLibrarySync', SpotifyLibrarySync.LIBRARY_TYPES[libraryType][0])
+        msg.RequestHeaders[self._Client.AuthToken.HeaderKey] = self._Client.AuthToken.HeaderValue
+        msg.UrlParameters = urlParms
+        return msg
+
+
+    def _GetUserId(self) -> str:
+        """
+        Returns the user profile id of the library owner.
+        """
+        userId:str = self._Client.UserProfile.Id
+        if userId is None:
+            raise SpotifyApiError(SAAppMessages.ARGUMENT_REQUIRED_ERROR % ('SpotifyLibrarySync', 'client.UserProfile.Id'), logsi=_logsi)
+        return userId
+
+
+    def Clear(
+        self,
+        libraryType:str=None,
+        ) -> None:
+        """
+        Removes stored items of the current user from the library database.
+
+        Args:
+            libraryType (str):
+                Library type to remove (e.g. "tracks"), or null to remove all library types.
+        """
+        with self._RLock:
+            userId:str = self._GetUserId()
+            conn:sqlite3.Connection = self._Connect()
+            try:
+                with conn:
+                    if libraryType is None:
+                        conn.execute("DELETE FROM library_items WHERE user_id=?", (userId,))
+                        conn.execute("DELETE FROM library_state WHERE user_id=?", (userId,))
+                    else:
+                        conn.execute("DELETE FROM library_items WHERE user_id=? AND library_type=?", (userId, libraryType))
+                        conn.execute("DELETE FROM library_state WHERE user_id=? AND library_type=?", (userId, libraryType))
+            finally:
+                conn.close()
+
+
+    def GetItems(
+        self,
+        libraryType:str,
+        ) -> list[dict]:
+        """
+        Returns the stored items of the specified library type, in newest-first order.
+
+        Args:
+            libraryType (str):
+                Library type to return (e.g. "tracks", "albums", "shows", "episodes", "audiobooks").
+
+        Returns:
+            A list of item dictionaries, as returned by the Spotify Web API.
+
+        The store is not refreshed by this method; call the `Refresh` method for that.
+        """
+        with self._RLock:
+            userId:str = self._GetUserId()
+            conn:sqlite3.Connection = self._Connect()
+            try:
+                rows = conn.execute("SELECT data FROM library_items WHERE user_id=? AND library_type=? ORDER BY position",
+                                    (userId, libraryType)).fetchall()
+            finally:
+                conn.close()
+        return [json.loads(row[0]) for row in rows]
+
+
+    def GetPage(
+        self,
+        libraryType:str,
+        refresh:bool=True,
+        ) -> object:
+        """
+        Returns the stored items of the specified library type as a page object.
+
+        Args:
+            libraryType (str):
+                Library type to return (e.g. "tracks", "albums", "shows", "episodes", "audiobooks").
+            refresh (bool):
+                True to refresh the store before the items are returned; otherwise, False.
+                Default is True.
+
+        Returns:
+            A page object (as defined by `PAGE_TYPES`, e.g. `TrackPageSaved` for "tracks") that
+            contains all stored items in newest-first order.
+        """
+        apiMethodName:str = 'GetPage'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("libraryType", libraryType)
+            apiMethodParms.AppendKeyValue("refresh", refresh)
+            _logsi.LogMethodParmList(SILevel.Verbose, "Get stored library items", apiMethodParms)
+
+            # validations.
+            if libraryType not in SpotifyLibrarySync.LIBRARY_TYPES:
+                raise SpotifyApiError(SAAppMessages.ARGUMENT_TYPE_ERROR % (apiMethodName, 'libraryType', '|'.join(SpotifyLibrarySync.LIBRARY_TYPES.keys()), libraryType), logsi=_logsi)
+
+            # refresh the store (if requested).
+            if refresh:
+                self.Refresh(libraryType)
+
+            # process results.
+            items:list[dict] = self.GetItems(libraryType)
+            result = SpotifyLibrarySync.PAGE_TYPES[libraryType](root={'items': items, 'limit': len(items), 'offset': 0, 'total': len(items)})
+            result.DateLastRefreshed = datetime.utcnow().timestamp()
+
+            # trace.
+            _logsi.LogVerbose(TRACE_METHOD_RESULT_TYPE % (apiMethodName, type(result).__name__) + "(%d items)" % len(items))
+            return result
+
+        except SpotifyApiError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+
+            # format unhandled exception.
+            raise SpotifyApiError(SAAppMessages.UNHANDLED_EXCEPTION.format(apiMethodName, str(ex)), ex, logsi=_logsi)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    def Refresh(
+        self,
+        libraryType:str,
+        fullRefresh:bool=False,
+        ) -> int:
+        """
+        Refreshes the stored items of the specified library type from the Spotify Web API.
+
+        Args:
+            libraryType (str):
+                Library type to refresh (e.g. "tracks", "albums", "shows", "episodes", "audiobooks").
+            fullRefresh (bool):
+                True to retrieve all items from the Spotify Web API and replace the stored items;
+                otherwise, False to only retrieve items that were added since the last refresh.
+                Default is False.
+
+        Returns:
+            The number of Spotify Web API requests that were made.
+
+        Raises:
+            SpotifyWebApiError:
+                If the Spotify Web API request was for a non-authorization service
+                and the response contains error information.
+            SpotifyApiError:
+                If the method fails for any other reason.
+
+        An incremental refresh retrieves pages (newest first) until an item that is already
+        stored is reached, and adds the new items to the store.  If there are then more stored
+        items than the Spotify Web API `total` value (e.g. items were removed), the stored items
+        are checked newest first with the `contains` endpoint until the removed items are found,
+        and they are deleted from the store.  A full refresh is performed instead if the stored
+        items still do not account for the `total` value, or if finding the removed items would
+        take more than half of the requests of a full refresh.
+        """
+        apiMethodName:str = 'Refresh'
+        apiMethodParms:SIMethodParmListContext = None
+        PAGE_LIMIT:int = 50
+
+        with self._RLock:
+
+            try:
+
+                # trace.
+                apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+                apiMethodParms.AppendKeyValue("libraryType", libraryType)
+                apiMethodParms.AppendKeyValue("fullRefresh", fullRefresh)
+                _logsi.LogMethodParmList(SILevel.Verbose, "Refresh stored library items", apiMethodParms)
+
+                # validations.
+                if libraryType not in SpotifyLibrarySync.LIBRARY_TYPES:
+                    raise SpotifyApiError(SAAppMessages.ARGUMENT_TYPE_ERROR % (apiMethodName, 'libraryType', '|'.join(SpotifyLibrarySync.LIBRARY_TYPES.keys()), libraryType), logsi=_logsi)
+
+                userId:str = self._GetUserId()
+                requestCount:int = 0
+                conn:sqlite3.Connection = self._Connect()
+
+                try:
+
+                    # load the keys of the stored items.
+                    storedKeys:dict = {}
+                    if not fullRefresh:
+                        for itemId, addedAt in conn.execute("SELECT item_id, added_at FROM library_items WHERE user_id=? AND library_type=? ORDER BY position", (userId, libraryType)):
+                            storedKeys[itemId] = addedAt
+
+                    # if nothing is stored, then a full refresh is needed anyway.
+                    if len(storedKeys) == 0:
+                        fullRefresh = True
+
+                    # retrieve pages (newest first) until we reach an item that is already stored.
+                    newItems:list = []
+                    total:int = 0
+                    offset:int = 0
+                    isKnownItemFound:bool = False
+                    while not isKnownItemFound:
+
+                        msg:SpotifyApiMessage = self._GetPageMessage(libraryType, offset, PAGE_LIMIT)
+                        self._Client.MakeRequest('GET', msg)
+                        requestCount += 1
+                        pageData:dict = msg.ResponseData or {}
+                        total = pageData.get('total', None) or 0
+                        items:list = pageData.get('items', None) or []
+
+                        for item in items:
+                            itemKey:tuple = self._GetItemKey(libraryType, item)
+                            if itemKey is None:
+                                continue
+                            if (not fullRefresh) and (storedKeys.get(itemKey[0], -1) == itemKey[1]):
+                                isKnownItemFound = True
+                                break
+                            newItems.append((itemKey, item))
+
+                        # are there more pages?
+                        offset = offset + PAGE_LIMIT
+                        if (pageData.get('next', None) is None) or (len(items) == 0) or (offset >= total):
+                            break
+
+                        # if this is a full refresh, then retrieve the remaining pages concurrently.
+                        if fullRefresh and (self._Client.PagingConcurrency > 1):
+                            executor = self._Client._GetPagingExecutor()
+                            futures:list[Future] = [executor.submit(self._Client._MakeRequestPage, self._GetPageMessage(libraryType, pageOffset, PAGE_LIMIT))
+                                                    for pageOffset in range(offset, total, PAGE_LIMIT)]
+                            try:
+                                for future in futures:
+                                    pageData = future.result() or {}
+                                    requestCount += 1
+                                    for item in (pageData.get('items', None) or []):
+                                        itemKey:tuple = self._GetItemKey(libraryType, item)
+                                        if itemKey is not None:
+                                            newItems.append((itemKey, item))
+                            except Exception:
+                                for future in futures:
+                                    future.cancel()
+                                raise
+                            break
+
+                    # do the stored items (plus the new items) account for the total?
+                    # if there are more, then items were removed from the library; find them with
+                    # `contains` checks (newest first), and only perform a full refresh if they cannot
+                    # be reconciled that way.
+                    removedIds:list[str] = []
+                    if (not fullRefresh):
+                        newKeys:set = set(itemKey[0] for itemKey, _ in newItems)
+                        checkIds:list[str] = [itemId for itemId in storedKeys if itemId not in newKeys]
+                        storedCount:int = len(newKeys) + len(checkIds)
+                        if storedCount > total:
+                            maxRequests:int = max(1, math.ceil(total / PAGE_LIMIT) // 2)
+                            removedIds, checkCount = self._GetRemovedItemIds(libraryType, checkIds, storedCount - total, maxRequests)
+                            requestCount += checkCount
+                            storedCount -= len(removedIds)
+                            _logsi.LogVerbose("SpotifyLibrarySync %s found %d removed items with %d contains requests" % (libraryType, len(removedIds), checkCount))
+                        if storedCount != total:
+                            _logsi.LogVerbose("SpotifyLibrarySync %s stored item count (%d) does not match total (%d); performing full refresh" % (libraryType, storedCount, total))
+                            conn.close()
+                            conn = None
+                            return requestCount + self.Refresh(libraryType, fullRefresh=True)
+
+                    # update the store.
+                    with conn:
+                        if fullRefresh:
+                            conn.execute("DELETE FROM library_items WHERE user_id=? AND library_type=?", (userId, libraryType))
+                            position:int = 0
+                        else:
+                            # removed items are deleted, and new items are placed ahead of the stored items.
+                            conn.executemany("DELETE FROM library_items WHERE user_id=? AND library_type=? AND item_id=?",
+                                             [(userId, libraryType, itemId) for itemId in removedIds])
+                            conn.executemany("DELETE FROM library_items WHERE user_id=? AND library_type=? AND item_id=?",
+                                             [(userId, libraryType, itemKey[0]) for itemKey, _ in newItems])
+                            row = conn.execute("SELECT MIN(position) FROM library_items WHERE user_id=? AND library_type=?", (userId, libraryType)).fetchone()
+                            position:int = (row[0] or 0) - len(newItems)
+                        rows:list = []
+                        seenIds:set = set()
+                        for itemKey, item in newItems:
+                            if itemKey[0] in seenIds:
+                                continue
+                            seenIds.add(itemKey[0])
+                            rows.append((userId, libraryType, itemKey[0], itemKey[1], position, json.dumps(item, separators=(",", ":"))))
+                            position += 1
+                        conn.executemany("INSERT OR REPLACE INTO library_items (user_id, library_type, item_id, added_at, position, data) VALUES (?,?,?,?,?,?)", rows)
+                        conn.execute("INSERT OR REPLACE INTO library_state (user_id, library_type, total, last_refreshed) VALUES (?,?,?,?)",
+                                     (userId, libraryType, total, datetime.utcnow().timestamp()))
+
+                    _logsi.LogVerbose("SpotifyLibrarySync %s refresh complete: %d new items, %d removed items, %d requests (fullRefresh=%s)" % (libraryType, len(newItems), len(removedIds), requestCount, fullRefresh))
+                    return requestCount
+
+                finally:
+                    if conn is not None:
+                        conn.close()
+
+            except SpotifyApiError: raise  # pass handled exceptions on thru
+            except SpotifyWebApiError: raise  # pass handled exceptions on thru
+            except SpotifyWebApiAuthenticationError: raise  # pass handled exceptions on thru
+            except Exception as ex:
+
+                # format unhandled exception.
+                raise SpotifyApiError(SAAppMessages.UNHANDLED_EXCEPTION.format(apiMethodName, str(ex)), ex, logsi=_logsi)
+
+            finally:
+
+                # trace.
+                _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SpotifyLibrarySync:'
+        msg = "%s DatabasePath='%s'" % (msg, self._DatabasePath)
+        return msg
@@ -0,0 +1,66 @@
+# our package imports.
+from .models import PlayerPlayState
+from .sautils import export
+
+
+@export
+class SpotifyPlayerStateEventArgs:
+    """
+    Class used by the `SpotifyPlayerStateWatcher` events to inform interested parties that
+    the player state has changed.
+    """
+    def __init__(
+        self,
+        changes:list[str],
+        oldState:PlayerPlayState,
+        newState:PlayerPlayState,
+        ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            changes (list[str]):
+                List of changes that were detected (e.g. "item", "playing", "device"); see the
+                `SpotifyPlayerStateWatcher.CHANGE_*` constants for possible values.
+            oldState (PlayerPlayState):
+                Player state of the previous poll, or null if this is the first poll.
+            newState (PlayerPlayState):
+                Player state of the current poll.
+        """
+        self._Changes:list[str] = changes
+        self._NewState:PlayerPlayState = newState
+        self._OldState:PlayerPlayState = oldState
+
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the object.
+
+        Returns:
+            A string in the form of "SpotifyPlayerStateEventArgs: {changes}".
+        """
+        return str.format("SpotifyPlayerStateEventArgs: {0}", ','.join(self._Changes))
+
+
+    @property
+    def Changes(self) -> list[str]:
+        """
+        List of changes that were detected (e.g. "item", "playing", "device").
+        """
+        return self._Changes
+
+
+    @property
+    def NewState(self) -> PlayerPlayState:
+        """
+        Player state of the current poll.
+        """
+        return self._NewState
+
+
+    @property
+    def OldState(self) -> PlayerPlayState:
+        """
+        Player state of the previous poll, or null if this is the first poll.
+        """
+        return self._OldState
@@ -0,0 +1,415 @@
+# external package imports.
+import threading
+import time
+
+# our package imports.
+from .models import PlayerPlayState
+from .saappmessages import SAAppMessages
+from .sautils import Event, export
+from .spotifyapierror import SpotifyApiError
+from .spotifymediatypes import SpotifyMediaTypes
+from .spotifyplayerstateeventargs import SpotifyPlayerStateEventArgs
+from .spotifywebapierror import SpotifyWebApiError
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession, SIColors
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+@export
+class SpotifyPlayerStateWatcher(threading.Thread):
+    """
+    Player state watcher thread task.
+
+    This class polls the user's current playback state (via `SpotifyClient.GetPlayerPlaybackState`)
+    on a background (daemon) thread, compares each result with the previous one, and raises events
+    for the changes that were detected.
+
+    The poll interval adapts to the player state:
+    - while playing, the state is polled every `PlayingInterval` seconds, or right after the expected
+      end of the current track / episode (based on its `ProgressMS` and duration) if that is sooner.
+    - while paused, the state is polled every `PausedInterval` seconds.
+    - while idle (no active device or nothing playing), the interval starts at `IdleInterval` seconds
+      and doubles with each idle poll, up to `IdleIntervalMax` seconds.
+    - after a failed poll, the `Retry-After` value (for a `429` status) or the idle interval is used.
+
+    Call the `Refresh` method to poll immediately (e.g. after issuing a player command).
+
+    The first poll raises the `DeviceChanged`, `ItemChanged`, `PlayingChanged` and `StateChanged` events
+    (with a null `OldState`), so that event handlers can initialize from the current state.
+
+    Events are raised on the watcher thread; event handlers should not block for long periods of time.
+    Exceptions raised by event handlers are ignored.
+
+    <details>
+        <summary>View Sample Code</summary>
+    ```python
+    def OnItemChanged(sender, args:SpotifyPlayerStateEventArgs):
+        print("Now playing: %s" % args.NewState.Item.Name)
+
+    watcher = SpotifyPlayerStateWatcher(spotify)
+    watcher.ItemChanged += OnItemChanged
+    watcher.start()
+    ...
+    watcher.Stop()
+    ```
+    </details>
+    """
+
+    CHANGE_CONTEXT:str = 'context'
+    """ Playing context (e.g. album, playlist) changed. """
+
+    CHANGE_DEVICE:str = 'device'
+    """ Active device changed (or playback became active / inactive). """
+
+    CHANGE_ITEM:str = 'item'
+    """ Playing item (track / episode) changed. """
+
+    CHANGE_MODE:str = 'mode'
+    """ Shuffle or repeat mode changed. """
+
+    CHANGE_PLAYING:str = 'playing'
+    """ Playing / paused state changed. """
+
+    CHANGE_POSITION:str = 'position'
+    """ Progress position of the same item changed unexpectedly (e.g. a seek). """
+
+    CHANGE_VOLUME:str = 'volume'
+    """ Device volume changed. """
+
+
+    def __init__(
+        self,
+        spotifyClientInstance, # :SpotifyClient,
+        playingInterval:float=10.0,
+        pausedInterval:float=15.0,
+        idleInterval:float=15.0,
+        idleIntervalMax:float=120.0,
+        ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            spotifyClientInstance (SpotifyClient):
+                SpotifyClient instance used to interface with the Spotify Web API.
+            playingInterval (float):
+                Maximum time (in seconds) between polls while the player is playing.
+                Default is 10.
+            pausedInterval (float):
+                Time (in seconds) between polls while the player is paused.
+                Default is 15.
+            idleInterval (float):
+                Initial time (in seconds) between polls while the player is idle.
+                Default is 15.
+            idleIntervalMax (float):
+                Maximum time (in seconds) between polls while the player is idle.
+                Default is 120.
+        """
+        # invoke base class method.
+        super().__init__()
+
+        # set thread name before we start logging.
+        self.name = "Spotify Player State Watcher"
+        self.daemon = True
+
+        # validations.
+        if (spotifyClientInstance is None):
+            raise SpotifyApiError(SAAppMessages.ARGUMENT_REQUIRED_ERROR % ("__init__", 'spotifyClientInstance'), logsi=_logsi)
+
+        # initialize storage.
+        self._IdleCount:int = 0
+        self._IdleInterval:float = float(idleInterval)
+        self._IdleIntervalMax:float = max(float(idleIntervalMax), float(idleInterval))
+        self._IsStopRequested:bool = False
+        self._LastPollTime:float = None
+        self._LastState:PlayerPlayState = None
+        self._PausedInterval:float = float(pausedInterval)
+        self._PlayingInterval:float = float(playingInterval)
+        self._PollCount:int = 0
+        self._SpotifyClientInstance = spotifyClientInstance
+        self._WakeEvent:threading.Event = threading.Event()
+
+        # define all events raised by this class.
+        self.StateChanged = Event()
+        """
+        Event raised once per poll when any change was detected; the `Changes` argument property
+        contains all detected changes.
+        """
+
+        self.ContextChanged = Event()
+        """
+        Event raised when the playing context (e.g. album, playlist) changed.
+        """
+
+        self.DeviceChanged = Event()
+        """
+        Event raised when the active device changed (or playback became active / inactive).
+        """
+
+        self.ItemChanged = Event()
+        """
+        Event raised when the playing item (track / episode) changed.
+        """
+
+        self.ModeChanged = Event()
+        """
+        Event raised when the shuffle or repeat mode changed.
+        """
+
+        self.PlayingChanged = Event()
+        """
+        Event raised when the playing / paused state changed.
+        """
+
+        self.PositionChanged = Event()
+        """
+        Event raised when the progress position of the same item changed unexpectedly (e.g. a seek).
+        """
+
+        self.VolumeChanged = Event()
+        """
+        Event raised when the device volume changed.
+        """
+
+
+    @property
+    def IsStopRequested(self) -> bool:
+        """
+        Indicator used to denote the task has been asked to stop by the main thread.
+        """
+        return self._IsStopRequested
+
+
+    @property
+    def LastState(self) -> PlayerPlayState:
+        """
+        Player state of the most recent successful poll, or null if no poll has completed.
+        """
+        return self._LastState
+
+
+    @property
+    def PollCount(self) -> int:
+        """
+        Number of playback state polls that have been issued.
+        """
+        return self._PollCount
+
+
+    @staticmethod
+    def _GetDeviceKey(state:PlayerPlayState) -> tuple:
+        """
+        Returns the (id, name) values of the active device of a player state.
+        """
+        if (state is None) or (state.IsEmpty) or (state.Device is None):
+            return (None, None)
+        return (state.Device.Id, state.Device.Name)
+
+
+    def _GetChanges(
+        self,
+        oldState:PlayerPlayState,
+        newState:PlayerPlayState,
+        elapsed:float,
+        ) -> list[str]:
+        """
+        Returns the list of changes between two successive player states.
+
+        Args:
+            oldState (PlayerPlayState):
+                Player state of the previous poll, or null if this is the first poll.
+            newState (PlayerPlayState):
+                Player state of the current poll.
+            elapsed (float):
+                Time (in seconds) between the previous poll and the current poll.
+        """
+        if oldState is None:
+            return [SpotifyPlayerStateWatcher.CHANGE_DEVICE, SpotifyPlayerStateWatcher.CHANGE_ITEM, SpotifyPlayerStateWatcher.CHANGE_PLAYING]
+
+        changes:list[str] = []
+        oldItemUri:str = oldState.Item.Uri if (oldState.Item is not None) else None
+        newItemUri:str = newState.Item.Uri if (newState.Item is not None) else None
+        oldContextUri:str = oldState.Context.Uri if (oldState.Context is not None) else None
+        newContextUri:str = newState.Context.Uri if (newState.Context is not None) else None
+
+        isDeviceChanged:bool = SpotifyPlayerStateWatcher._GetDeviceKey(oldState) != SpotifyPlayerStateWatcher._GetDeviceKey(newState)
+        if isDeviceChanged:
+            changes.append(SpotifyPlayerStateWatcher.CHANGE_DEVICE)
+        if oldItemUri != newItemUri:
+            changes.append(SpotifyPlayerStateWatcher.CHANGE_ITEM)
+        if bool(oldState.IsPlaying) != bool(newState.IsPlaying):
+            changes.append(SpotifyPlayerStateWatcher.CHANGE_PLAYING)
+        if oldContextUri != newContextUri:
+            changes.append(SpotifyPlayerStateWatcher.CHANGE_CONTEXT)
+
+        # mode and volume changes are only reported for the same device.
+        if (not isDeviceChanged) and (not newState.IsEmpty):
+            if (oldState.IsShuffleEnabled != newState.IsShuffleEnabled) or (oldState.RepeatState != newState.RepeatState):
+                changes.append(SpotifyPlayerStateWatcher.CHANGE_MODE)
+            oldVolume:int = oldState.Device.VolumePercent if (oldState.Device is not None) else None
+            newVolume:int = newState.Device.VolumePercent if (newState.Device is not None) else None
+            if oldVolume != newVolume:
+                changes.append(SpotifyPlayerStateWatcher.CHANGE_VOLUME)
+
+        # did the position of the same item differ from where it should be? (e.g. a seek).
+        if (oldItemUri is not None) and (oldItemUri == newItemUri) and (oldState.ProgressMS is not None) and (newState.ProgressMS is not None):
+            expectedMS:float = oldState.ProgressMS + ((elapsed * 1000) if (oldState.IsPlaying) else 0)
+            if abs(newState.ProgressMS - expectedMS) > 3000:
+                changes.append(SpotifyPlayerStateWatcher.CHANGE_POSITION)
+
+        return changes
+
+
+    def _GetPollInterval(
+        self,
+        state:PlayerPlayState,
+        ) -> float:
+        """
+        Returns the time (in seconds) to wait before the next poll, based on the player state.
+        """
+        # is the player idle? if so, then back off.
+        if (state is None) or (state.IsEmpty) or (state.Device is None) or (state.Item is None):
+            self._IdleCount += 1
+            return min(self._IdleInterval * (2 ** min(self._IdleCount - 1, 8)), self._IdleIntervalMax)
+        self._IdleCount = 0
+
+        # is the player paused?
+        if (not state.IsPlaying):
+            return self._PausedInterval
+
+        # poll right after the expected end of the current item, if that is sooner than the playing interval.
+        interval:float = self._PlayingInterval
+        durationMS:int = getattr(state.Item, 'DurationMS', None)
+        if (durationMS is not None) and (state.ProgressMS is not None):
+            remaining:float = ((durationMS - state.ProgressMS) / 1000) + 0.5
+            interval = min(interval, max(remaining, 0.25))
+        return interval
+
+
+    def _RaiseEvents(
+        self,
+        changes:list[str],
+        oldState:PlayerPlayState,
+        newState:PlayerPlayState,
+        ) -> None:
+        """
+        Raises the events for the detected changes.
+        """
+        args:SpotifyPlayerStateEventArgs = SpotifyPlayerStateEventArgs(changes, oldState, newState)
+        _logsi.LogVerbose("%s - player state changes detected: %s" % (self.name, ','.join(changes)))
+
+        eventsByChange:dict = \
+        {
+            SpotifyPlayerStateWatcher.CHANGE_CONTEXT: self.ContextChanged,
+            SpotifyPlayerStateWatcher.CHANGE_DEVICE: self.DeviceChanged,
+            SpotifyPlayerStateWatcher.CHANGE_ITEM: self.ItemChanged,
+            SpotifyPlayerStateWatcher.CHANGE_MODE: self.ModeChanged,
+            SpotifyPlayerStateWatcher.CHANGE_PLAYING: self.PlayingChanged,
+            SpotifyPlayerStateWatcher.CHANGE_POSITION: self.PositionChanged,
+            SpotifyPlayerStateWatcher.CHANGE_VOLUME: self.VolumeChanged,
+        }
+        for change in changes:
+            eventsByChange[change](self, args)
+        self.StateChanged(self, args)
+
+
+    def Poll(self) -> list[str]:
+        """
+        Polls the player state once, and raises events for any changes that were detected.
+
+        Returns:
+            The list of changes that were detected.
+
+        This method is called by the watcher thread; it can also be called directly if the
+        thread is not started (e.g. to drive the watcher from an existing timer).
+        """
+        self._PollCount += 1
+        state:PlayerPlayState = self._SpotifyClientInstance.GetPlayerPlaybackState(additionalTypes=SpotifyMediaTypes.EPISODE.value)
+        now:float = time.monotonic()
+        elapsed:float = (now - self._LastPollTime) if (self._LastPollTime is not None) else 0
+        oldState:PlayerPlayState = self._LastState
+        self._LastPollTime = now
+        self._LastState = state
+
+        changes:list[str] = self._GetChanges(oldState, state, elapsed)
+        if len(changes) > 0:
+            self._RaiseEvents(changes, oldState, state)
+        return changes
+
+
+    def Refresh(self) -> None:
+        """
+        Wakes up the watcher thread to poll the player state immediately.
+        """
+        self._WakeEvent.set()
+
+
+    def Stop(
+        self,
+        timeout:float=5.0,
+        ) -> None:
+        """
+        Stops the watcher thread, and waits for it to finish.
+
+        Args:
+            timeout (float):
+                Maximum time (in seconds) to wait for the thread to finish.
+                Default is 5.
+        """
+        self._IsStopRequested = True
+        self._WakeEvent.set()
+        if self.is_alive() and (threading.current_thread() is not self):
+            self.join(timeout)
+
+
+    def run(self):
+        """
+        The task to perform on a seperate thread.
+        """
+        _logsi.LogVerbose("%s - Starting thread RUN / TASK method" % (self.name))
+
+        while not self._IsStopRequested:
+
+            # clear any pending wake request BEFORE polling, so that a refresh request that arrives
+            # while the poll is in progress is not lost (the next wait returns immediately).
+            self._WakeEvent.clear()
+            if self._IsStopRequested:
+                break
+
+            try:
+
+                self.Poll()
+                interval:float = self._GetPollInterval(self._LastState)
+
+            except SpotifyWebApiError as ex:
+
+                # if rate limited, then wait for the retry-after period; otherwise, back off as if idle.
+                interval:float = ex.RetryAfter if (ex.Status == 429) and ((ex.RetryAfter or 0) > 0) else self._GetPollInterval(None)
+                _logsi.LogVerbose("%s - player state poll failed (%s); next poll in %s seconds" % (self.name, ex.Message, interval), colorValue=SIColors.Red)
+
+            except Exception as ex:
+
+                interval:float = self._GetPollInterval(None)
+                _logsi.LogVerbose("%s - player state poll failed (%s); next poll in %s seconds" % (self.name, str(ex), interval), colorValue=SIColors.Red)
+
+            # wait for the next poll (or a refresh / stop request).
+            _logsi.LogVerbose("%s - next player state poll in %.2f seconds" % (self.name, interval))
+            self._WakeEvent.wait(interval)
+
+        _logsi.LogVerbose("%s - Thread RUN / TASK method has ended" % (self.name))
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SpotifyPlayerStateWatcher:'
+        msg = '%s PollCount=%d' % (msg, self._PollCount)
+        msg = '%s PlayingInterval=%s' % (msg, self._PlayingInterval)
+        msg = '%s PausedInterval=%s' % (msg, self._PausedInterval)
+        msg = '%s IdleInterval=%s-%s' % (msg, self._IdleInterval, self._IdleIntervalMax)
+        return msg
@@ -0,0 +1,502 @@
+# external package imports.
+from concurrent.futures import Future
+from datetime import datetime
+import json
+import os
+import sqlite3
+import threading
+
+# our package imports.
+from .models import *
+from .saappmessages import SAAppMessages
+from .sautils import export
+from .spotifyapierror import SpotifyApiError
+from .spotifyapimessage import SpotifyApiMessage
+from .spotifywebapiauthenticationerror import SpotifyWebApiAuthenticationError
+from .spotifywebapierror import SpotifyWebApiError
+from .const import (
+    SPOTIFYWEBAPIPYTHON_PLAYLIST_CACHE_FILE,
+    TRACE_METHOD_RESULT_TYPE,
+)
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession, SIMethodParmListContext
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+@export
+class SpotifyPlaylistCache:
+    """
+    Keeps a persistent local copy of playlists (including all of their items) in a SQLite
+    database, keyed by playlist id, and only retrieves a playlist again when its snapshot id
+    has changed.
+
+    Every playlist carries a `snapshot_id` value that changes whenever the playlist (or any of
+    its items) is modified.  A refresh first requests only the snapshot id of the playlist
+    (`fields=snapshot_id`); if it matches the stored snapshot id, then the stored playlist is used.
+    Otherwise, the playlist and all of its items are retrieved and stored.
+
+    For a playlist that has not changed, a refresh requires a single (small) request, regardless
+    of the number of items in the playlist.  The database is persisted, so the cache is still warm
+    after an application restart.
+
+    The raw playlist dictionaries are stored, so that the same model objects that are returned by
+    the `SpotifyClient.GetPlaylist` and `SpotifyClient.GetPlaylistItems` methods can be created from them.
+    """
+
+    PAGE_LIMIT:int = 50
+    """
+    Maximum number of items to retrieve per request when a playlist is retrieved.
+    """
+
+
+    def __init__(
+        self,
+        client,
+        databasePath:str=None,
+        ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            client (SpotifyClient):
+                A `SpotifyClient` instance that contains the authorization access token used to
+                retrieve playlists.
+            databasePath (str):
+                Path and filename of the SQLite database that stores the playlists.
+                Default is null, which stores the database in the `SpotifyClient` token storage
+                directory (e.g. `SpotifyWebApiPython_playlists.db`).
+        """
+        # get default database path if one was not specified.
+        if databasePath is None:
+            databasePath = os.path.join(os.path.dirname(client._ConfigurationDataPath), SPOTIFYWEBAPIPYTHON_PLAYLIST_CACHE_FILE)
+
+        # initialize storage.
+        self._Client = client
+        self._DatabasePath:str = databasePath
+        self._IsInitialized:bool = False
+        self._RLock:threading.RLock = threading.RLock()
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def DatabasePath(self) -> str:
+        """
+        Path and filename of the SQLite database that stores the playlists.
+        """
+        return self._DatabasePath
+
+
+    def _Connect(self) -> sqlite3.Connection:
+        """
+        Opens a connection to the playlist database, creating the database tables if needed.
+        """
+        conn:sqlite3.Connection = sqlite3.connect(self._DatabasePath, timeout=30)
+        if not self._IsInitialized:
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS playlists ("
+                             "playlist_id TEXT NOT NULL, snapshot_id TEXT NOT NULL, market TEXT, "
+                             "last_refreshed REAL NOT NULL, data TEXT NOT NULL, "
+                             "PRIMARY KEY (playlist_id))")
+            self._IsInitialized = True
+        return conn
+
+
+    @staticmethod
+    def _GetItemsPageKey(playlistData:dict) -> str:
+        """
+        Returns the playlist dictionary key that contains the items page object (e.g. "items"
+        or "tracks"), or null if the playlist does not contain an items page object.
+        """
+        for key in ('items', 'tracks'):
+            if isinstance(playlistData.get(key, None), dict):
+                return key
+        return None
+
+
+    def _GetMessage(self, uri:str, urlParms:dict, accessTokenHeaderValue:str) -> SpotifyApiMessage:
+        """
+        Returns an api message for a playlist request.
+        """
+        msg:SpotifyApiMessage = SpotifyApiMessage('SpotifyPlaylistCache', uri)
+        msg.RequestHeaders[self._Client.AuthToken.HeaderKey] = accessTokenHeaderValue or self._Client.AuthToken.HeaderValue
+        msg.UrlParameters = urlParms
+        return msg
+
+
+    def _GetStored(self, playlistId:str) -> tuple:
+        """
+        Returns the stored (snapshot_id, market, data) values of a playlist, or null if the
+        playlist is not stored.
+        """
+        with self._RLock:
+            conn:sqlite3.Connection = self._Connect()
+            try:
+                return conn.execute("SELECT snapshot_id, market, data FROM playlists WHERE playlist_id=?", (playlistId,)).fetchone()
+            finally:
+                conn.close()
+
+
+    def _ValidatePlaylistId(self, apiMethodName:str, playlistId:str) -> str:
+        """
+        Returns the playlist id to use, which is the currently playing playlist id value if
+        the playlist id was not specified.
+        """
+        if (playlistId is None) or (len(playlistId.strip()) == 0):
+            uri:str = self._Client.GetPlayerNowPlayingPlaylistUri()
+            if uri is None:
+                raise SpotifyApiError(SAAppMessages.ARGUMENT_REQUIRED_ERROR % (apiMethodName, 'playlistId'), logsi=_logsi)
+            playlistId = self._Client.GetIdFromUri(uri)
+        return playlistId
+
+
+    def Clear(
+        self,
+        playlistId:str=None,
+        ) -> None:
+        """
+        Removes stored playlists from the playlist database.
+
+        Args:
+            playlistId (str):
+                The Spotify ID of the playlist to remove, or null to remove all playlists.
+        """
+        with self._RLock:
+            conn:sqlite3.Connection = self._Connect()
+            try:
+                with conn:
+                    if playlistId is None:
+                        conn.execute("DELETE FROM playlists")
+                    else:
+                        conn.execute("DELETE FROM playlists WHERE playlist_id=?", (playlistId,))
+            finally:
+                conn.close()
+
+
+    def GetPlaylist(
+        self,
+        playlistId:str=None,
+        market:str=None,
+        refresh:bool=True,
+        ) -> Playlist:
+        """
+        Returns a playlist (including all of its items) from the cache.
+
+        Args:
+            playlistId (str):
+                The Spotify ID of the playlist.
+                Example: `5v5ETK9WFXAnGQ3MRubKuE`
+                If null, the currently playing playlist uri id value is used.
+            market (str):
+                An ISO 3166-1 alpha-2 country code. If a country code is specified, only content that
+                is available in that market will be returned.
+                Example: `ES`
+            refresh (bool):
+                True to refresh the stored playlist (if its snapshot id changed) before it is returned;
+                otherwise, False to return the stored playlist as-is (it is still retrieved if it is
+                not stored).
+                Default is True.
+
+        Returns:
+            A `Playlist` object that contains the playlist details; its `Tracks` property contains
+            all items of the playlist.
+
+        Raises:
+            SpotifyWebApiError:
+                If the Spotify Web API request was for a non-authorization service
+                and the response contains error information.
+            SpotifyApiError:
+                If the method fails for any other reason.
+        """
+        apiMethodName:str = 'GetPlaylist'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("playlistId", playlistId)
+            apiMethodParms.AppendKeyValue("market", market)
+            apiMethodParms.AppendKeyValue("refresh", refresh)
+            _logsi.LogMethodParmList(SILevel.Verbose, "Get cached playlist", apiMethodParms)
+
+            # refresh the store (if requested, or if not stored).
+            playlistId = self._ValidatePlaylistId(apiMethodName, playlistId)
+            stored:tuple = self._GetStored(playlistId)
+            if refresh or (stored is None):
+                self.Refresh(playlistId, market)
+                stored = self._GetStored(playlistId)
+
+            # process results.
+            result:Playlist = Playlist(root=json.loads(stored[2]))
+
+            # trace.
+            _logsi.LogVerbose(TRACE_METHOD_RESULT_TYPE % (apiMethodName, type(result).__name__) + " (snapshot_id=%s)" % result.SnapshotId)
+            return result
+
+        except SpotifyApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiAuthenticationError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+
+            # format unhandled exception.
+            raise SpotifyApiError(SAAppMessages.UNHANDLED_EXCEPTION.format(apiMethodName, str(ex)), ex, logsi=_logsi)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    def GetPlaylistItems(
+        self,
+        playlistId:str=None,
+        market:str=None,
+        refresh:bool=True,
+        ) -> PlaylistPage:
+        """
+        Returns all items of a playlist from the cache.
+
+        Args:
+            playlistId (str):
+                The Spotify ID of the playlist.
+                Example: `5v5ETK9WFXAnGQ3MRubKuE`
+                If null, the currently playing playlist uri id value is used.
+            market (str):
+                An ISO 3166-1 alpha-2 country code. If a country code is specified, only content that
+                is available in that market will be returned.
+                Example: `ES`
+            refresh (bool):
+                True to refresh the stored playlist (if its snapshot id changed) before its items are
+                returned; otherwise, False to return the stored items as-is (the playlist is still
+                retrieved if it is not stored).
+                Default is True.
+
+        Returns:
+            A `PlaylistPage` object that contains all items of the playlist, in play order.
+
+        Raises:
+            SpotifyWebApiError:
+                If the Spotify Web API request was for a non-authorization service
+                and the response contains error information.
+            SpotifyApiError:
+                If the method fails for any other reason.
+        """
+        apiMethodName:str = 'GetPlaylistItems'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("playlistId", playlistId)
+            apiMethodParms.AppendKeyValue("market", market)
+            apiMethodParms.AppendKeyValue("refresh", refresh)
+            _logsi.LogMethodParmList(SILevel.Verbose, "Get cached playlist items", apiMethodParms)
+
+            # refresh the store (if requested, or if not stored).
+            playlistId = self._ValidatePlaylistId(apiMethodName, playlistId)
+            stored:tuple = self._GetStored(playlistId)
+            if refresh or (stored is None):
+                self.Refresh(playlistId, market)
+                stored = self._GetStored(playlistId)
+
+            # process results.
+            playlistData:dict = json.loads(stored[2])
+            pageKey:str = SpotifyPlaylistCache._GetItemsPageKey(playlistData)
+            result:PlaylistPage = PlaylistPage(root=playlistData[pageKey] if pageKey is not None else None)
+            result.DateLastRefreshed = datetime.utcnow().timestamp()
+
+            # trace.
+            _logsi.LogVerbose(TRACE_METHOD_RESULT_TYPE % (apiMethodName, type(result).__name__) + "(%d items)" % result.ItemsCount)
+            return result
+
+        except SpotifyApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiAuthenticationError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+
+            # format unhandled exception.
+            raise SpotifyApiError(SAAppMessages.UNHANDLED_EXCEPTION.format(apiMethodName, str(ex)), ex, logsi=_logsi)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    def GetSnapshotId(
+        self,
+        playlistId:str,
+        ) -> str:
+        """
+        Returns the stored snapshot id of a playlist, or null if the playlist is not stored.
+
+        Args:
+            playlistId (str):
+                The Spotify ID of the playlist.
+
+        The store is not refreshed by this method; call the `Refresh` method for that.
+        """
+        stored:tuple = self._GetStored(playlistId)
+        return stored[0] if stored is not None else None
+
+
+    def Refresh(
+        self,
+        playlistId:str,
+        market:str=None,
+        forceRefresh:bool=False,
+        ) -> int:
+        """
+        Refreshes a stored playlist from the Spotify Web API if its snapshot id has changed.
+
+        Args:
+            playlistId (str):
+                The Spotify ID of the playlist.
+                Example: `5v5ETK9WFXAnGQ3MRubKuE`
+            market (str):
+                An ISO 3166-1 alpha-2 country code. If a country code is specified, only content that
+                is available in that market will be returned.
+                Example: `ES`
+            forceRefresh (bool):
+                True to retrieve the playlist and all of its items without checking the snapshot id;
+                otherwise, False.
+                Default is False.
+
+        Returns:
+            The number of Spotify Web API requests that were made; this is 1 if the playlist
+            snapshot id has not changed.
+
+        Raises:
+            SpotifyWebApiError:
+                If the Spotify Web API request was for a non-authorization service
+                and the response contains error information.
+            SpotifyApiError:
+                If the method fails for any other reason.
+
+        The stored playlist is also retrieved again if it was stored for a different market.
+
+        The playlist items are retrieved in pages; if the playlist is modified while its pages are
+        being retrieved, then the stored snapshot id (from the first page) will not match on the next
+        refresh, and the playlist is retrieved again at that time.
+        """
+        apiMethodName:str = 'Refresh'
+        apiMethodParms:SIMethodParmListContext = None
+
+        try:
+
+            # trace.
+            apiMethodParms = _logsi.EnterMethodParmList(SILevel.Debug, apiMethodName)
+            apiMethodParms.AppendKeyValue("playlistId", playlistId)
+            apiMethodParms.AppendKeyValue("market", market)
+            apiMethodParms.AppendKeyValue("forceRefresh", forceRefresh)
+            _logsi.LogMethodParmList(SILevel.Verbose, "Refresh cached playlist", apiMethodParms)
+
+            # validations.
+            if (playlistId is None) or (len(playlistId.strip()) == 0):
+                raise SpotifyApiError(SAAppMessages.ARGUMENT_REQUIRED_ERROR % (apiMethodName, 'playlistId'), logsi=_logsi)
+
+            # are spotify web player credentials configured? if so, then we will use them to create
+            # an elevated authorization access token for the Spotify Web API endpoint call.
+            accessTokenHeaderValue:str = self._Client._GetSpotifyWebPlayerTokenHeaderValue()
+
+            # ensure we have a market value, in order to return track relinking (e.g. `linked_from`) data.
+            market = self._Client._ValidateMarket(market, forceReturnValue=True)
+            requestCount:int = 0
+
+            # compare the current snapshot id of the playlist with the stored snapshot id.
+            stored:tuple = self._GetStored(playlistId)
+            if (not forceRefresh) and (stored is not None) and (stored[1] == market):
+                msg:SpotifyApiMessage = self._GetMessage('/playlists/{id}'.format(id=playlistId), {'fields': 'snapshot_id'}, accessTokenHeaderValue)
+                self._Client.MakeRequest('GET', msg)
+                requestCount += 1
+                snapshotId:str = (msg.ResponseData or {}).get('snapshot_id', None)
+                if (snapshotId is not None) and (snapshotId == stored[0]):
+                    _logsi.LogVerbose("SpotifyPlaylistCache playlist %s is unchanged (snapshot_id=%s)" % (playlistId, snapshotId))
+                    return requestCount
+
+            # retrieve the playlist, which includes the first page of items.
+            urlParms:dict = {'market': market, 'additional_types': 'track,episode'}
+            msg:SpotifyApiMessage = self._GetMessage('/playlists/{id}'.format(id=playlistId), urlParms, accessTokenHeaderValue)
+            self._Client.MakeRequest('GET', msg)
+            requestCount += 1
+            playlistData:dict = msg.ResponseData or {}
+
+            # retrieve the remaining pages of items (concurrently if enabled).
+            pageKey:str = SpotifyPlaylistCache._GetItemsPageKey(playlistData)
+            if pageKey is not None:
+                pageData:dict = playlistData[pageKey]
+                items:list = pageData.get('items', None) or []
+                total:int = pageData.get('total', None) or 0
+                uri:str = '/playlists/{id}/items'.format(id=playlistId)
+                messages:list[SpotifyApiMessage] = [self._GetMessage(uri, dict(urlParms, limit=SpotifyPlaylistCache.PAGE_LIMIT, offset=pageOffset), accessTokenHeaderValue)
+                                                    for pageOffset in range(len(items), total, SpotifyPlaylistCache.PAGE_LIMIT)]
+                if (len(messages) > 1) and (self._Client.PagingConcurrency > 1):
+                    executor = self._Client._GetPagingExecutor()
+                    futures:list[Future] = [executor.submit(self._Client._MakeRequestPage, pageMsg) for pageMsg in messages]
+                    try:
+                        for future in futures:
+                            items.extend((future.result() or {}).get('items', None) or [])
+                            requestCount += 1
+                    except Exception:
+                        for future in futures:
+                            future.cancel()
+                        raise
+                else:
+                    for pageMsg in messages:
+                        items.extend(self._Client._MakeRequestPage(pageMsg).get('items', None) or [])
+                        requestCount += 1
+
+                # store all items in the playlist items page object.
+                pageData['items'] = items
+                pageData['limit'] = len(items)
+                pageData['offset'] = 0
+                pageData['next'] = None
+                pageData['previous'] = None
+
+            # update the store.
+            with self._RLock:
+                conn:sqlite3.Connection = self._Connect()
+                try:
+                    with conn:
+                        conn.execute("INSERT OR REPLACE INTO playlists (playlist_id, snapshot_id, market, last_refreshed, data) VALUES (?,?,?,?,?)",
+                                     (playlistId, playlistData.get('snapshot_id', None) or '', market, datetime.utcnow().timestamp(), json.dumps(playlistData, separators=(",", ":"))))
+                finally:
+                    conn.close()
+
+            _logsi.LogVerbose("SpotifyPlaylistCache playlist %s refresh complete: %d requests (snapshot_id=%s)" % (playlistId, requestCount, playlistData.get('snapshot_id', None)))
+            return requestCount
+
+        except SpotifyApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiError: raise  # pass handled exceptions on thru
+        except SpotifyWebApiAuthenticationError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+
+            # format unhandled exception.
+            raise SpotifyApiError(SAAppMessages.UNHANDLED_EXCEPTION.format(apiMethodName, str(ex)), ex, logsi=_logsi)
+
+        finally:
+
+            # trace.
+            _logsi.LeaveMethod(SILevel.Debug, apiMethodName)
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SpotifyPlaylistCache:'
+        msg = "%s DatabasePath='%s'" % (msg, self._DatabasePath)
+        return msg
@@ -0,0 +1,337 @@
+# external package imports.
+import heapq
+import itertools
+import threading
+import time
+
+# our package imports.
+from .sautils import export
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession, SIColors
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+@export
+class SpotifyRateLimiter:
+    """
+    A thread-safe token bucket rate limiter that shares a Spotify Web API request budget
+    across all threads that use a `SpotifyClient` instance.
+
+    Each request consumes one token from the bucket; tokens are replenished at a constant
+    rate (`RequestsPerSecond`) up to the bucket capacity (`Burst`).  When the Spotify Web API
+    returns a `429 Too Many Requests` status, the `Pause` method is called with the `Retry-After`
+    value, and all outgoing requests are held until the pause period expires.
+
+    Requests that are waiting for a token are granted in priority order (lowest value first),
+    and in arrival order within the same priority; player commands use `PRIORITY_PLAYER` so
+    that they are sent before queued catalog reads.
+
+    A request will never wait longer than `MaxWait` seconds for a token.  If the wait would
+    exceed that value (e.g. a `Retry-After` of 40 seconds), the request is rejected immediately
+    so that calling threads are not blocked (see the 1.0.288 change log notes regarding Home
+    Assistant worker thread hangs).
+    """
+
+    PRIORITY_PLAYER:int = 0
+    """ Priority of player command requests (e.g. pause, play, volume, etc). """
+
+    PRIORITY_NORMAL:int = 1
+    """ Priority of all other requests (e.g. catalog, library, playlist, etc). """
+
+
+    def __init__(
+        self,
+        requestsPerSecond:float=10.0,
+        burst:int=30,
+        maxWait:float=5.0,
+        ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            requestsPerSecond (float):
+                Number of request tokens that are added to the bucket each second.
+                Default is 10.0.
+            burst (int):
+                Maximum number of tokens the bucket can hold (e.g. the number of requests that can
+                be sent back-to-back after an idle period).
+                Default is 30.
+            maxWait (float):
+                Maximum number of seconds a request will wait for a token before it is rejected.
+                Default is 5.0.
+        """
+        # validations.
+        if (not isinstance(requestsPerSecond, (int, float))) or (requestsPerSecond <= 0):
+            requestsPerSecond = 10.0
+        if (not isinstance(burst, int)) or (burst < 1):
+            burst = 30
+        if (not isinstance(maxWait, (int, float))) or (maxWait < 0):
+            maxWait = 5.0
+
+        # initialize storage.
+        self._Burst:int = burst
+        self._Condition:threading.Condition = threading.Condition(threading.Lock())
+        self._LastRefill:float = time.monotonic()
+        self._MaxWait:float = float(maxWait)
+        self._PausedUntil:float = 0
+        self._PauseCount:int = 0
+        self._RejectedCount:int = 0
+        self._RequestsPerSecond:float = float(requestsPerSecond)
+        self._Sequence = itertools.count()
+        self._Tokens:float = float(burst)
+        self._Waiters:list = []
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def Burst(self) -> int:
+        """
+        Maximum number of tokens the bucket can hold.
+        """
+        return self._Burst
+
+
+    @property
+    def IsPaused(self) -> bool:
+        """
+        True if outgoing requests are currently paused due to a `429 Too Many Requests`
+        response; otherwise, False.
+        """
+        return (self._PausedUntil > time.monotonic())
+
+
+    @property
+    def MaxWait(self) -> float:
+        """
+        Maximum number of seconds a request will wait for a token before it is rejected.
+        """
+        return self._MaxWait
+
+    @MaxWait.setter
+    def MaxWait(self, value:float):
+        """
+        Sets the MaxWait property value.
+        """
+        if isinstance(value, (int, float)) and (value >= 0):
+            self._MaxWait = float(value)
+
+
+    @property
+    def PausedRemaining(self) -> float:
+        """
+        Number of seconds remaining in the current pause period, or zero if requests are
+        not paused.
+        """
+        return max(0.0, self._PausedUntil - time.monotonic())
+
+
+    @property
+    def PauseCount(self) -> int:
+        """
+        Number of times requests were paused due to a `429 Too Many Requests` response.
+        """
+        return self._PauseCount
+
+
+    @property
+    def RejectedCount(self) -> int:
+        """
+        Number of requests that were rejected because the wait for a token would have
+        exceeded the `MaxWait` value.
+        """
+        return self._RejectedCount
+
+
+    @property
+    def RequestsPerSecond(self) -> float:
+        """
+        Number of request tokens that are added to the bucket each second.
+        """
+        return self._RequestsPerSecond
+
+
+    def _GetWaitTime(self, now:float) -> float:
+        """
+        Refills the bucket and returns the number of seconds until a token is available.
+
+        The condition lock must be held by the caller.
+        """
+        elapsed:float = now - self._LastRefill
+        if elapsed > 0:
+            self._Tokens = min(float(self._Burst), self._Tokens + (elapsed * self._RequestsPerSecond))
+            self._LastRefill = now
+
+        wait:float = 0
+        if self._PausedUntil > now:
+            wait = self._PausedUntil - now
+        if self._Tokens < 1:
+            wait = max(wait, (1 - self._Tokens) / self._RequestsPerSecond)
+        return wait
+
+
+    def Acquire(
+        self,
+        priority:int=PRIORITY_NORMAL,
+        ) -> float:
+        """
+        Waits for a request token to become available, and consumes it.
+
+        Args:
+            priority (int):
+                Priority of the request; lower values are granted first.
+                Default is `PRIORITY_NORMAL`.
+
+        Returns:
+            Zero if a token was acquired; otherwise, the number of seconds the caller would
+            have had to wait (e.g. the request was rejected because the wait would have exceeded
+            the `MaxWait` value) - the request should not be sent in this case.
+        """
+        with self._Condition:
+
+            # add the request to the wait queue.
+            waiter:tuple = (priority, next(self._Sequence))
+            heapq.heappush(self._Waiters, waiter)
+            deadline:float = time.monotonic() + self._MaxWait
+
+            try:
+
+                while True:
+
+                    now:float = time.monotonic()
+                    wait:float = self._GetWaitTime(now)
+
+                    # is it our turn, and is a token available?  if so, then consume it.
+                    if (self._Waiters[0] is waiter) and (wait <= 0):
+                        self._Tokens -= 1
+                        return 0
+
+                    # would we wait longer than allowed?  if so, then reject the request.
+                    if (now + wait) > deadline:
+                        self._RejectedCount += 1
+                        _logsi.LogVerbose("SpotifyRateLimiter request rejected; wait time of %.3f seconds exceeds the maximum wait time of %.3f seconds" % (wait, self._MaxWait), colorValue=SIColors.Red)
+                        return max(wait, 0.001)
+
+                    # wait for a token (or for a higher priority request to go first).
+                    self._Condition.wait(max(wait, 0.001) if (self._Waiters[0] is waiter) else (deadline - now))
+
+            finally:
+
+                # remove the request from the wait queue, and let the next waiter check.
+                self._Waiters.remove(waiter)
+                heapq.heapify(self._Waiters)
+                self._Condition.notify_all()
+
+
+    def Pause(
+        self,
+        seconds:float,
+        ) -> None:
+        """
+        Pauses all outgoing requests for the specified number of seconds.
+
+        Args:
+            seconds (float):
+                Number of seconds to pause requests for (e.g. the `Retry-After` response header value
+                of a `429 Too Many Requests` response).
+
+        If requests are already paused, the pause period is extended only if the new period ends
+        later than the current one.  The bucket is also emptied, so that requests resume gradually
+        instead of in a burst once the pause period expires.
+        """
+        if (seconds is None) or (seconds <= 0):
+            seconds = 1
+
+        with self._Condition:
+            pausedUntil:float = time.monotonic() + seconds
+            if pausedUntil > self._PausedUntil:
+                self._PausedUntil = pausedUntil
+                self._Tokens = 0
+                self._LastRefill = pausedUntil
+                self._PauseCount += 1
+                _logsi.LogVerbose("SpotifyRateLimiter pausing all requests for %s seconds (Retry-After)" % (seconds), colorValue=SIColors.Red)
+            self._Condition.notify_all()
+
+
+    def Reset(self) -> None:
+        """
+        Cancels any pause period, refills the bucket, and resets statistics.
+        """
+        with self._Condition:
+            self._LastRefill = time.monotonic()
+            self._PausedUntil = 0
+            self._PauseCount = 0
+            self._RejectedCount = 0
+            self._Tokens = float(self._Burst)
+            self._Condition.notify_all()
+
+
+    def TryAcquire(
+        self,
+        priority:int=PRIORITY_NORMAL,
+        ) -> float:
+        """
+        Consumes a request token if one is available, without waiting.
+
+        Args:
+            priority (int):
+                Priority of the request; a token is not granted if a request with a
+                higher priority (lower value) is waiting.
+                Default is `PRIORITY_NORMAL`.
+
+        Returns:
+            Zero if a token was acquired; otherwise, the number of seconds until a token is
+            expected to be available.
+
+        This method is intended for asyncio callers, which should not block the event loop
+        while waiting for a token.
+        """
+        with self._Condition:
+            wait:float = self._GetWaitTime(time.monotonic())
+            if (wait <= 0) and (len(self._Waiters) > 0) and (self._Waiters[0][0] <= priority):
+                wait = 1 / self._RequestsPerSecond
+            if wait > 0:
+                return wait
+            self._Tokens -= 1
+            return 0
+
+
+    def ToDictionary(self) -> dict:
+        """
+        Returns a dictionary representation of the class.
+        """
+        result:dict = \
+        {
+            'burst': self._Burst,
+            'max_wait': self._MaxWait,
+            'pause_count': self._PauseCount,
+            'paused_remaining': self.PausedRemaining,
+            'rejected_count': self._RejectedCount,
+            'requests_per_second': self._RequestsPerSecond,
+        }
+        return result
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SpotifyRateLimiter:'
+        msg = '%s RequestsPerSecond=%s' % (msg, str(self._RequestsPerSecond))
+        msg = '%s Burst=%s' % (msg, str(self._Burst))
+        msg = '%s MaxWait=%s' % (msg, str(self._MaxWait))
+        msg = '%s PausedRemaining=%.3f' % (msg, self.PausedRemaining)
+        msg = '%s PauseCount=%s' % (msg, str(self._PauseCount))
+        msg = '%s RejectedCount=%s' % (msg, str(self._RejectedCount))
+        return msg
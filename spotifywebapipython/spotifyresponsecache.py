@@ -0,0 +1,377 @@
+# external package imports.
+from collections import OrderedDict
+import re
+import threading
+import time
+from urllib.parse import urlencode
+
+# our package imports.
+from .sautils import export
+
+@export
+class SpotifyResponseCache:
+    """
+    A thread-safe response cache with time-to-live (TTL) expiration and bounded least
+    recently used (LRU) eviction, used to cache Spotify Web API responses.
+
+    Entries are keyed on request uri and query parameters (including market), and each
+    entry expires after the TTL value that was specified when it was stored.  When the
+    cache is full, the least recently used entry is evicted to make room for a new entry.
+
+    The cache also tracks hit, miss, expiration and eviction statistics.
+    """
+
+    DEFAULT_ENDPOINT_TTLS:dict = \
+    {
+        'albums': 3600,
+        'artists': 900,
+        'audiobooks': 3600,
+        'shows': 900,
+        'tracks': 3600,
+    }
+    """
+    Default time-to-live values (in seconds) for cacheable catalog endpoints, keyed by
+    endpoint name (e.g. "tracks" for the `/tracks/{id}` endpoint).
+
+    Artist and show objects contain values that change more often (e.g. followers,
+    popularity, total episodes, etc), so they are cached for a shorter period of time.
+    Episode and chapter objects are not cached, as they contain the user's playback
+    position (`resume_point`), which changes while the user is listening.
+    """
+
+    _EndpointPattern = re.compile(r'^/([a-z\-]+)/([^/?]+)$')
+    """ Regular expression used to parse single object catalog endpoint uri's (e.g. `/tracks/{id}`). """
+
+
+    def __init__(
+        self,
+        maxItems:int=500,
+        endpointTtls:dict=None,
+        ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxItems (int):
+                Maximum number of entries to store in the cache before the least recently
+                used entries are evicted.
+                Default is 500.
+            endpointTtls (dict):
+                Time-to-live values (in seconds) for cacheable endpoints, keyed by endpoint name
+                (e.g. `{'tracks': 3600, 'albums': 3600}`); a TTL value of zero disables caching
+                for the endpoint.
+                Default is null, which uses the `DEFAULT_ENDPOINT_TTLS` values.
+        """
+        # validations.
+        if (not isinstance(maxItems, int)) or (maxItems < 1):
+            maxItems = 500
+        if (not isinstance(endpointTtls, dict)):
+            endpointTtls = SpotifyResponseCache.DEFAULT_ENDPOINT_TTLS
+
+        # initialize storage.
+        self._Entries:OrderedDict = OrderedDict()
+        self._EndpointTtls:dict = dict(endpointTtls)
+        self._Evictions:int = 0
+        self._Expirations:int = 0
+        self._Hits:int = 0
+        self._Lock:threading.RLock = threading.RLock()
+        self._MaxItems:int = maxItems
+        self._Misses:int = 0
+
+
+    def __contains__(self, key:str) -> bool:
+        return self.Get(key, updateStatistics=False) is not None
+
+
+    def __len__(self) -> int:
+        return len(self._Entries)
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def EndpointTtls(self) -> dict:
+        """
+        Time-to-live values (in seconds) for cacheable endpoints, keyed by endpoint name
+        (e.g. "tracks").
+
+        The dictionary entries can be changed to adjust the TTL of an endpoint; a TTL value
+        of zero disables caching for the endpoint.
+        """
+        return self._EndpointTtls
+
+
+    @property
+    def Evictions(self) -> int:
+        """
+        Number of entries that were removed from the cache to make room for new entries.
+        """
+        return self._Evictions
+
+
+    @property
+    def Expirations(self) -> int:
+        """
+        Number of entries that were removed from the cache because their TTL expired.
+        """
+        return self._Expirations
+
+
+    @property
+    def HitRatio(self) -> float:
+        """
+        Ratio of cache hits to total cache lookups (0.0 to 1.0).
+        """
+        total:int = self._Hits + self._Misses
+        if total == 0:
+            return 0.0
+        return self._Hits / total
+
+
+    @property
+    def Hits(self) -> int:
+        """
+        Number of lookups that were satisfied by the cache.
+        """
+        return self._Hits
+
+
+    @property
+    def ItemsCount(self) -> int:
+        """
+        Number of entries currently stored in the cache (including expired entries that
+        have not been purged yet).
+        """
+        return len(self._Entries)
+
+
+    @property
+    def MaxItems(self) -> int:
+        """
+        Maximum number of entries to store in the cache before the least recently used
+        entries are evicted.
+        """
+        return self._MaxItems
+
+    @MaxItems.setter
+    def MaxItems(self, value:int):
+        """
+        Sets the MaxItems property value.
+        """
+        if isinstance(value, int) and (value > 0):
+            with self._Lock:
+                self._MaxItems = value
+                self._EvictOverflow()
+
+
+    @property
+    def Misses(self) -> int:
+        """
+        Number of lookups that were not satisfied by the cache.
+        """
+        return self._Misses
+
+
+    def _EvictOverflow(self) -> None:
+        """
+        Evicts least recently used entries until the cache is within its size limit.
+
+        The cache lock must be held by the caller.
+        """
+        while len(self._Entries) > self._MaxItems:
+            self._Entries.popitem(last=False)
+            self._Evictions += 1
+
+
+    def Clear(self) -> None:
+        """
+        Removes (clears) all entries from the cache.
+
+        Statistics are not reset; use the `ResetStatistics` method for that.
+        """
+        with self._Lock:
+            self._Entries.clear()
+
+
+    def Get(
+        self,
+        key:str,
+        updateStatistics:bool=True,
+        ) -> object:
+        """
+        Returns the cached value for the specified key.
+
+        Args:
+            key (str):
+                Cache key to retrieve.
+            updateStatistics (bool):
+                True to update hit / miss statistics; otherwise, False.
+                Default is True.
+
+        Returns:
+            The cached value if found and not expired; otherwise, null.
+        """
+        with self._Lock:
+
+            entry:tuple = self._Entries.get(key, None)
+            if entry is not None:
+
+                # has the entry expired?  if so, then remove it.
+                expiresAt, value = entry
+                if (expiresAt > 0) and (expiresAt <= time.monotonic()):
+                    del self._Entries[key]
+                    self._Expirations += 1
+                    entry = None
+
+            if entry is None:
+                if updateStatistics:
+                    self._Misses += 1
+                return None
+
+            # mark the entry as most recently used.
+            self._Entries.move_to_end(key)
+            if updateStatistics:
+                self._Hits += 1
+            return value
+
+
+    def GetEndpointTtl(
+        self,
+        uri:str,
+        ) -> float:
+        """
+        Returns the time-to-live value (in seconds) for the specified request uri.
+
+        Args:
+            uri (str):
+                Spotify Web API request uri (e.g. `/tracks/1kWUud3vY5ij5r62zxpTRy`).
+
+        Returns:
+            The TTL value for the endpoint, or zero if the uri is not cacheable.
+
+        Only single object catalog endpoints (e.g. `/tracks/{id}`, `/albums/{id}`) are
+        cacheable; collection endpoints (e.g. `/albums/{id}/tracks`) are not.
+        """
+        if (uri is None) or (not isinstance(uri, str)):
+            return 0
+        match = SpotifyResponseCache._EndpointPattern.match(uri)
+        if match is None:
+            return 0
+        return self._EndpointTtls.get(match.group(1), 0) or 0
+
+
+    @staticmethod
+    def GetKey(
+        uri:str,
+        urlParameters:dict=None,
+        ) -> str:
+        """
+        Returns a cache key for the specified request uri and query parameters.
+
+        Args:
+            uri (str):
+                Spotify Web API request uri (e.g. `/tracks/1kWUud3vY5ij5r62zxpTRy`).
+            urlParameters (dict):
+                Query parameters of the request (e.g. market).
+
+        Returns:
+            A cache key string (e.g. `/tracks/1kWUud3vY5ij5r62zxpTRy?market=US`).
+        """
+        if urlParameters is None or len(urlParameters) == 0:
+            return uri
+        return '%s?%s' % (uri, urlencode(sorted(urlParameters.items())))
+
+
+    def Remove(
+        self,
+        key:str,
+        ) -> None:
+        """
+        Removes the specified key from the cache, if it exists.
+
+        Args:
+            key (str):
+                Cache key to remove.
+        """
+        with self._Lock:
+            self._Entries.pop(key, None)
+
+
+    def ResetStatistics(self) -> None:
+        """
+        Resets all cache statistics to zero.
+        """
+        with self._Lock:
+            self._Evictions = 0
+            self._Expirations = 0
+            self._Hits = 0
+            self._Misses = 0
+
+
+    def Set(
+        self,
+        key:str,
+        value:object,
+        ttl:float=0,
+        ) -> None:
+        """
+        Stores a value in the cache.
+
+        Args:
+            key (str):
+                Cache key to store.
+            value (object):
+                Value to store; a null value is not stored.
+            ttl (float):
+                Number of seconds the value remains valid; zero to never expire (the entry
+                can still be evicted to make room for new entries).
+
+        Cached values are shared with all callers, and should not be modified.
+        """
+        if value is None:
+            return
+        expiresAt:float = 0
+        if (ttl is not None) and (ttl > 0):
+            expiresAt = time.monotonic() + ttl
+
+        with self._Lock:
+            self._Entries[key] = (expiresAt, value)
+            self._Entries.move_to_end(key)
+            self._EvictOverflow()
+
+
+    def ToDictionary(self) -> dict:
+        """
+        Returns a dictionary representation of the class.
+        """
+        result:dict = \
+        {
+            'evictions': self._Evictions,
+            'expirations': self._Expirations,
+            'hit_ratio': self.HitRatio,
+            'hits': self._Hits,
+            'items_count': self.ItemsCount,
+            'max_items': self._MaxItems,
+            'misses': self._Misses,
+        }
+        return result
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SpotifyResponseCache:'
+        msg = '%s ItemsCount=%s' % (msg, str(self.ItemsCount))
+        msg = '%s MaxItems=%s' % (msg, str(self._MaxItems))
+        msg = '%s Hits=%s' % (msg, str(self._Hits))
+        msg = '%s Misses=%s' % (msg, str(self._Misses))
+        msg = '%s Expirations=%s' % (msg, str(self._Expirations))
+        msg = '%s Evictions=%s' % (msg, str(self._Evictions))
+        return msg
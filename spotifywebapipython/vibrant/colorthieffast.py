@@ -34,7 +34,8 @@ class ColorThiefFast:
     """
     RGB = Tuple[int, int, int]
 
-    def __init__(self, image: Union[str, Image.Image, np.ndarray], return_percent: bool = False):
+    def __init__(self, image: Union[str, bytes, Image.Image, np.ndarray], return_percent: bool = False, max_size: int = None):
+        self.max_size = max_size
         self.image: np.ndarray = self.process_image(image)
         self.return_percent = return_percent
 
@@ -43,7 +44,14 @@ class ColorThiefFast:
         self, 
         image
         ) -> np.ndarray:
+        """
+        Decode the image into a (height, width, channels) array of RGB or RGBA pixels.
 
+        If `max_size` was specified, then the image is reduced so that neither side is
+        much larger than it: JPEG images are decoded at the smallest DCT scale (1/2, 1/4,
+        1/8) that is still at least `max_size` (PIL draft mode), other images are reduced
+        by an integer factor, and numpy arrays are reduced with a strided view (no copy).
+        """
         if isinstance(image, str):
             try:
                 if (image.startswith("http:")) or (image.startswith("https:")):
@@ -52,30 +60,37 @@ class ColorThiefFast:
                     image = Image.open(image)
                 else:
                     image = Image.open(image)
-                image = image.convert('RGBA')
-                image = np.array(image)
             except FileNotFoundError:
                 raise ValueError(f"File {image} not found.")
 
-        elif isinstance(image, Image.Image):
-            image = image.convert('RGBA')
-            image = np.array(image)
+        elif isinstance(image, bytes):
+            image = Image.open(io.BytesIO(image))
+
+        if isinstance(image, Image.Image):
+            # decode JPEG images at a reduced scale; this must be done before the image is loaded.
+            if (self.max_size) and (image.format == 'JPEG'):
+                image.draft('RGB', (self.max_size, self.max_size))
+            # only keep the alpha band if the image has transparency information.
+            if (image.mode in ('RGBA', 'LA', 'PA')) or ('transparency' in image.info):
+                image = image.convert('RGBA')
+            else:
+                image = image.convert('RGB')
+            image = np.asarray(self.reduce_image(image))
 
         elif not isinstance(image, np.ndarray):
-            raise TypeError("Input must be a http/https url, file path, a PIL Image, or a numpy array.")
+            raise TypeError("Input must be a http/https url, file path, bytes, a PIL Image, or a numpy array.")
+
+        elif self.max_size:
+            step = max(image.shape[0], image.shape[1]) // self.max_size
+            if step > 1:
+                image = image[::step, ::step]
 
         if image.ndim == 2:
-            alpha = np.full_like(image, 255, dtype=np.uint8)
-            image = np.stack((image, image, image, alpha), axis=-1)
+            image = np.stack((image, image, image), axis=-1)
         elif image.ndim == 3:
             if image.shape[2] == 1:
-                alpha = np.full_like(image[:, :, 0], 255, dtype=np.uint8)
                 image = np.repeat(image, 3, axis=2)
-                image = np.dstack((image, alpha))
-            elif image.shape[2] == 3:
-                alpha = np.full((image.shape[0], image.shape[1]), 255, dtype=np.uint8)
-                image = np.dstack((image, alpha))
-            elif image.shape[2] != 4:
+            elif image.shape[2] not in (3, 4):
                 raise ValueError("Unsupported number of channels in the numpy array.")
         else:
             raise ValueError("The input image is incorrect")
@@ -83,6 +98,23 @@ class ColorThiefFast:
         return image
 
 
+    def reduce_image(
+        self,
+        image: Image.Image
+        ) -> Image.Image:
+        """
+        Reduce the image by an integer factor (box sampling) so that neither side is more
+        than twice the `max_size` value.
+        """
+        if not self.max_size:
+            return image
+
+        factor = max(image.size) // (2 * self.max_size)
+        if factor > 1:
+            image = image.reduce(factor)
+        return image
+
+
     def get_color(
         self, 
         quality: int = 10
@@ -162,8 +194,16 @@ class ColorThiefFast:
         or (color_count < 0):
             color_count = 10
 
-        image_array = np.reshape(self.image, (-1, 4))
-        image_array = image_array[::quality, :]
+        # select every quality-th pixel; this is a view of the image, not a copy.
+        if (not isinstance(quality, int)) or (quality < 1):
+            quality = 1
+        channels = self.image.shape[2]
+        image_array = self.image.reshape(-1, channels)[::quality]
+
+        # custom processing functions expect (r, g, b, a) pixels.
+        if (channels == 3) and (custom_processing is not PixelsProcessor.get_valid_pixels):
+            alpha = np.full((image_array.shape[0], 1), 255, dtype=image_array.dtype)
+            image_array = np.hstack((image_array, alpha))
 
         valid_pixels = custom_processing(image_array)
 
@@ -288,10 +328,11 @@ class PixelsProcessor:
         image_array: np.ndarray
         ) -> np.ndarray:
         """
-        Default method to obtain valid pixels.
+        Default method to obtain valid pixels; removes transparent and white pixels.
         """
-        condition = ((image_array[..., 3] >= 125) &
-                     ~((image_array[..., 0] > 250) & (image_array[..., 1] > 250) & (image_array[..., 2] > 250)))
+        condition = ~((image_array[..., 0] > 250) & (image_array[..., 1] > 250) & (image_array[..., 2] > 250))
+        if image_array.shape[-1] > 3:
+            condition &= (image_array[..., 3] >= 125)
 
         valid_pixels = image_array[condition][:, :3]
         return valid_pixels
@@ -301,9 +342,14 @@ class MMCQ:
     """
     Basic Python port of the MMCQ (modified median cut quantization)
     algorithm from the Leptonica library (http://www.leptonica.com/).
+
+    The color space histogram is stored as a dense (32 x 32 x 32) NumPy array; box
+    counts and cut planes are calculated from cumulative sums of it, and box averages
+    from a slice of it.
     """
     SIGBITS = 5
     RSHIFT = 8 - SIGBITS
+    HISTO_SIZE = 1 << SIGBITS
     MAX_ITERATION = 1000
     FRACT_BY_POPULATIONS = 0.75
 
@@ -317,10 +363,10 @@ class MMCQ:
     @staticmethod
     def get_histo(
         pixels: np.ndarray
-        ) -> Dict[int, int]:
+        ) -> np.ndarray:
         """
         Calculate the number of pixels in each quantized region of the color space,
-        and save it in histo dict.
+        and save it in a dense (32 x 32 x 32) histo array indexed by [r, g, b].
         """
         pixels = pixels.astype(np.uint32)
 
@@ -329,12 +375,43 @@ class MMCQ:
         b = np.right_shift(pixels[:, 2], MMCQ.RSHIFT)
         color_index_array = MMCQ.get_color_index(r, g, b)
 
-        unique_indices, counts = np.unique(color_index_array, return_counts=True)
-        histo = {i: int(count) for i, count in zip(unique_indices, counts) if count != 0}
-        return histo
+        histo = np.bincount(color_index_array, minlength=MMCQ.HISTO_SIZE ** 3)
+        return histo.reshape((MMCQ.HISTO_SIZE, MMCQ.HISTO_SIZE, MMCQ.HISTO_SIZE)).astype(np.int64)
+
+    @staticmethod
+    def get_moments(
+        histo: np.ndarray
+        ) -> np.ndarray:
+        """
+        Calculate the cumulative sums (summed-area table) of the histo array.
+
+        Returns a (33 x 33 x 33) array, where entry [r, g, b] contains the sum of all histo
+        entries below [r, g, b], so the pixel count of any box is found from 8 entries.
+        """
+        moments = np.zeros((MMCQ.HISTO_SIZE + 1, MMCQ.HISTO_SIZE + 1, MMCQ.HISTO_SIZE + 1), dtype=np.int64)
+        moments[1:, 1:, 1:] = histo
+        for axis in (0, 1, 2):
+            np.cumsum(moments, axis=axis, out=moments)
+        return moments
 
     @staticmethod
-    def vbox_from_pixels(pixels: np.ndarray, histo: Dict[int, int]) -> "VBox":
+    def get_box_sum(moments: np.ndarray, r1, r2, g1, g2, b1, b2):
+        """
+        Sum the histo entries in the inclusive box [r1..r2, g1..g2, b1..b2].
+
+        One of the upper bounds may be an array, in which case a sum is returned for
+        each of its values (e.g. the partial sums along an axis).
+        """
+        r2 = r2 + 1
+        g2 = g2 + 1
+        b2 = b2 + 1
+        return (moments[r2, g2, b2]
+                - moments[r1, g2, b2] - moments[r2, g1, b2] - moments[r2, g2, b1]
+                + moments[r1, g1, b2] + moments[r1, g2, b1] + moments[r2, g1, b1]
+                - moments[r1, g1, b1])
+
+    @staticmethod
+    def vbox_from_pixels(pixels: np.ndarray, histo: np.ndarray, moments: np.ndarray) -> "VBox":
         rval = np.right_shift(pixels[:, 0], MMCQ.RSHIFT)
         gval = np.right_shift(pixels[:, 1], MMCQ.RSHIFT)
         bval = np.right_shift(pixels[:, 2], MMCQ.RSHIFT)
@@ -344,10 +421,10 @@ class MMCQ:
         gmax = gval.max()
         bmin = bval.min()
         bmax = bval.max()
-        return VBox(rmin, rmax, gmin, gmax, bmin, bmax, histo, pixels.shape[0])
+        return VBox(rmin, rmax, gmin, gmax, bmin, bmax, histo, moments, pixels.shape[0])
 
     @staticmethod
-    def median_cut_apply(histo, vbox: "VBox"):
+    def median_cut_apply(moments: np.ndarray, vbox: "VBox"):
         if not vbox.count:
             return (None, None)
 
@@ -360,62 +437,53 @@ class MMCQ:
         if vbox.count == 1:
             return (vbox.copy, None)
 
-        # Find the partial sum arrays along the selected axis.
-        partial_sum = {}
-        lookahead_sum = {}
-
         if maxw == rw:
             do_cut_color = 'r'
-            column_num = 0
         elif maxw == gw:
             do_cut_color = 'g'
-            column_num = 1
         else:
             do_cut_color = 'b'
-            column_num = 2
 
-        rgb_array, color_index_array = vbox.get_rgb_array_and_color_index_array()
-        color_num_list = [histo.get(index, 0) for index in color_index_array]
-        unique_values, indices = np.unique(rgb_array[:, column_num], return_inverse=True)
-        color_sum_array = np.bincount(indices, weights=color_num_list)
-
-        total_array = np.cumsum(color_sum_array, dtype=np.int32)
-        for i, t in zip(unique_values, total_array):
-            partial_sum[i] = t
-
-        total = total_array[-1]
-        for i, d in partial_sum.items():
-            lookahead_sum[i] = total - d
-
-        # determine the cut planes
+        # Find the partial sum array along the selected axis; partial_sum[n] is the
+        # number of pixels in the box from dim1 up to (and including) dim1 + n.
         dim1 = do_cut_color + '1'
         dim2 = do_cut_color + '2'
         dim1_val = getattr(vbox, dim1)
         dim2_val = getattr(vbox, dim2)
-        for i in range(dim1_val, dim2_val + 1):
-            if partial_sum[i] > (total / 2):
-                vbox1 = vbox.copy
-                vbox2 = vbox.copy
-                left = i - dim1_val
-                right = dim2_val - i
-                if left <= right:
-                    d2 = min([dim2_val - 1, int(i + right / 2)])
-                else:
-                    d2 = max([dim1_val, int(i - 1 - left / 2)])
-
-                # avoid 0-count boxes
-                while not partial_sum.get(d2, False):
-                    d2 += 1
-                count2 = lookahead_sum.get(d2)
-                while not count2 and partial_sum.get(d2 - 1, False):
-                    d2 -= 1
-                    count2 = lookahead_sum.get(d2)
-
-                # set dimensions
-                setattr(vbox1, dim2, d2)
-                setattr(vbox2, dim1, getattr(vbox1, dim2) + 1)
-                return (vbox1, vbox2)
-        return (None, None)
+        bounds = {'r2': vbox.r2, 'g2': vbox.g2, 'b2': vbox.b2}
+        bounds[dim2] = np.arange(dim1_val, dim2_val + 1)
+        partial_sum = MMCQ.get_box_sum(moments, vbox.r1, bounds['r2'], vbox.g1, bounds['g2'], vbox.b1, bounds['b2'])
+        total = int(partial_sum[-1])
+
+        def get_partial_sum(i: int) -> int:
+            return int(partial_sum[i - dim1_val]) if dim1_val <= i <= dim2_val else 0
+
+        def get_lookahead_sum(i: int) -> int:
+            return total - int(partial_sum[i - dim1_val]) if dim1_val <= i <= dim2_val else 0
+
+        # determine the cut planes
+        i = dim1_val + int(np.argmax(partial_sum > (total / 2)))
+        vbox1 = vbox.copy
+        vbox2 = vbox.copy
+        left = i - dim1_val
+        right = dim2_val - i
+        if left <= right:
+            d2 = min([dim2_val - 1, int(i + right / 2)])
+        else:
+            d2 = max([dim1_val, int(i - 1 - left / 2)])
+
+        # avoid 0-count boxes
+        while not get_partial_sum(d2):
+            d2 += 1
+        count2 = get_lookahead_sum(d2)
+        while not count2 and get_partial_sum(d2 - 1):
+            d2 -= 1
+            count2 = get_lookahead_sum(d2)
+
+        # set dimensions
+        setattr(vbox1, dim2, d2)
+        setattr(vbox2, dim1, getattr(vbox1, dim2) + 1)
+        return (vbox1, vbox2)
 
     @staticmethod
     def quantize(pixels: np.ndarray, max_color: int):
@@ -435,9 +503,10 @@ class MMCQ:
             raise Exception('Wrong number of max colors when quantize.')
 
         histo = MMCQ.get_histo(pixels)
+        moments = MMCQ.get_moments(histo)
 
         # get the beginning vbox from the colors
-        vbox = MMCQ.vbox_from_pixels(pixels, histo)
+        vbox = MMCQ.vbox_from_pixels(pixels, histo, moments)
         pq = PQueue(lambda x: x.count)
         pq.push(vbox)
 
@@ -453,7 +522,7 @@ class MMCQ:
                     continue
 
                 # do the cut
-                vbox1, vbox2 = MMCQ.median_cut_apply(histo, vbox)
+                vbox1, vbox2 = MMCQ.median_cut_apply(moments, vbox)
                 if not vbox1:
                     raise Exception("vbox1 not defined; shouldn't happen!")
                 lh.push(vbox1)
@@ -489,7 +558,7 @@ class VBox:
     """
     3D color space box.
     """
-    def __init__(self, r1, r2, g1, g2, b1, b2, histo: Dict[int, int], total_pixel_count: int):
+    def __init__(self, r1, r2, g1, g2, b1, b2, histo: np.ndarray, moments: np.ndarray, total_pixel_count: int):
         self.r1 = int(r1)
         self.r2 = int(r2)
         self.g1 = int(g1)
@@ -497,11 +566,9 @@ class VBox:
         self.b1 = int(b1)
         self.b2 = int(b2)
         self.histo = histo
+        self.moments = moments
         self.total_pixel_count = total_pixel_count
 
-        self._rgb_array: Optional[np.ndarray] = None
-        self._color_index: Optional[np.ndarray] = None
-
     @functools.cached_property
     def volume(self) -> int:
         """
@@ -514,7 +581,7 @@ class VBox:
 
     @property
     def copy(self) -> "VBox":
-        return VBox(self.r1, self.r2, self.g1, self.g2, self.b1, self.b2, self.histo, self.total_pixel_count)
+        return VBox(self.r1, self.r2, self.g1, self.g2, self.b1, self.b2, self.histo, self.moments, self.total_pixel_count)
 
     @functools.cached_property
     def avg(self) -> Tuple[int, int, int]:
@@ -522,17 +589,16 @@ class VBox:
         Calculate the color avg of VBox.
         """
         mult = 1 << (8 - MMCQ.SIGBITS)
-        rgb_array, color_index_array = self.get_rgb_array_and_color_index_array()
-        histo_num = np.array([self.histo.get(c, 0) for c in color_index_array], dtype=np.int32)
-        r_sum = np.sum(histo_num * (rgb_array[:, 0] + 0.5) * mult)
-        g_sum = np.sum(histo_num * (rgb_array[:, 1] + 0.5) * mult)
-        b_sum = np.sum(histo_num * (rgb_array[:, 2] + 0.5) * mult)
+        box = self.histo[self.r1: self.r2 + 1, self.g1: self.g2 + 1, self.b1: self.b2 + 1]
+        total = int(box.sum())
 
-        total = histo_num.sum()
         if total:
-            r_avg = r_sum / total
-            g_avg = g_sum / total
-            b_avg = b_sum / total
+            r_sum = int(box.sum(axis=(1, 2)) @ np.arange(self.r1, self.r2 + 1))
+            g_sum = int(box.sum(axis=(0, 2)) @ np.arange(self.g1, self.g2 + 1))
+            b_sum = int(box.sum(axis=(0, 1)) @ np.arange(self.b1, self.b2 + 1))
+            r_avg = (r_sum + 0.5 * total) * mult / total
+            g_avg = (g_sum + 0.5 * total) * mult / total
+            b_avg = (b_sum + 0.5 * total) * mult / total
         else:
             r_avg = mult * (self.r1 + self.r2 + 1) / 2
             g_avg = mult * (self.g1 + self.g2 + 1) / 2
@@ -548,10 +614,7 @@ class VBox:
         """
         The number of pixels in VBox.
         """
-        rgb_array, color_index_array = self.get_rgb_array_and_color_index_array()
-        npix_list = [self.histo.get(i, 0) for i in color_index_array]
-        npix = sum(npix_list)
-        return npix
+        return int(MMCQ.get_box_sum(self.moments, self.r1, self.r2, self.g1, self.g2, self.b1, self.b2))
 
     @functools.cached_property
     def percent(self) -> int:
@@ -560,16 +623,6 @@ class VBox:
         """
         return int(self.count / self.total_pixel_count * 100)
 
-    def get_rgb_array(self):
-        return np.mgrid[self.r1: self.r2 + 1, self.g1: self.g2 + 1, self.b1: self.b2 + 1].T.reshape(-1, 3)
-
-    def get_rgb_array_and_color_index_array(self):
-        if self._rgb_array is None:
-            rgb_array = np.mgrid[self.r1: self.r2 + 1, self.g1: self.g2 + 1, self.b1: self.b2 + 1].T.reshape(-1, 3)
-            self._rgb_array = rgb_array
-            self._color_index_array = MMCQ.get_color_index(rgb_array[:, 0], rgb_array[:, 1], rgb_array[:, 2])
-        return self._rgb_array, self._color_index_array
-
 
 class CMap:
     """
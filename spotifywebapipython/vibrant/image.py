@@ -60,7 +60,23 @@ class VibrantImage:
         return cls(Image.open(fp))
 
     def scale_down(self):
-        ...
+        """
+        Scale the image down by the `quality` factor (e.g. 5 = 1/5 of the width and height)
+        before it is quantized.
+
+        JPEG images that have not been loaded yet are decoded at a reduced scale (PIL draft
+        mode), which is much faster than decoding the full image.
+        """
+        quality = self.props.quality
+        if (not isinstance(quality, int)) or (quality <= 1):
+            return
+
+        width, height = self.image.size
+        size = (max(1, width // quality), max(1, height // quality))
+        if self.image.format == "JPEG":
+            self.image.draft("RGB", size)
+        if self.image.size != size:
+            self.image = self.image.resize(size, Image.Resampling.BOX)
 
     def _swatch_filter(self, swatch: List[int]) -> bool:
         r, g, b = swatch.rgb
@@ -71,27 +87,20 @@ class VibrantImage:
         raw_swatches: List,
         swatch_populations: List[Tuple[int, int]],
     ) -> List[Swatch]:
+        # each population entry is a (count, palette index) tuple.
         swatches = []
-        curr_idx = 0
-        for idx in range(0, len(raw_swatches), 3):
-            if idx + 2 <= (len(raw_swatches) - 1):
-                swatches.append(
-                    Swatch(
-                        rgb=[
-                            raw_swatches[idx],
-                            raw_swatches[idx + 1],
-                            raw_swatches[idx + 2],
-                        ],
-                        population=swatch_populations[curr_idx][0],
-                    )
+        for population, idx in swatch_populations or []:
+            swatches.append(
+                Swatch(
+                    rgb=list(raw_swatches[idx * 3:idx * 3 + 3]),
+                    population=population,
                 )
-                curr_idx += 1
+            )
         return swatches
 
     def quantize(self) -> List[Swatch]:
         self.image = self.image.quantize(self.props.color_count)
         raw_swatches = self.image.getpalette()
-        raw_swatches = list(filter(lambda x: x != 0, raw_swatches))
         swatch_populations = self.image.getcolors(self.props.color_count)
         swatches = self._parse_swatches(
             raw_swatches=raw_swatches,
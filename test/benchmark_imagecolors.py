@@ -0,0 +1,133 @@
+"""
+Benchmark for the image color extraction pipeline.
+
+Builds synthetic cover art images in the renditions that Spotify returns (640, 300 and 64
+pixels wide), and compares the time and result of extracting colors from the full size
+image (full decode, as before) with the reduced pipeline used by `GetImagePaletteColors`
+and `GetImageVibrantColors` (smallest adequate rendition, JPEG draft mode decoding).
+
+The color difference is the average RGB distance between each reduced palette color and
+the closest full size palette color (0 = identical, 441 = black vs white).
+
+Usage:
+    python -m test.benchmark_imagecolors [imageCount]
+"""
+import io
+import math
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+from spotifywebapipython.models import ImageObject
+from spotifywebapipython.spotifyclient import IMAGE_COLORS_DECODE_SIZE
+from spotifywebapipython.vibrant import ColorThiefFast, Vibrant, VibrantImage
+
+
+def BuildCoverImages(seed:int) -> dict:
+    """
+    Returns a dictionary of JPEG image bytes keyed by width (640, 300, 64) for a synthetic
+    cover art image (gradient background, shapes, and grain).
+    """
+    rng = np.random.default_rng(seed)
+    size:int = 640
+
+    # gradient background between two random colors.
+    c1, c2 = rng.integers(0, 256, 3), rng.integers(0, 256, 3)
+    t = np.linspace(0, 1, size)[:, None, None]
+    pixels = (c1 * (1 - t) + c2 * t) * np.ones((size, size, 3))
+
+    # shapes with random colors.
+    image = Image.fromarray(pixels.astype(np.uint8))
+    draw = ImageDraw.Draw(image)
+    for idx in range(8):
+        x, y = rng.integers(0, size, 2)
+        r = int(rng.integers(30, 200))
+        color = tuple(int(v) for v in rng.integers(0, 256, 3))
+        if idx % 2:
+            draw.ellipse((x - r, y - r, x + r, y + r), fill=color)
+        else:
+            draw.rectangle((x - r, y - r // 2, x + r, y + r // 2), fill=color)
+    image = image.filter(ImageFilter.GaussianBlur(2))
+
+    # film grain.
+    pixels = np.asarray(image).astype(np.int16) + rng.normal(0, 8, (size, size, 3)).astype(np.int16)
+    image = Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+    result:dict = {}
+    for width in (640, 300, 64):
+        buffer = io.BytesIO()
+        image.resize((width, width), Image.Resampling.LANCZOS).save(buffer, 'JPEG', quality=85)
+        result[width] = buffer.getvalue()
+    return result
+
+
+def GetPaletteDistance(palette1:list, palette2:list) -> float:
+    """
+    Returns the average distance between each color in palette2 and the closest color in palette1.
+    """
+    colors1 = np.array([c[:3] for c in palette1 if any(c[:3])], dtype=float)
+    colors2 = np.array([c[:3] for c in palette2 if any(c[:3])], dtype=float)
+    if (len(colors1) == 0) or (len(colors2) == 0):
+        return 0.0
+    distances = np.sqrt(((colors2[:, None, :] - colors1[None, :, :]) ** 2).sum(axis=2))
+    return float(distances.min(axis=1).mean())
+
+
+def Measure(func, repeat:int=3) -> tuple:
+    """
+    Returns a (result, best seconds) tuple for the specified function.
+    """
+    best:float = math.inf
+    result = None
+    for _ in range(repeat):
+        start:float = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+if __name__ == '__main__':
+
+    imageCount:int = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    totals:dict = {'palette_full': 0.0, 'palette_reduced': 0.0, 'vibrant_full': 0.0, 'vibrant_reduced': 0.0}
+    paletteDistances:list = []
+    vibrantDistances:list = []
+
+    for seed in range(imageCount):
+
+        renditions:dict = BuildCoverImages(seed)
+        images:list = [ImageObject({'url': width, 'width': width, 'height': width}) for width in renditions]
+
+        # GetImagePaletteColors: full size image vs smallest adequate rendition, reduced decode.
+        full, seconds = Measure(lambda: ColorThiefFast(renditions[640]).get_palette(10, 1))
+        totals['palette_full'] += seconds
+        width:int = ImageObject.GetImageSmallestResolution(images, IMAGE_COLORS_DECODE_SIZE)
+        reduced, seconds = Measure(lambda: ColorThiefFast(renditions[width], max_size=IMAGE_COLORS_DECODE_SIZE).get_palette(10, 1))
+        totals['palette_reduced'] += seconds
+        paletteDistances.append(GetPaletteDistance(full, reduced))
+
+        # GetImageVibrantColors: full size quantize (no scale down) vs smallest adequate rendition, scaled down.
+        def VibrantFull() -> list:
+            image = VibrantImage(renditions[640], Vibrant(64, 5).props)
+            return [swatch.rgb for swatch in image.quantize()]
+        def VibrantReduced() -> list:
+            width:int = ImageObject.GetImageSmallestResolution(images, IMAGE_COLORS_DECODE_SIZE * 5)
+            image = VibrantImage(renditions[width], Vibrant(64, 5).props)
+            image.scale_down()
+            return [swatch.rgb for swatch in image.quantize()]
+        full, seconds = Measure(VibrantFull)
+        totals['vibrant_full'] += seconds
+        reduced, seconds = Measure(VibrantReduced)
+        totals['vibrant_reduced'] += seconds
+        vibrantDistances.append(GetPaletteDistance(full, reduced))
+
+    print('Color extraction for %d synthetic 640/300/64 pixel cover images (best of 3, ms per image):' % imageCount)
+    print('  %-24s %10s %10s %8s %12s' % ('Method', 'full', 'reduced', 'speedup', 'color diff'))
+    print('  %-24s %10.2f %10.2f %7.1fx %12.1f' % ('GetImagePaletteColors',
+        totals['palette_full'] * 1000 / imageCount, totals['palette_reduced'] * 1000 / imageCount,
+        totals['palette_full'] / totals['palette_reduced'], np.mean(paletteDistances)))
+    print('  %-24s %10.2f %10.2f %7.1fx %12.1f' % ('GetImageVibrantColors',
+        totals['vibrant_full'] * 1000 / imageCount, totals['vibrant_reduced'] * 1000 / imageCount,
+        totals['vibrant_full'] / totals['vibrant_reduced'], np.mean(vibrantDistances)))
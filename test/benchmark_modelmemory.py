@@ -0,0 +1,123 @@
+"""
+Memory benchmark for the model classes.
+
+Builds a synthetic saved-tracks payload (similar to a large `GetTrackFavorites` result), and
+reports the per-object size of the `__slots__` based model classes compared to equivalent
+`__dict__` based instances, as well as the total memory allocated for the page object with
+lazy loading disabled and enabled.
+
+Usage:
+    python -m test.benchmark_modelmemory [itemCount]
+"""
+import sys
+import time
+import tracemalloc
+
+from spotifywebapipython.models import *
+
+
+def BuildSavedTracksPayload(itemCount:int) -> dict:
+    """
+    Returns a saved-tracks page dictionary with the specified number of items.
+    """
+    items:list = []
+    for idx in range(itemCount):
+        items.append({
+            'added_at': '2026-01-01T00:00:00Z',
+            'track': {
+                'album': {
+                    'album_type': 'album',
+                    'artists': [{'external_urls': {'spotify': 'https://open.spotify.com/artist/a%d' % (idx % 500)}, 'href': 'https://api.spotify.com/v1/artists/a%d' % (idx % 500), 'id': 'a%d' % (idx % 500), 'name': 'Artist %d' % (idx % 500), 'type': 'artist', 'uri': 'spotify:artist:a%d' % (idx % 500)}],
+                    'external_urls': {'spotify': 'https://open.spotify.com/album/b%d' % (idx % 2000)},
+                    'href': 'https://api.spotify.com/v1/albums/b%d' % (idx % 2000),
+                    'id': 'b%d' % (idx % 2000),
+                    'images': [
+                        {'height': 640, 'url': 'https://i.scdn.co/image/%d-640' % idx, 'width': 640},
+                        {'height': 300, 'url': 'https://i.scdn.co/image/%d-300' % idx, 'width': 300},
+                        {'height': 64, 'url': 'https://i.scdn.co/image/%d-64' % idx, 'width': 64},
+                    ],
+                    'name': 'Album %d' % (idx % 2000),
+                    'release_date': '2020-01-01',
+                    'release_date_precision': 'day',
+                    'total_tracks': 12,
+                    'type': 'album',
+                    'uri': 'spotify:album:b%d' % (idx % 2000),
+                },
+                'artists': [{'external_urls': {'spotify': 'https://open.spotify.com/artist/a%d' % (idx % 500)}, 'href': 'https://api.spotify.com/v1/artists/a%d' % (idx % 500), 'id': 'a%d' % (idx % 500), 'name': 'Artist %d' % (idx % 500), 'type': 'artist', 'uri': 'spotify:artist:a%d' % (idx % 500)}],
+                'disc_number': 1,
+                'duration_ms': 215000,
+                'explicit': False,
+                'external_ids': {'isrc': 'US0000000%04d' % (idx % 10000)},
+                'external_urls': {'spotify': 'https://open.spotify.com/track/t%d' % idx},
+                'href': 'https://api.spotify.com/v1/tracks/t%d' % idx,
+                'id': 't%d' % idx,
+                'is_local': False,
+                'name': 'Track %d' % idx,
+                'popularity': 50,
+                'track_number': 1 + (idx % 12),
+                'type': 'track',
+                'uri': 'spotify:track:t%d' % idx,
+            },
+        })
+    return {'href': 'https://api.spotify.com/v1/me/tracks', 'items': items, 'limit': 50, 'offset': 0, 'total': itemCount}
+
+
+def GetDictInstanceSize(obj:object) -> int:
+    """
+    Returns the size of an equivalent `__dict__` based instance of the specified object.
+    """
+    # create a plain class (which uses a `__dict__`), and copy the slot values to an instance of it.
+    unslottedType = type('Unslotted' + type(obj).__name__, (object,), {})
+    unslotted = unslottedType()
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            if name.startswith('__'):
+                name = '_%s%s' % (cls.__name__, name)
+            setattr(unslotted, name, getattr(obj, name, None))
+    return sys.getsizeof(unslotted) + sys.getsizeof(unslotted.__dict__)
+
+
+def MeasurePage(payload:dict, lazy:bool) -> tuple:
+    """
+    Returns a (page, seconds, bytes allocated) tuple for building a `TrackPageSaved` object.
+    """
+    with LazyLoading.Scope(lazy):
+        tracemalloc.start()
+        start:float = time.perf_counter()
+        page:TrackPageSaved = TrackPageSaved(root=payload)
+        elapsed:float = time.perf_counter() - start
+        allocated:int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    return page, elapsed, allocated
+
+
+if __name__ == '__main__':
+
+    itemCount:int = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    payload:dict = BuildSavedTracksPayload(itemCount)
+
+    # per-object sizes.
+    page, elapsed, allocated = MeasurePage(payload, False)
+    trackSaved:TrackSaved = page.Items[0]
+    samples:list = [
+        trackSaved,
+        trackSaved.Track,
+        trackSaved.Track.Album,
+        trackSaved.Track.Artists[0],
+        trackSaved.Track.Album.Images[0],
+        trackSaved.Track.ExternalUrls,
+        trackSaved.Track.ExternalIds,
+    ]
+    print('Per-object size (bytes):')
+    print('  %-20s %8s %8s %8s' % ('Class', 'slots', 'dict', 'saved'))
+    for obj in samples:
+        slotsSize:int = sys.getsizeof(obj)
+        dictSize:int = GetDictInstanceSize(obj)
+        print('  %-20s %8d %8d %8d' % (type(obj).__name__, slotsSize, dictSize, dictSize - slotsSize))
+
+    # total allocations for the page object.
+    print('\nTrackPageSaved with %d items:' % itemCount)
+    print('  eager: %8.3f seconds %10.1f KB' % (elapsed, allocated / 1024))
+    del page
+    page, elapsed, allocated = MeasurePage(payload, True)
+    print('  lazy:  %8.3f seconds %10.1f KB' % (elapsed, allocated / 1024))